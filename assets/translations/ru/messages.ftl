@@ -162,6 +162,9 @@ msg-statistics-users =
     • <b>Новые за неделю</b>: { $new_users_weekly }
     • <b>Новые за месяц</b>: { $new_users_monthly }
 
+    • <b>Активные за час</b>: { $active_users_hourly }
+    • <b>Активные за день</b>: { $active_users_daily }
+
     • <b>С подпиской</b>: { $users_with_subscription }
     • <b>Без подписки</b>: { $users_without_subscription }
     • <b>С пробным периодом</b>: { $users_with_trial }
@@ -442,10 +442,14 @@ ntf-trial-unavailable = <i>❌ Пробная подписка временно
 ntf-importer-not-file = <i>⚠️ Отправьте базу данных в виде файла.</i>
 ntf-importer-db-invalid = <i>❌ Этот файл не может быть импортирован.</i>
 ntf-importer-db-failed = <i>❌ Ошибка при импорте базы данных.</i>
+ntf-importer-db-processing = <i>🔍 Обработка базы данных, ожидайте...</i>
+ntf-importer-db-progress = <i>🔍 Обработка базы данных: { $processed } из { $total } инбаундов...</i>
 ntf-importer-exported-users-empty =  <i>❌ Список пользователей в базе данных пуст.</i>
 ntf-importer-internal-squads-empty = <i>❌ Выберите хотя бы один внутренний сквад.</i>
 ntf-importer-import-started = <i>✅ Импорт пользователей запущен, ожидайте...</i>
+ntf-importer-import-progress = <i>📥 Импорт пользователей: { $processed } из { $total }...</i>
 ntf-importer-sync-started = <i>✅ Синхронизация пользователей запущена, ожидайте...</i>
+ntf-importer-sync-progress = <i>🌀 Синхронизация пользователей: { $processed } из { $total }...</i>
 ntf-importer-users-not-found = <i>❌ Не удалось найти пользователей для синхронизации.</i>
 ntf-importer-not-support = <i>⚠️ Импорт всех данных из 3xui-shop временно недоступен. Вы можете воспользоваться импортом из панели 3X-UI!</i>
 ntf-importer-sync-already-running = <i>⚠️ Синхронизация пользователей уже была запущена, ожидайте...</i>
\ No newline at end of file
@@ -1,8 +1,10 @@
 from .payments import router as payments_router
+from .remnawave import consume_remnawave_events
 from .remnawave import router as remnawave_router
 from .telegram import TelegramWebhookEndpoint
 
 __all__ = [
+    "consume_remnawave_events",
     "payments_router",
     "remnawave_router",
     "TelegramWebhookEndpoint",
@@ -6,9 +6,11 @@ from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Request, Response, status
 from loguru import logger
 
-from src.core.constants import API_V1, PAYMENTS_WEBHOOK_PATH
+from src.core.constants import API_V1, PAYMENT_WEBHOOK_DEDUPE_TTL, PAYMENTS_WEBHOOK_PATH
 from src.core.enums import PaymentGatewayType
+from src.core.storage.keys import PaymentWebhookKey
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis import RedisRepository
 from src.infrastructure.taskiq.tasks.payments import handle_payment_transaction_task
 from src.services.notification import NotificationService
 from src.services.payment_gateway import PaymentGatewayService
@@ -23,6 +25,7 @@ async def payments_webhook(
     request: Request,
     payment_gateway_service: FromDishka[PaymentGatewayService],
     notification_service: FromDishka[NotificationService],
+    redis_repository: FromDishka[RedisRepository],
 ) -> Response:
     try:
         gateway_enum = PaymentGatewayType(gateway_type.upper())
@@ -38,7 +41,23 @@ async def payments_webhook(
             return Response(status_code=status.HTTP_404_NOT_FOUND)
 
         payment_id, payment_status = await gateway.handle_webhook(request)
-        await handle_payment_transaction_task.kiq(payment_id, payment_status)
+
+        # Gateways redeliver the same notification until they get an answer
+        dedupe_key = PaymentWebhookKey(
+            gateway_type=gateway_enum,
+            payment_id=str(payment_id),
+            status=payment_status,
+        )
+        if not await redis_repository.set_if_absent(dedupe_key, 1, ex=PAYMENT_WEBHOOK_DEDUPE_TTL):
+            logger.debug(f"Skipping duplicate '{payment_status}' webhook for '{payment_id}'")
+            return Response(status_code=status.HTTP_200_OK)
+
+        try:
+            await handle_payment_transaction_task.kiq(payment_id, payment_status)
+        except Exception:
+            await redis_repository.delete(dedupe_key)
+            raise
+
         return Response(status_code=status.HTTP_200_OK)
 
     except Exception as exception:
@@ -1,8 +1,10 @@
+import asyncio
+import json
 import traceback
-from typing import cast
+from typing import Any, cast
 
 from aiogram.utils.formatting import Text
-from dishka import FromDishka
+from dishka import AsyncContainer, FromDishka, Scope
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, HTTPException, Request, Response, status
 from loguru import logger
@@ -10,8 +12,16 @@ from remnapy.controllers import WebhookUtility
 from remnapy.models.webhook import NodeDto, UserDto, UserHwidDeviceEventDto
 
 from src.core.config import AppConfig
-from src.core.constants import API_V1, REMNAWAVE_WEBHOOK_PATH
+from src.core.constants import (
+    API_V1,
+    REMNAWAVE_EVENTS_BATCH_SIZE,
+    REMNAWAVE_EVENTS_COALESCE_WINDOW,
+    REMNAWAVE_WEBHOOK_PATH,
+)
+from src.core.enums import RemnaUserEvent
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis import RemnawaveEventStream
+from src.infrastructure.redis.event_stream import StreamEntry
 from src.services.notification import NotificationService
 from src.services.remnawave import RemnawaveService
 
@@ -23,16 +33,16 @@ router = APIRouter(prefix=API_V1)
 async def remnawave_webhook(
     request: Request,
     config: FromDishka[AppConfig],
-    remnawave_service: FromDishka[RemnawaveService],
-    notification_service: FromDishka[NotificationService],
+    event_stream: FromDishka[RemnawaveEventStream],
 ) -> Response:
     try:
         raw_body = await request.body()
-        data = await request.json()
-        logger.debug(f"Received Remnawave webhook payload: '{data}'")
+        body = raw_body.decode("utf-8")
+        headers = dict(request.headers)
+        logger.debug(f"Received Remnawave webhook payload: '{body}'")
         payload = WebhookUtility.parse_webhook(
-            body=raw_body.decode("utf-8"),
-            headers=dict(request.headers),
+            body=body,
+            headers=headers,
             webhook_secret=config.remnawave.webhook_secret.get_secret_value(),
             validate=True,
         )
@@ -44,32 +54,112 @@ async def remnawave_webhook(
         logger.warning("Payload is empty after validation")
         raise HTTPException(status_code=401, detail="Unauthorized")
 
+    user_uuid = ""
+    if WebhookUtility.is_user_event(payload.event):
+        user = cast(UserDto, WebhookUtility.get_typed_data(payload))
+        user_uuid = str(user.uuid)
+
+    try:
+        await event_stream.publish(payload.event, body, headers, user_uuid)
+    except Exception as exception:
+        logger.exception(f"Failed to queue Remnawave event '{payload.event}': {exception}")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    return Response(status_code=status.HTTP_200_OK)
+
+
+async def consume_remnawave_events(container: AsyncContainer) -> None:
+    config: AppConfig = await container.get(AppConfig)
+    event_stream: RemnawaveEventStream = await container.get(RemnawaveEventStream)
+    logger.info("Remnawave event consumer started")
+
+    while True:
+        try:
+            entries = await event_stream.read()
+
+            if entries and len(entries) < REMNAWAVE_EVENTS_BATCH_SIZE:
+                # Bulk edits in the panel arrive as bursts, give the rest of it a moment to land
+                await asyncio.sleep(REMNAWAVE_EVENTS_COALESCE_WINDOW)
+                entries += await event_stream.read(block=None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            logger.warning(f"Failed to read Remnawave events: {exception}")
+            await asyncio.sleep(REMNAWAVE_EVENTS_COALESCE_WINDOW)
+            continue
+
+        if not entries:
+            continue
+
+        await _handle_events(config, container, event_stream, entries)
+
+
+async def _handle_events(
+    config: AppConfig,
+    container: AsyncContainer,
+    event_stream: RemnawaveEventStream,
+    entries: list[StreamEntry],
+) -> None:
+    pending = _coalesce_events(entries)
+    if len(pending) < len(entries):
+        logger.debug(f"Coalesced '{len(entries)}' Remnawave events into '{len(pending)}'")
+
+    for entry_id, fields in pending:
+        try:
+            async with container(scope=Scope.REQUEST) as request_container:
+                await _process_event(config, request_container, fields)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            logger.error(f"Failed to handle Remnawave event '{entry_id}': {exception}")
+
     try:
-        if WebhookUtility.is_user_event(payload.event):
-            user = cast(UserDto, WebhookUtility.get_typed_data(payload))
-            await remnawave_service.handle_user_event(payload.event, user)
+        await event_stream.ack([entry_id for entry_id, _ in entries])
+    except asyncio.CancelledError:
+        raise
+    except Exception as exception:
+        # Unacknowledged entries stay pending and are claimed again once idle
+        logger.warning(f"Failed to acknowledge '{len(entries)}' Remnawave events: {exception}")
+
+
+def _coalesce_events(entries: list[StreamEntry]) -> list[StreamEntry]:
+    # Every MODIFIED event carries the full user state, so only the latest one per user matters
+    latest: dict[str, str] = {}
+    for entry_id, fields in entries:
+        if fields["event"] == RemnaUserEvent.MODIFIED and fields["user_uuid"]:
+            latest[fields["user_uuid"]] = entry_id
 
-        elif WebhookUtility.is_user_hwid_devices_event(payload.event):
-            event = cast(UserHwidDeviceEventDto, WebhookUtility.get_typed_data(payload))
-            await remnawave_service.handle_device_event(
-                payload.event,
-                event.user,
-                event.hwid_user_device,
-            )
+    return [
+        (entry_id, fields)
+        for entry_id, fields in entries
+        if fields["event"] != RemnaUserEvent.MODIFIED
+        or latest.get(fields["user_uuid"], entry_id) == entry_id
+    ]
 
-        elif WebhookUtility.is_node_event(payload.event):
-            node = cast(NodeDto, WebhookUtility.get_typed_data(payload))
-            await remnawave_service.handle_node_event(payload.event, node)
 
-        else:
-            logger.warning(f"Unhandled Remnawave event type '{payload.event}'")
+async def _process_event(
+    config: AppConfig,
+    container: AsyncContainer,
+    fields: dict[str, str],
+) -> None:
+    try:
+        payload = WebhookUtility.parse_webhook(
+            body=fields["body"],
+            headers=json.loads(fields["headers"]),
+            webhook_secret=config.remnawave.webhook_secret.get_secret_value(),
+            validate=False,
+        )
+        await _dispatch_event(payload, await container.get(RemnawaveService))
 
+    except asyncio.CancelledError:
+        raise
     except Exception as exception:
         logger.exception(f"Failed to process Remnawave webhook due to '{exception}'")
         traceback_str = traceback.format_exc()
         error_type_name = type(exception).__name__
         error_message = Text(str(exception)[:512])
 
+        notification_service: NotificationService = await container.get(NotificationService)
         await notification_service.error_notify(
             traceback_str=traceback_str,
             payload=MessagePayload.not_deleted(
@@ -81,4 +171,23 @@ async def remnawave_webhook(
             ),
         )
 
-    return Response(status_code=status.HTTP_200_OK)
+
+async def _dispatch_event(payload: Any, remnawave_service: RemnawaveService) -> None:
+    if WebhookUtility.is_user_event(payload.event):
+        user = cast(UserDto, WebhookUtility.get_typed_data(payload))
+        await remnawave_service.handle_user_event(payload.event, user)
+
+    elif WebhookUtility.is_user_hwid_devices_event(payload.event):
+        event = cast(UserHwidDeviceEventDto, WebhookUtility.get_typed_data(payload))
+        await remnawave_service.handle_device_event(
+            payload.event,
+            event.user,
+            event.hwid_user_device,
+        )
+
+    elif WebhookUtility.is_node_event(payload.event):
+        node = cast(NodeDto, WebhookUtility.get_typed_data(payload))
+        await remnawave_service.handle_node_event(payload.event, node)
+
+    else:
+        logger.warning(f"Unhandled Remnawave event type '{payload.event}'")
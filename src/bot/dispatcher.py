@@ -1,3 +1,5 @@
+from typing import cast
+
 from aiogram import Dispatcher
 from aiogram.fsm.storage.base import DefaultKeyBuilder
 from aiogram.fsm.storage.redis import RedisStorage
@@ -8,6 +10,7 @@ from src.bot.middlewares import setup_middlewares
 from src.bot.routers import setup_error_handlers, setup_routers
 from src.core.config import AppConfig
 from src.core.utils import json_utils
+from src.infrastructure.redis.media_storage import RedisMediaIdStorage
 
 
 def create_dispatcher(config: AppConfig) -> Dispatcher:
@@ -28,7 +31,14 @@ def create_dispatcher(config: AppConfig) -> Dispatcher:
 
 
 def create_bg_manager_factory(dispatcher: Dispatcher) -> BgManagerFactory:
-    return setup_dialogs(router=dispatcher)
+    config: AppConfig = dispatcher["config"]
+    storage = cast(RedisStorage, dispatcher.storage)
+    bot_id = int(config.bot.token.get_secret_value().split(":", maxsplit=1)[0])
+
+    return setup_dialogs(
+        router=dispatcher,
+        media_id_storage=RedisMediaIdStorage(client=storage.redis, bot_id=bot_id),
+    )
 
 
 def setup_dispatcher(dispatcher: Dispatcher) -> None:
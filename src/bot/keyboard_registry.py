@@ -0,0 +1,83 @@
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from fluentogram import TranslatorHub, TranslatorRunner
+from loguru import logger
+
+from src.bot.keyboards import STATIC_KEYBOARDS
+from src.bot.states import Notification
+from src.core.enums import KeyboardName, Locale
+from src.core.utils.formatters import i18n_postprocess_text
+
+CLOSE_BUTTON_KEY = "btn-notification-close"
+
+
+class KeyboardRegistry:
+    default_locale: Locale
+
+    def __init__(
+        self,
+        translator_hub: TranslatorHub,
+        locales: Iterable[Locale],
+        default_locale: Locale,
+    ) -> None:
+        self.default_locale = default_locale
+        keyboards: dict[tuple[KeyboardName, Locale, bool], InlineKeyboardMarkup] = {}
+        close_buttons: dict[Locale, InlineKeyboardButton] = {}
+
+        for locale in {*locales, default_locale}:
+            i18n = translator_hub.get_translator_by_locale(locale=locale)
+            close_button = InlineKeyboardButton(
+                text=_translate(i18n, CLOSE_BUTTON_KEY),
+                callback_data=Notification.CLOSE.state,
+            )
+            close_buttons[locale] = close_button
+            close_markup = InlineKeyboardMarkup(inline_keyboard=[[close_button]])
+            keyboards[(KeyboardName.CLOSE, locale, False)] = close_markup
+            keyboards[(KeyboardName.CLOSE, locale, True)] = close_markup
+
+            for name, factory in STATIC_KEYBOARDS.items():
+                markup = _translate_markup(i18n, factory())
+                keyboards[(name, locale, False)] = markup
+                keyboards[(name, locale, True)] = with_close_button(markup, close_button)
+
+        self._keyboards: Mapping[tuple[KeyboardName, Locale, bool], InlineKeyboardMarkup] = (
+            MappingProxyType(keyboards)
+        )
+        self._close_buttons: Mapping[Locale, InlineKeyboardButton] = MappingProxyType(close_buttons)
+        logger.debug(f"Compiled '{len(keyboards)}' keyboards for locales {list(close_buttons)}")
+
+    def get(
+        self,
+        name: KeyboardName,
+        locale: Locale,
+        close_button: bool = False,
+    ) -> InlineKeyboardMarkup:
+        markup = self._keyboards.get((name, locale, close_button))
+        if markup is None:
+            markup = self._keyboards[(name, self.default_locale, close_button)]
+        return markup
+
+    def close_button(self, locale: Locale) -> InlineKeyboardButton:
+        return self._close_buttons.get(locale) or self._close_buttons[self.default_locale]
+
+
+def with_close_button(
+    markup: InlineKeyboardMarkup,
+    close_button: InlineKeyboardButton,
+) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(inline_keyboard=[*markup.inline_keyboard, [close_button]])
+
+
+def _translate(i18n: TranslatorRunner, key: str) -> str:
+    return i18n_postprocess_text(i18n.get(key))
+
+
+def _translate_markup(i18n: TranslatorRunner, markup: InlineKeyboardMarkup) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [button.model_copy(update={"text": _translate(i18n, button.text)}) for button in row]
+            for row in markup.inline_keyboard
+        ]
+    )
@@ -1,4 +1,4 @@
-from typing import Final
+from typing import Callable, Final
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -10,7 +10,7 @@ from magic_filter import F
 from src.bot.states import DashboardUser, MainMenu, Subscription
 from src.bot.widgets.i18n_format import I18nFormat
 from src.core.constants import GOTO_PREFIX, PURCHASE_PREFIX, REPOSITORY, T_ME
-from src.core.enums import PurchaseType
+from src.core.enums import KeyboardName, PurchaseType
 from src.core.utils.formatters import format_username_to_url
 
 CALLBACK_CHANNEL_CONFIRM: Final[str] = "channel_confirm"
@@ -195,3 +195,12 @@ def get_user_keyboard(telegram_id: int) -> InlineKeyboardMarkup:
     )
 
     return builder.as_markup()
+
+
+STATIC_KEYBOARDS: Final[dict[KeyboardName, Callable[[], InlineKeyboardMarkup]]] = {
+    KeyboardName.RENEW: get_renew_keyboard,
+    KeyboardName.BUY: get_buy_keyboard,
+    KeyboardName.RULES: get_rules_keyboard,
+    KeyboardName.REMNASHOP: get_remnashop_keyboard,
+    KeyboardName.REMNASHOP_UPDATE: get_remnashop_update_keyboard,
+}
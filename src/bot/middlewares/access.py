@@ -2,14 +2,13 @@ from typing import Any, Awaitable, Callable, Optional
 
 from aiogram.types import TelegramObject
 from aiogram.types import User as AiogramUser
-from dishka import AsyncContainer
 from loguru import logger
 
-from src.core.constants import CONTAINER_KEY
 from src.core.enums import MiddlewareEventType
 from src.services.access import AccessService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 
 class AccessMiddleware(EventTypedMiddleware):
@@ -27,10 +26,15 @@ class AccessMiddleware(EventTypedMiddleware):
             logger.warning("Terminating middleware: event from bot or missing user")
             return
 
-        container: AsyncContainer = data[CONTAINER_KEY]
-        access_service: AccessService = await container.get(AccessService)
+        context = UpdateContext.from_data(data)
+        access_service = await context.get(AccessService)
 
-        if not await access_service.is_access_allowed(aiogram_user=aiogram_user, event=event):
+        if not await access_service.is_access_allowed(
+            aiogram_user=aiogram_user,
+            event=event,
+            user=await context.get_user(aiogram_user.id),
+            settings=await context.get_settings(),
+        ):
             return
 
         return await handler(event, data)
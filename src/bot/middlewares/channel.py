@@ -5,18 +5,17 @@ from aiogram import Bot
 from aiogram.enums import ChatMemberStatus
 from aiogram.types import CallbackQuery, Message, TelegramObject
 from aiogram.utils.formatting import Text
-from dishka import AsyncContainer
 from loguru import logger
 
 from src.bot.keyboards import CALLBACK_CHANNEL_CONFIRM, get_channel_keyboard, get_user_keyboard
-from src.core.constants import CONTAINER_KEY, USER_KEY
+from src.core.constants import USER_KEY
 from src.core.enums import MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
 from src.services.notification import NotificationService
-from src.services.settings import SettingsService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 ALLOWED_STATUSES = (
     ChatMemberStatus.CREATOR,
@@ -34,21 +33,19 @@ class ChannelMiddleware(EventTypedMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        container: AsyncContainer = data[CONTAINER_KEY]
+        context = UpdateContext.from_data(data)
         user: UserDto = data[USER_KEY]
-        settings_service: SettingsService = await container.get(SettingsService)
+        settings = await context.get_settings()
 
-        if not await settings_service.is_channel_required():
+        if not settings.channel_required:
             return await handler(event, data)
 
         if user.is_privileged:
             logger.debug(f"User '{user.telegram_id}' skipped channel check (privileged)")
             return await handler(event, data)
 
-        bot: Bot = await container.get(Bot)
-        notification_service: NotificationService = await container.get(NotificationService)
-
-        settings = await settings_service.get()
+        bot = await context.get(Bot)
+        notification_service = await context.get(NotificationService)
 
         chat_id: Union[str, int, None] = None
         channel_link = settings.channel_link.get_secret_value()
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar, cast
+
+from aiogram.types import TelegramObject
+from dishka import AsyncContainer
+
+from src.core.constants import CONTAINER_KEY, CONTEXT_KEY
+from src.core.enums import MiddlewareEventType
+from src.infrastructure.database.models.dto import SettingsDto, UserDto
+from src.services.settings import SettingsService
+from src.services.user import UserService
+
+from .base import EventTypedMiddleware
+
+T = TypeVar("T")
+
+
+@dataclass
+class UpdateContext:
+    container: Optional[AsyncContainer] = None
+    user: Optional[UserDto] = None
+    settings: Optional[SettingsDto] = None
+    is_user_loaded: bool = False
+    dependencies: dict[type[Any], Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> "UpdateContext":
+        context: UpdateContext = data.setdefault(CONTEXT_KEY, cls())
+
+        if context.container is None:
+            context.container = data[CONTAINER_KEY]
+
+        return context
+
+    async def get(self, dependency_type: type[T]) -> T:
+        if dependency_type not in self.dependencies:
+            container = cast(AsyncContainer, self.container)
+            self.dependencies[dependency_type] = await container.get(dependency_type)
+
+        return cast(T, self.dependencies[dependency_type])
+
+    async def get_user(self, telegram_id: int) -> Optional[UserDto]:
+        if self.is_user_loaded:
+            return self.user
+
+        user_service = await self.get(UserService)
+        self.set_user(await user_service.get(telegram_id=telegram_id))
+        return self.user
+
+    def set_user(self, user: Optional[UserDto]) -> None:
+        self.user = user
+        self.is_user_loaded = True
+
+    async def get_settings(self) -> SettingsDto:
+        if self.settings is None:
+            settings_service = await self.get(SettingsService)
+            self.settings = await settings_service.get()
+
+        return self.settings
+
+
+class ContextMiddleware(EventTypedMiddleware):
+    __event_types__ = [MiddlewareEventType.UPDATE]
+
+    async def middleware_logic(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        # Created on the update level so the error observer shares it with the event chain
+        data[CONTEXT_KEY] = UpdateContext()
+        return await handler(event, data)
@@ -4,19 +4,16 @@ from typing import Any, Awaitable, Callable, Optional, cast
 from aiogram.types import ErrorEvent, TelegramObject
 from aiogram.types import User as AiogramUser
 from aiogram.utils.formatting import Text
-from dishka import AsyncContainer
 
 from src.bot.keyboards import get_user_keyboard
-from src.core.constants import CONTAINER_KEY
 from src.core.enums import MiddlewareEventType
 from src.core.exceptions import MenuRenderingError
 from src.core.utils.message_payload import MessagePayload
-from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.taskiq.tasks.redirects import redirect_to_main_menu_task
 from src.services.notification import NotificationService
-from src.services.user import UserService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 
 class ErrorMiddleware(EventTypedMiddleware):
@@ -36,13 +33,12 @@ class ErrorMiddleware(EventTypedMiddleware):
         error_type_name = type(error).__name__
         error_message = Text(str(error)[:512])
 
-        container: AsyncContainer = data[CONTAINER_KEY]
-        notification_service: NotificationService = await container.get(NotificationService)
+        context = UpdateContext.from_data(data)
+        notification_service = await context.get(NotificationService)
 
         if aiogram_user:
             reply_markup = get_user_keyboard(aiogram_user.id)
-            user_service: UserService = await container.get(UserService)
-            user: Optional[UserDto] = await user_service.get(telegram_id=aiogram_user.id)
+            user = await context.get_user(aiogram_user.id)
 
             if user and not user.is_dev and not isinstance(error, MenuRenderingError):
                 await redirect_to_main_menu_task.kiq(aiogram_user.id)
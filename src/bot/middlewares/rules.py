@@ -1,18 +1,17 @@
 from typing import Any, Awaitable, Callable
 
 from aiogram.types import CallbackQuery, Message, TelegramObject
-from dishka import AsyncContainer
 
-from src.bot.keyboards import CALLBACK_RULES_ACCEPT, get_rules_keyboard
-from src.core.constants import CONTAINER_KEY, USER_KEY
-from src.core.enums import MiddlewareEventType
+from src.bot.keyboards import CALLBACK_RULES_ACCEPT
+from src.core.constants import USER_KEY
+from src.core.enums import KeyboardName, MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
 from src.services.notification import NotificationService
-from src.services.settings import SettingsService
 from src.services.user import UserService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 
 class RulesMiddleware(EventTypedMiddleware):
@@ -24,17 +23,15 @@ class RulesMiddleware(EventTypedMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        container: AsyncContainer = data[CONTAINER_KEY]
+        context = UpdateContext.from_data(data)
         user: UserDto = data[USER_KEY]
-        settings_service: SettingsService = await container.get(SettingsService)
+        settings = await context.get_settings()
 
-        if not await settings_service.is_rules_required():
+        if not settings.rules_required:
             return await handler(event, data)
 
-        user_service: UserService = await container.get(UserService)
-        notification_service: NotificationService = await container.get(NotificationService)
-
-        settings = await settings_service.get()
+        user_service = await context.get(UserService)
+        notification_service = await context.get(NotificationService)
 
         if self._is_click_accept(event):
             user.is_rules_accepted = True
@@ -48,7 +45,7 @@ class RulesMiddleware(EventTypedMiddleware):
                 payload=MessagePayload(
                     i18n_key="ntf-rules-accept-required",
                     i18n_kwargs={"url": settings.rules_link.get_secret_value()},
-                    reply_markup=get_rules_keyboard(),
+                    keyboard=KeyboardName.RULES,
                     auto_delete_after=None,
                     add_close_button=False,
                 ),
@@ -2,16 +2,16 @@ from typing import Any, Awaitable, Callable
 
 from aiogram.types import TelegramObject
 from cachetools import TTLCache
-from dishka import AsyncContainer
 from loguru import logger
 
-from src.core.constants import CONTAINER_KEY, USER_KEY
+from src.core.constants import USER_KEY
 from src.core.enums import MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
 from src.services.notification import NotificationService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 
 class ThrottlingMiddleware(EventTypedMiddleware):
@@ -26,12 +26,11 @@ class ThrottlingMiddleware(EventTypedMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        container: AsyncContainer = data[CONTAINER_KEY]
         user: UserDto = data[USER_KEY]
 
-        notification_service: NotificationService = await container.get(NotificationService)
-
         if user.telegram_id in self.cache:
+            context = UpdateContext.from_data(data)
+            notification_service = await context.get(NotificationService)
             await notification_service.notify_user(
                 user=user,
                 payload=MessagePayload(i18n_key="ntf-throttling-many-requests"),
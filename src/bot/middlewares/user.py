@@ -3,12 +3,11 @@ from typing import Any, Awaitable, Callable, Optional
 from aiogram.types import TelegramObject
 from aiogram.types import User as AiogramUser
 from aiogram_dialog.api.internal import FakeUser
-from dishka import AsyncContainer
 from loguru import logger
 
 from src.bot.keyboards import get_user_keyboard
 from src.core.config import AppConfig
-from src.core.constants import CONTAINER_KEY, IS_SUPER_DEV_KEY, USER_KEY
+from src.core.constants import IS_SUPER_DEV_KEY, USER_KEY
 from src.core.enums import MiddlewareEventType, SystemNotificationType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
@@ -17,6 +16,7 @@ from src.services.referral import ReferralService
 from src.services.user import UserService
 
 from .base import EventTypedMiddleware
+from .context import UpdateContext
 
 
 class UserMiddleware(EventTypedMiddleware):
@@ -41,14 +41,14 @@ class UserMiddleware(EventTypedMiddleware):
             logger.warning("Terminating middleware: event from bot or missing user")
             return
 
-        container: AsyncContainer = data[CONTAINER_KEY]
-        notification_service: NotificationService = await container.get(NotificationService)
-        config: AppConfig = await container.get(AppConfig)
-        user_service: UserService = await container.get(UserService)
-        referral_service: ReferralService = await container.get(ReferralService)
-        user: Optional[UserDto] = await user_service.get(telegram_id=aiogram_user.id)
+        context = UpdateContext.from_data(data)
+        config = await context.get(AppConfig)
+        user_service = await context.get(UserService)
+        user: Optional[UserDto] = await context.get_user(aiogram_user.id)
 
         if user is None:
+            notification_service = await context.get(NotificationService)
+            referral_service = await context.get(ReferralService)
             user = await user_service.create(aiogram_user)
             referrer = await referral_service.get_referrer_by_event(event, user.telegram_id)
 
@@ -86,6 +86,7 @@ class UserMiddleware(EventTypedMiddleware):
             await user_service.compare_and_update(user, aiogram_user)
 
         await user_service.update_recent_activity(telegram_id=user.telegram_id)
+        context.set_user(user)
         data[USER_KEY] = user
         data[IS_SUPER_DEV_KEY] = user.telegram_id == config.bot.dev_id
 
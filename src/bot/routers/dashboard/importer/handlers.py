@@ -22,7 +22,7 @@ from src.infrastructure.taskiq.tasks.importer import (
     import_exported_users_task,
     sync_all_users_from_panel_task,
 )
-from src.services.importer import ImporterService
+from src.services.importer import ImporterService, ImportProgress
 from src.services.notification import NotificationService
 
 
@@ -71,8 +71,24 @@ async def on_database_input(
     await bot.download_file(file.file_path, destination=local_file_path)
     logger.info(f"{log(user)} Received file: '{local_file_path}'")
 
+    notification = await notification_service.notify_user(
+        user=user,
+        payload=MessagePayload.not_deleted(i18n_key="ntf-importer-db-processing"),
+    )
+
+    async def on_progress(progress: ImportProgress) -> None:
+        if notification:
+            await notification_service.edit_notification(
+                user=user,
+                message_id=notification.message_id,
+                payload=MessagePayload.not_deleted(
+                    i18n_key="ntf-importer-db-progress",
+                    i18n_kwargs={"processed": progress.processed, "total": progress.total},
+                ),
+            )
+
     try:
-        users = importer_service.get_users_from_xui(local_file_path)
+        users = await importer_service.read_users_from_xui(local_file_path, on_progress)
     except Exception as exception:
         logger.exception(f"Failed to parse users: {exception}")
         await notification_service.notify_user(
@@ -80,6 +96,12 @@ async def on_database_input(
             payload=MessagePayload(i18n_key="ntf-importer-db-failed"),
         )
         return
+    finally:
+        if notification:
+            try:
+                await notification.delete()
+            except Exception as exception:
+                logger.debug(f"Failed to delete import progress message: {exception}")
 
     if not users:
         await notification_service.notify_user(
@@ -162,7 +184,12 @@ async def on_import_all_xui(
         payload=MessagePayload.not_deleted(i18n_key="ntf-importer-import-started"),
     )
 
-    task = await import_exported_users_task.kiq(users["all"], selected_squads)
+    task = await import_exported_users_task.kiq(
+        users["all"],
+        selected_squads,
+        user,
+        notification.message_id if notification else None,
+    )
 
     logger.info(f"{log(user)} Started import '{len(users['all'])}' users")
     result = await task.wait_result()
@@ -203,7 +230,12 @@ async def on_import_active_xui(
         payload=MessagePayload.not_deleted(i18n_key="ntf-importer-import-started"),
     )
 
-    task = await import_exported_users_task.kiq(users["active"], selected_squads)
+    task = await import_exported_users_task.kiq(
+        users["active"],
+        selected_squads,
+        user,
+        notification.message_id if notification else None,
+    )
     logger.info(f"{log(user)} Started import '{len(users['active'])}' users")
     result = await task.wait_result()
     success_count, failed_count = result.return_value
@@ -251,7 +283,10 @@ async def on_sync(
             payload=MessagePayload.not_deleted(i18n_key="ntf-importer-sync-started"),
         )
 
-        task = await sync_all_users_from_panel_task.kiq()
+        task = await sync_all_users_from_panel_task.kiq(
+            user,
+            notification.message_id if notification else None,
+        )
         result = await task.wait_result()
         result = result.return_value
 
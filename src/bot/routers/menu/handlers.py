@@ -1,4 +1,5 @@
 from aiogram import F, Router
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import CommandStart
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import DialogManager, ShowMode, StartMode, SubManager
@@ -159,17 +160,36 @@ async def on_show_qr(
     user: UserDto = dialog_manager.middleware_data[USER_KEY]
 
     ref_link = await referral_service.get_ref_link(user.referral_code)
-    ref_qr = referral_service.get_ref_qr(ref_link)
-
-    await notification_service.notify_user(
+    file_id = await referral_service.get_ref_qr_file_id(ref_link)
+
+    if file_id:
+        try:
+            await notification_service.notify_user(
+                user=user,
+                payload=MessagePayload.not_deleted(
+                    i18n_key="",
+                    media_id=file_id,
+                    media_type=MediaType.PHOTO,
+                ),
+            )
+            return
+        except TelegramBadRequest as exception:
+            # A file_id from another bot token or an expired one, upload the image again
+            logger.warning(f"{log(user)} Cached referral QR rejected: {exception}")
+            await referral_service.delete_ref_qr_file_id(ref_link)
+
+    message = await notification_service.notify_user(
         user=user,
         payload=MessagePayload.not_deleted(
             i18n_key="",
-            media=ref_qr,
+            media=await referral_service.get_ref_qr(ref_link),
             media_type=MediaType.PHOTO,
         ),
     )
 
+    if message and message.photo:
+        await referral_service.set_ref_qr_file_id(ref_link, message.photo[-1].file_id)
+
 
 @inject
 async def on_withdraw_points(
@@ -21,6 +21,10 @@ class BotConfig(BaseConfig, env_prefix="BOT_"):
     setup_commands: bool = True
     use_banners: bool = True
 
+    send_rate_limit: int = 25
+    chat_send_rate_limit: float = 1.0
+    chat_send_burst: int = 3
+
     @property
     def webhook_path(self) -> str:
         return f"{API_V1}{BOT_WEBHOOK_PATH}"
@@ -32,6 +32,7 @@ IMPORTED_TAG: Final[str] = "IMPORTED"
 
 MIDDLEWARE_DATA_KEY: Final[str] = "middleware_data"
 CONTAINER_KEY: Final[str] = "dishka_container"
+CONTEXT_KEY: Final[str] = "update_context"
 CONFIG_KEY: Final[str] = "config"
 USER_KEY: Final[str] = "user"
 IS_SUPER_DEV_KEY: Final[str] = "is_super_dev"
@@ -39,9 +40,40 @@ IS_SUPER_DEV_KEY: Final[str] = "is_super_dev"
 TIME_1M: Final[int] = 60
 TIME_5M: Final[int] = TIME_1M * 5
 TIME_10M: Final[int] = TIME_1M * 10
+TIME_1H: Final[int] = TIME_1M * 60
+TIME_1D: Final[int] = TIME_1M * 60 * 24
 
 RECENT_REGISTERED_MAX_COUNT: Final[int] = 25
 RECENT_ACTIVITY_MAX_COUNT: Final[int] = 25
+RECENT_ACTIVITY_COALESCE_WINDOW: Final[int] = 30
+RECENT_ACTIVITY_RETENTION: Final[int] = TIME_1D
+REF_QR_CACHE_SIZE: Final[int] = 256
+REF_QR_FILE_ID_TTL: Final[int] = TIME_1D * 30
+RENDER_CACHE_SIZE: Final[int] = 1024
 
 BATCH_SIZE: Final[int] = 20
-BATCH_DELAY: Final[int] = 1
+AUDIENCE_PAGE_SIZE: Final[int] = 500
+STREAM_CHUNK_SIZE: Final[int] = 500
+USER_SEARCH_LIMIT: Final[int] = 50
+PANEL_SYNC_PAGE_SIZE: Final[int] = 100
+PANEL_SYNC_CONCURRENCY: Final[int] = 4
+PROGRESS_UPDATE_INTERVAL: Final[int] = 3
+IMPORT_INITIAL_CONCURRENCY: Final[int] = 4
+IMPORT_MAX_CONCURRENCY: Final[int] = 16
+IMPORT_TARGET_LATENCY: Final[float] = 1.0
+IMPORT_ERROR_BACKOFF: Final[float] = 2.0
+IMPORT_CHECKPOINT_SIZE: Final[int] = 100
+SEND_RETRY_ATTEMPTS: Final[int] = 3
+DELETION_BATCH_SIZE: Final[int] = 100
+DELETION_POLL_INTERVAL: Final[float] = 1.0
+DELETION_RETRY_ATTEMPTS: Final[int] = 3
+DELETION_RETRY_DELAY: Final[int] = 5
+PAYMENT_WEBHOOK_DEDUPE_TTL: Final[int] = TIME_10M
+PENDING_TRANSACTION_TIMEOUT: Final[int] = TIME_1M * 30
+REMNAWAVE_EVENTS_GROUP: Final[str] = "remnashop"
+REMNAWAVE_EVENTS_MAX_LENGTH: Final[int] = 10000
+REMNAWAVE_EVENTS_BATCH_SIZE: Final[int] = 100
+REMNAWAVE_EVENTS_BLOCK_TIMEOUT: Final[int] = 5000  # ms
+REMNAWAVE_EVENTS_COALESCE_WINDOW: Final[float] = 0.5
+REMNAWAVE_EVENTS_CLAIM_IDLE: Final[int] = TIME_1M * 1000  # ms
+REMNAWAVE_EVENTS_CLAIM_INTERVAL: Final[int] = TIME_1M
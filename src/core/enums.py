@@ -45,6 +45,7 @@ class BroadcastMessageStatus(UpperStrEnum):
     EDITED = auto()
     DELETED = auto()
     PENDING = auto()
+    SENDING = auto()  # Claimed by a worker, delivery outcome not recorded yet
 
 
 class BroadcastAudience(UpperStrEnum):
@@ -96,6 +97,15 @@ class BannerName(StrEnum):
     REFERRAL = auto()
 
 
+class KeyboardName(StrEnum):
+    CLOSE = auto()
+    RENEW = auto()
+    BUY = auto()
+    RULES = auto()
+    REMNASHOP = auto()
+    REMNASHOP_UPDATE = auto()
+
+
 class BannerFormat(StrEnum):
     JPG = auto()
     JPEG = auto()
@@ -334,6 +344,12 @@ class MiddlewareEventType(StrEnum):
     ERROR = auto()
 
 
+class LoadProfile(StrEnum):
+    BARE = auto()
+    WITH_CURRENT_SUBSCRIPTION = auto()
+    FULL = auto()
+
+
 class RemnaUserEvent(StrEnum):
     CREATED = "user.created"
     MODIFIED = "user.modified"
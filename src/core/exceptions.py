@@ -1,2 +1,6 @@
 class MenuRenderingError(Exception):
     """Raised when main menu cannot be rendered"""
+
+
+class RateLimitTimeoutError(Exception):
+    """Raised when a Telegram send slot cannot be acquired in time"""
@@ -0,0 +1,55 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.constants import RENDER_CACHE_SIZE
+from src.core.enums import Locale
+from src.core.utils.message_payload import MessagePayload
+from src.core.utils.types import AnyKeyboard
+
+
+@dataclass(frozen=True)
+class RenderedMessage:
+    text: str
+    reply_markup: Optional[AnyKeyboard]
+
+
+class RenderCache:
+    max_size: int
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, RenderedMessage] = OrderedDict()
+
+    def get(self, key: str) -> Optional[RenderedMessage]:
+        rendered = self._entries.get(key)
+        if rendered is not None:
+            self._entries.move_to_end(key)
+        return rendered
+
+    def set(self, key: str, rendered: RenderedMessage) -> None:
+        self._entries[key] = rendered
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def make_key(locale: Locale, payload: MessagePayload) -> str:
+        if payload.reply_markup:
+            keyboard = payload.reply_markup.model_dump_json()
+        else:
+            keyboard = payload.keyboard or ""
+        # The close button depends on both flags, so they are part of the rendered markup
+        digest = hashlib.sha1(
+            "\x1f".join(
+                (
+                    repr(sorted(payload.i18n_kwargs.items(), key=lambda item: item[0])),
+                    keyboard,
+                    str(payload.add_close_button),
+                    str(payload.auto_delete_after is None),
+                )
+            ).encode()
+        ).hexdigest()
+        return f"{locale}:{payload.i18n_key}:{digest}"
@@ -15,4 +15,40 @@ class SyncRunningKey(StorageKey, prefix="sync_running"): ...
 class AccessWaitListKey(StorageKey, prefix="access_wait_list"): ...
 
 
-class RecentActivityUsersKey(StorageKey, prefix="recent_activity_users"): ...
+class RecentActivityUsersKey(StorageKey, prefix="recent_activity"): ...
+
+
+class SendBucketKey(StorageKey, prefix="send_bucket"):
+    bucket: str
+
+
+class SendPauseKey(StorageKey, prefix="send_pause"): ...
+
+
+class ImportCheckpointKey(StorageKey, prefix="import_checkpoint"):
+    import_id: str
+
+
+class ReferralQrKey(StorageKey, prefix="referral_qr"):
+    url_hash: str
+
+
+class MediaIdKey(StorageKey, prefix="media_id"):
+    bot_id: int
+    content_type: str
+    content_hash: str
+
+
+class MessageDeletionsKey(StorageKey, prefix="message_deletions"): ...
+
+
+class RemnawaveEventsKey(StorageKey, prefix="remnawave_events"): ...
+
+
+class PlanCatalogueVersionKey(StorageKey, prefix="plan_catalogue_version"): ...
+
+
+class PaymentWebhookKey(StorageKey, prefix="payment_webhook"):
+    gateway_type: str
+    payment_id: str
+    status: str
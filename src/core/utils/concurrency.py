@@ -0,0 +1,37 @@
+import asyncio
+
+
+class AdaptiveConcurrency:
+    # Additive increase after a full window of healthy calls, multiplicative decrease
+    # as soon as the remote side slows down or fails
+    limit: int
+    maximum: int
+    target_latency: float
+
+    def __init__(self, initial: int, maximum: int, target_latency: float) -> None:
+        self.limit = initial
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._healthy = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, latency: float, healthy: bool) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+
+            if not healthy or latency > self.target_latency:
+                self.limit = max(1, self.limit // 2)
+                self._healthy = 0
+            else:
+                self._healthy += 1
+                if self._healthy >= self.limit:
+                    self.limit = min(self.maximum, self.limit + 1)
+                    self._healthy = 0
+
+            self._condition.notify_all()
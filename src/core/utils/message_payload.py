@@ -2,7 +2,7 @@ from typing import Any, Optional, Self
 
 from pydantic import BaseModel, ConfigDict
 
-from src.core.enums import MediaType, MessageEffect
+from src.core.enums import KeyboardName, MediaType, MessageEffect
 from src.core.utils.types import AnyInputFile, AnyKeyboard
 
 
@@ -14,6 +14,7 @@ class MessagePayload(BaseModel):
     media_id: Optional[str] = None
     media_type: Optional[MediaType] = None
     reply_markup: Optional[AnyKeyboard] = None
+    keyboard: Optional[KeyboardName] = None
     auto_delete_after: Optional[int] = 5
     add_close_button: bool = False
     message_effect: Optional[MessageEffect] = None
@@ -34,6 +35,7 @@ class MessagePayload(BaseModel):
         media_id: Optional[str] = None,
         media_type: Optional[MediaType] = None,
         reply_markup: Optional[AnyKeyboard] = None,
+        keyboard: Optional[KeyboardName] = None,
         auto_delete_after: Optional[int] = None,
         add_close_button: bool = True,
         message_effect: Optional[MessageEffect] = None,
@@ -45,6 +47,7 @@ class MessagePayload(BaseModel):
             "media_id": media_id,
             "media_type": media_type,
             "reply_markup": reply_markup,
+            "keyboard": keyboard,
             "auto_delete_after": auto_delete_after,
             "add_close_button": add_close_button,
             "message_effect": message_effect,
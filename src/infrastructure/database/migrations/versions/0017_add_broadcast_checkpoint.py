@@ -0,0 +1,37 @@
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("broadcasts", sa.Column("last_user_id", sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        DELETE FROM broadcast_messages a
+        USING broadcast_messages b
+        WHERE a.broadcast_id = b.broadcast_id
+          AND a.user_id = b.user_id
+          AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_broadcast_messages_broadcast_id_user_id",
+        "broadcast_messages",
+        ["broadcast_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_broadcast_messages_broadcast_id_user_id",
+        "broadcast_messages",
+        type_="unique",
+    )
+    op.drop_column("broadcasts", "last_user_id")
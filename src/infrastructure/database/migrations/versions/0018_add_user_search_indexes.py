@@ -0,0 +1,40 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_users_name_trgm",
+        "users",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_username_trgm",
+        "users",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index(
+        op.f("ix_subscriptions_user_remna_id"),
+        "subscriptions",
+        ["user_remna_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_subscriptions_user_remna_id"), table_name="subscriptions")
+    op.drop_index("ix_users_username_trgm", table_name="users")
+    op.drop_index("ix_users_name_trgm", table_name="users")
+    # pg_trgm is left installed, other objects in the database may rely on it
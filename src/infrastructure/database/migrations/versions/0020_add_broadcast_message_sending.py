@@ -0,0 +1,17 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TYPE broadcast_message_status ADD VALUE IF NOT EXISTS 'SENDING'")
+
+
+def downgrade() -> None:
+    # Postgres cannot drop an enum value, claimed rows are only settled as failed
+    op.execute("UPDATE broadcast_messages SET status = 'FAILED' WHERE status = 'SENDING'")
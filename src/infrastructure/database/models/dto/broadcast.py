@@ -22,6 +22,7 @@ class BroadcastDto(TrackableDto):
     success_count: int = 0
     failed_count: int = 0
     payload: MessagePayload
+    last_user_id: Optional[int] = None
 
     messages: Optional[list["BroadcastMessageDto"]] = []
 
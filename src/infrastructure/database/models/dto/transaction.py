@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from src.core.constants import PENDING_TRANSACTION_TIMEOUT
 from src.core.utils.time import datetime_now
 
 if TYPE_CHECKING:
@@ -56,7 +57,7 @@ class BaseTransactionDto(TrackableDto):
             return False
         return (
             self.status == TransactionStatus.PENDING
-            and datetime_now() - self.created_at > timedelta(minutes=30)
+            and datetime_now() - self.created_at > timedelta(seconds=PENDING_TRANSACTION_TIMEOUT)
         )
 
 
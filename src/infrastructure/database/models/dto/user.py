@@ -70,6 +70,8 @@ class BaseUserDto(TrackableDto):
 class UserDto(BaseUserDto):
     current_subscription: Optional["BaseSubscriptionDto"] = None
 
+    # Only the FULL load profile computes these, BARE and WITH_CURRENT_SUBSCRIPTION
+    # leave them at False, so load FULL wherever a decision depends on them
     _is_invited_user: bool = PrivateAttr(default=False)
     _has_any_subscription: bool = PrivateAttr(default=False)
 
@@ -94,6 +96,7 @@ class UserDto(BaseUserDto):
     ) -> Optional["UserDto"]:
         dto = super().from_model(model_instance, decrypt=decrypt)
         if dto and model_instance:
-            dto._has_any_subscription = bool(getattr(model_instance, "subscriptions", []))
-            dto._is_invited_user = bool(getattr(model_instance, "referral", None))
+            loaded = model_instance.__dict__
+            dto._has_any_subscription = bool(loaded.get("has_any_subscription", False))
+            dto._is_invited_user = bool(loaded.get("is_invited_user", False))
         return dto
@@ -1,6 +1,7 @@
+from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, BigInteger, Enum, ForeignKey, Integer
+from sqlalchemy import JSON, BigInteger, Enum, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,16 +42,24 @@ class Broadcast(BaseSql, TimestampMixin):
     success_count: Mapped[int] = mapped_column(Integer, nullable=False)
     failed_count: Mapped[int] = mapped_column(Integer, nullable=False)
     payload: Mapped[MessagePayload] = mapped_column(JSON, nullable=False)
+    last_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     messages: Mapped[list["BroadcastMessage"]] = relationship(
         back_populates="broadcast",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
 class BroadcastMessage(BaseSql):
     __tablename__ = "broadcast_messages"
+    __table_args__ = (
+        UniqueConstraint(
+            "broadcast_id",
+            "user_id",
+            name="uq_broadcast_messages_broadcast_id_user_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -69,4 +78,4 @@ class BroadcastMessage(BaseSql):
         nullable=False,
     )
 
-    broadcast: Mapped["Broadcast"] = relationship(back_populates="messages")
+    broadcast: Mapped["Broadcast"] = relationship(back_populates="messages", lazy="raise")
@@ -44,6 +44,7 @@ class Promocode(BaseSql, TimestampMixin):
         "PromocodeActivation",
         back_populates="promocode",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
 
 
@@ -69,5 +70,9 @@ class PromocodeActivation(BaseSql):
         nullable=False,
     )
 
-    promocode: Mapped["Promocode"] = relationship("Promocode", back_populates="activations")
-    user: Mapped["User"] = relationship("User", foreign_keys=[user_telegram_id], lazy="selectin")
+    promocode: Mapped["Promocode"] = relationship(
+        "Promocode",
+        back_populates="activations",
+        lazy="raise",
+    )
+    user: Mapped["User"] = relationship("User", foreign_keys=[user_telegram_id], lazy="raise")
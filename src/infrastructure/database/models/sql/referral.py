@@ -42,19 +42,19 @@ class Referral(BaseSql, TimestampMixin):
     referrer: Mapped["User"] = relationship(
         "User",
         foreign_keys=[referrer_telegram_id],
-        lazy="selectin",
+        lazy="raise",
     )
     referred: Mapped["User"] = relationship(
         "User",
         back_populates="referral",
         foreign_keys=[referred_telegram_id],
-        lazy="selectin",
+        lazy="raise",
     )
     rewards: Mapped[list["ReferralReward"]] = relationship(
         "ReferralReward",
         back_populates="referral",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -85,11 +85,11 @@ class ReferralReward(BaseSql, TimestampMixin):
         "Referral",
         back_populates="rewards",
         foreign_keys=[referral_id],
-        lazy="selectin",
+        lazy="raise",
     )
 
     user: Mapped["User"] = relationship(
         "User",
         foreign_keys=[user_telegram_id],
-        lazy="selectin",
+        lazy="raise",
     )
@@ -25,7 +25,7 @@ class Subscription(BaseSql, TimestampMixin):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
-    user_remna_id: Mapped[UUID] = mapped_column(PG_UUID, nullable=False)
+    user_remna_id: Mapped[UUID] = mapped_column(PG_UUID, nullable=False, index=True)
     user_telegram_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("users.telegram_id", ondelete="CASCADE"),
@@ -70,5 +70,5 @@ class Subscription(BaseSql, TimestampMixin):
         back_populates="subscriptions",
         primaryjoin="Subscription.user_telegram_id==User.telegram_id",
         foreign_keys="Subscription.user_telegram_id",
-        lazy="selectin",
+        lazy="raise",
     )
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 
 from uuid import UUID
 
-from sqlalchemy import JSON, BigInteger, Boolean, Enum, ForeignKey, Integer
+from sqlalchemy import JSON, BigInteger, Boolean, Enum, ForeignKey, Index, Integer, text
 from sqlalchemy import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,13 @@ from .timestamp import TimestampMixin
 
 class Transaction(BaseSql, TimestampMixin):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index(
+            "ix_transactions_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     payment_id: Mapped[UUID] = mapped_column(PG_UUID, nullable=False, unique=True)
@@ -64,4 +71,4 @@ class Transaction(BaseSql, TimestampMixin):
     )
     plan: Mapped[PlanSnapshotDto] = mapped_column(JSON, nullable=False)
 
-    user: Mapped["User"] = relationship("User", foreign_keys=[user_telegram_id], lazy="selectin")
+    user: Mapped["User"] = relationship("User", foreign_keys=[user_telegram_id], lazy="raise")
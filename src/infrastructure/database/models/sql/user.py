@@ -6,8 +6,8 @@ if TYPE_CHECKING:
     from .referral import Referral
     from .subscription import Subscription
 
-from sqlalchemy import BigInteger, Boolean, Enum, ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, Boolean, Enum, ForeignKey, Index, Integer, String, false
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from src.core.enums import Locale, UserRole
 
@@ -17,6 +17,20 @@ from .timestamp import TimestampMixin
 
 class User(BaseSql, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, nullable=False, unique=True)
@@ -56,10 +70,13 @@ class User(BaseSql, TimestampMixin):
         nullable=True,
     )
 
+    has_any_subscription: Mapped[bool] = query_expression(default_expr=false())
+    is_invited_user: Mapped[bool] = query_expression(default_expr=false())
+
     current_subscription: Mapped[Optional["Subscription"]] = relationship(
         "Subscription",
         foreign_keys=[current_subscription_id],
-        lazy="selectin",
+        lazy="raise",
     )
 
     subscriptions: Mapped[list["Subscription"]] = relationship(
@@ -67,7 +84,7 @@ class User(BaseSql, TimestampMixin):
         back_populates="user",
         primaryjoin="User.telegram_id==Subscription.user_telegram_id",
         foreign_keys="[Subscription.user_telegram_id]",
-        lazy="selectin",
+        lazy="raise",
     )
 
     referral: Mapped[Optional["Referral"]] = relationship(
@@ -75,5 +92,5 @@ class User(BaseSql, TimestampMixin):
         back_populates="referred",
         primaryjoin="User.telegram_id==Referral.referred_telegram_id",
         uselist=False,
-        lazy="selectin",
+        lazy="raise",
     )
@@ -1,16 +1,23 @@
-from typing import Any, Optional, Type, TypeVar, Union, cast
+from typing import Any, AsyncIterator, Optional, Sequence, Type, TypeVar, Union, cast
 
-from sqlalchemy import ColumnExpressionArgument, delete, func, select, update
+from sqlalchemy import ColumnExpressionArgument, delete, func, insert, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.core.constants import STREAM_CHUNK_SIZE
 from src.infrastructure.database.models.sql import BaseSql
 
 T = TypeVar("T", bound=BaseSql)
 ModelType = Type[T]
 
 ConditionType = ColumnExpressionArgument[Any]
-OrderByArgument = Union[ColumnExpressionArgument[Any], InstrumentedAttribute[Any]]
+OrderByArgument = Union[
+    ColumnExpressionArgument[Any],
+    InstrumentedAttribute[Any],
+    Sequence[ColumnExpressionArgument[Any]],
+]
+LoadOptions = Sequence[ORMOption]
 
 
 class BaseRepository:
@@ -19,21 +26,25 @@ class BaseRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def create_instance(self, instance: T) -> T:
+    async def create_instance(self, instance: T, options: LoadOptions = ()) -> T:
         self.session.add(instance)
         await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+
+        if not options:
+            await self.session.refresh(instance)
+            return instance
+
+        return cast(T, await self._reload(type(instance), inspect(instance).identity, options))
 
     async def create_instances(self, instances: list[T]) -> list[T]:
         if not instances:
             return []
 
-        self.session.add_all(instances)
-        await self.session.flush()
-        for instance in instances:
-            await self.session.refresh(instance)
-        return instances
+        # Batched multi-row INSERT ... RETURNING, ids and server defaults come back with the rows
+        model = type(instances[0])
+        query = insert(model).returning(model, sort_by_parameter_order=True)
+        result = await self.session.scalars(query, [self._column_values(i) for i in instances])
+        return list(result.all())
 
     async def merge_instance(self, instance: T) -> T:
         return await self.session.merge(instance)
@@ -41,8 +52,14 @@ class BaseRepository:
     async def delete_instance(self, instance: T) -> None:
         await self.session.delete(instance)
 
-    async def _get_one(self, model: ModelType[T], *conditions: ConditionType) -> Optional[T]:
-        result = await self.session.execute(select(model).where(*conditions))
+    async def _get_one(
+        self,
+        model: ModelType[T],
+        *conditions: ConditionType,
+        options: LoadOptions = (),
+    ) -> Optional[T]:
+        query = self._with_options(select(model).where(*conditions), options)
+        result = await self.session.execute(query)
         return result.unique().scalar_one_or_none()
 
     async def _get_many(
@@ -52,8 +69,9 @@ class BaseRepository:
         order_by: Optional[OrderByArgument] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        options: LoadOptions = (),
     ) -> list[T]:
-        query = select(model).where(*conditions)
+        query = self._with_options(select(model).where(*conditions), options)
 
         if order_by is not None:
             if isinstance(order_by, (list, tuple)):
@@ -70,37 +88,101 @@ class BaseRepository:
         result = await self.session.execute(query)
         return list(result.unique().scalars().all())
 
+    async def _stream_many(
+        self,
+        model: ModelType[T],
+        *conditions: ConditionType,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        after_id: int = 0,
+        options: LoadOptions = (),
+    ) -> AsyncIterator[list[T]]:
+        # Keyset pagination on the primary key: every chunk is its own short query,
+        # so callers are free to commit between chunks
+        primary_key = model.id  # type: ignore[attr-defined]
+        last_id = after_id
+
+        while True:
+            query = self._with_options(
+                select(model)
+                .where(primary_key > last_id, *conditions)
+                .order_by(primary_key.asc())
+                .limit(chunk_size),
+                options,
+            )
+            result = await self.session.execute(query)
+            chunk = list(result.unique().scalars().all())
+
+            if not chunk:
+                return
+
+            last_id = chunk[-1].id
+            yield chunk
+
+            if len(chunk) < chunk_size:
+                return
+
     async def _update(
         self,
         model: ModelType[T],
         *conditions: ConditionType,
         load_result: bool = True,
+        options: LoadOptions = (),
         **kwargs: Any,
     ) -> Optional[T]:
         if not kwargs:
             if not load_result:
                 return None
-            return cast(Optional[T], await self._get_one(model, *conditions))
+            return cast(Optional[T], await self._get_one(model, *conditions, options=options))
 
         query = update(model).where(*conditions).values(**kwargs)
 
-        if load_result:
-            query = query.returning(model.id)  # type: ignore [attr-defined]
+        if not load_result:
+            await self.session.execute(query)
+            return None
 
+        # The updated row comes back through RETURNING, loader options apply to it like to a
+        # SELECT, so relationships only cost a query when the profile asks for them
+        query = query.returning(model).options(*options).execution_options(populate_existing=True)
         result = await self.session.execute(query)
-        obj_id: Optional[int] = result.scalar_one_or_none()
+        return cast(Optional[T], result.scalars().one_or_none())
 
-        if obj_id is not None and load_result:
-            db_obj = await self.session.get(model, obj_id)
-            await self.session.refresh(db_obj)
-            return db_obj
+    async def _bulk_update(self, model: ModelType[T], rows: list[dict[str, Any]]) -> None:
+        # Each row must carry the primary key, SQLAlchemy batches them into executemany
+        if not rows:
+            return
 
-        return None
+        await self.session.execute(update(model), rows)
 
     async def _delete(self, model: ModelType[T], *conditions: ConditionType) -> int:
         result = await self.session.execute(delete(model).where(*conditions))
         return result.rowcount  # type: ignore[attr-defined, no-any-return]
 
+    async def _reload(
+        self, model: ModelType[T], identity: Any, options: LoadOptions
+    ) -> Optional[T]:
+        return await self.session.get(
+            model,
+            identity,
+            options=options,
+            populate_existing=True,
+        )
+
+    @staticmethod
+    def _column_values(instance: BaseSql) -> dict[str, Any]:
+        state = inspect(instance)
+        return {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+
+    @staticmethod
+    def _with_options(query: Any, options: LoadOptions) -> Any:
+        # Profiles must win over whatever is already in the identity map
+        if not options:
+            return query
+        return query.options(*options).execution_options(populate_existing=True)
+
     async def _count(self, model: Type[T], *conditions: ConditionType) -> int:
         query = select(func.count()).select_from(model).where(*conditions)
         result = await self.session.scalar(query)
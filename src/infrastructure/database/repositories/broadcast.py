@@ -1,11 +1,18 @@
-from typing import Any, Optional
+from typing import Any, Final, Optional
 from uuid import UUID
 
-from sqlalchemy import update
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
+from src.core.enums import LoadProfile
 from src.infrastructure.database.models.sql import Broadcast, BroadcastMessage
 
-from .base import BaseRepository
+from .base import BaseRepository, LoadOptions
+
+BROADCAST_LOAD_PROFILES: Final[dict[LoadProfile, LoadOptions]] = {
+    LoadProfile.BARE: (),
+    LoadProfile.FULL: (selectinload(Broadcast.messages),),
+}
 
 
 class BroadcastRepository(BaseRepository):
@@ -15,11 +22,32 @@ class BroadcastRepository(BaseRepository):
     async def create_messages(self, messages: list[BroadcastMessage]) -> list[BroadcastMessage]:
         return await self.create_instances(messages)
 
-    async def get(self, task_id: UUID) -> Optional[Broadcast]:
-        return await self._get_one(Broadcast, Broadcast.task_id == task_id)
+    async def get(
+        self,
+        task_id: UUID,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> Optional[Broadcast]:
+        return await self._get_one(
+            Broadcast,
+            Broadcast.task_id == task_id,
+            options=BROADCAST_LOAD_PROFILES[profile],
+        )
 
-    async def get_all(self) -> list[Broadcast]:
-        return await self._get_many(Broadcast, order_by=Broadcast.id.asc())
+    async def get_without_messages(self, task_id: UUID) -> Optional[Broadcast]:
+        query = (
+            select(Broadcast)
+            .where(Broadcast.task_id == task_id)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_all(self, profile: LoadProfile = LoadProfile.BARE) -> list[Broadcast]:
+        return await self._get_many(
+            Broadcast,
+            order_by=Broadcast.id.asc(),
+            options=BROADCAST_LOAD_PROFILES[profile],
+        )
 
     async def get_message_by_user(
         self, broadcast_id: int, user_id: int
@@ -30,8 +58,30 @@ class BroadcastRepository(BaseRepository):
             BroadcastMessage.user_id == user_id,
         )
 
-    async def update(self, task_id: UUID, **data: Any) -> Optional[Broadcast]:
-        return await self._update(Broadcast, Broadcast.task_id == task_id, **data)
+    async def get_messages_by_users(
+        self,
+        broadcast_id: int,
+        user_ids: list[int],
+    ) -> list[BroadcastMessage]:
+        return await self._get_many(
+            BroadcastMessage,
+            BroadcastMessage.broadcast_id == broadcast_id,
+            BroadcastMessage.user_id.in_(user_ids),
+        )
+
+    async def update(
+        self,
+        task_id: UUID,
+        load_result: bool = True,
+        **data: Any,
+    ) -> Optional[Broadcast]:
+        return await self._update(
+            Broadcast,
+            Broadcast.task_id == task_id,
+            load_result=load_result,
+            options=BROADCAST_LOAD_PROFILES[LoadProfile.FULL],
+            **data,
+        )
 
     async def update_message(
         self, broadcast_id: int, user_id: int, **data: Any
@@ -44,7 +94,4 @@ class BroadcastRepository(BaseRepository):
         )
 
     async def bulk_update_messages(self, data: list[dict]) -> None:
-        if not data:
-            return
-
-        await self.session.execute(update(BroadcastMessage), data)
+        await self._bulk_update(BroadcastMessage, data)
@@ -2,7 +2,7 @@ from typing import Optional
 
 from sqlalchemy import func, select
 
-from src.core.enums import PlanAvailability, PlanType
+from src.core.enums import PlanType
 from src.infrastructure.database.models.sql import Plan
 
 from .base import BaseRepository
@@ -15,9 +15,6 @@ class PlanRepository(BaseRepository):
     async def get(self, plan_id: int) -> Optional[Plan]:
         return await self._get_one(Plan, Plan.id == plan_id)
 
-    async def get_by_name(self, name: str) -> Optional[Plan]:
-        return await self._get_one(Plan, Plan.name == name)
-
     async def get_all(self) -> list[Plan]:
         return await self._get_many(Plan, order_by=Plan.order_index.asc())
 
@@ -33,15 +30,5 @@ class PlanRepository(BaseRepository):
     async def filter_by_type(self, plan_type: PlanType) -> list[Plan]:
         return await self._get_many(Plan, Plan.type == plan_type)
 
-    async def filter_by_availability(self, availability: PlanAvailability) -> list[Plan]:
-        return await self._get_many(Plan, Plan.availability == availability)
-
-    async def filter_active(self, is_active: bool) -> list[Plan]:
-        return await self._get_many(
-            Plan,
-            Plan.is_active == is_active,
-            order_by=Plan.order_index.asc(),
-        )
-
     async def get_max_index(self) -> Optional[int]:
         return await self.session.scalar(select(func.max(Plan.order_index)))
@@ -1,28 +1,57 @@
-from typing import Any, List, Optional
+from typing import Any, Final, List, Optional
 
 from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
 
-from src.core.enums import ReferralRewardType
+from src.core.enums import LoadProfile, ReferralRewardType
 from src.infrastructure.database.models.sql import Referral, ReferralReward
 
-from .base import BaseRepository
+from .base import BaseRepository, LoadOptions
+
+REFERRAL_LOAD_PROFILES: Final[dict[LoadProfile, LoadOptions]] = {
+    LoadProfile.BARE: (),
+    LoadProfile.FULL: (
+        selectinload(Referral.referrer),
+        selectinload(Referral.referred),
+    ),
+}
 
 
 class ReferralRepository(BaseRepository):
     async def create_referral(self, referral: Referral) -> Referral:
-        return await self.create_instance(referral)
+        return await self.create_instance(
+            referral,
+            options=REFERRAL_LOAD_PROFILES[LoadProfile.FULL],
+        )
 
     async def get_referral_by_id(self, referral_id: int) -> Optional[Referral]:
-        return await self._get_one(Referral, Referral.id == referral_id)
+        return await self._get_one(
+            Referral,
+            Referral.id == referral_id,
+            options=REFERRAL_LOAD_PROFILES[LoadProfile.FULL],
+        )
 
     async def get_referral_by_referred(self, telegram_id: int) -> Optional[Referral]:
-        return await self._get_one(Referral, Referral.referred_telegram_id == telegram_id)
+        return await self._get_one(
+            Referral,
+            Referral.referred_telegram_id == telegram_id,
+            options=REFERRAL_LOAD_PROFILES[LoadProfile.FULL],
+        )
 
     async def get_referrals_by_referrer(self, telegram_id: int) -> List[Referral]:
-        return await self._get_many(Referral, Referral.referrer_telegram_id == telegram_id)
+        return await self._get_many(
+            Referral,
+            Referral.referrer_telegram_id == telegram_id,
+            options=REFERRAL_LOAD_PROFILES[LoadProfile.FULL],
+        )
 
     async def update_referral(self, referral_id: int, **data: Any) -> Optional[Referral]:
-        return await self._update(Referral, Referral.id == referral_id, **data)
+        return await self._update(
+            Referral,
+            Referral.id == referral_id,
+            options=REFERRAL_LOAD_PROFILES[LoadProfile.FULL],
+            **data,
+        )
 
     async def count_referrals(self) -> int:
         return await self._count(Referral, Referral.id)
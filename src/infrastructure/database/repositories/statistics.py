@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Numeric, and_, distinct, extract, func, not_, or_, select
+
+from src.core.enums import SubscriptionStatus, TransactionStatus
+from src.infrastructure.database.models.sql import (
+    Promocode,
+    PromocodeActivation,
+    Subscription,
+    Transaction,
+    User,
+)
+
+from .base import BaseRepository
+
+UNLIMITED_EXPIRE_YEAR = 2099
+
+
+class StatisticsRepository(BaseRepository):
+    async def get_users_statistics(self, now: datetime) -> dict[str, Any]:
+        query = (
+            select(
+                func.count(User.id).label("total_users"),
+                func.count(User.id)
+                .filter(User.created_at > now - timedelta(days=1))
+                .label("new_users_daily"),
+                func.count(User.id)
+                .filter(User.created_at > now - timedelta(days=8))
+                .label("new_users_weekly"),
+                func.count(User.id)
+                .filter(User.created_at > now - timedelta(days=31))
+                .label("new_users_monthly"),
+                func.count(User.id)
+                .filter(User.current_subscription_id.is_not(None))
+                .label("users_with_subscription"),
+                func.count(User.id)
+                .filter(Subscription.is_trial.is_(True))
+                .label("users_with_trial"),
+                func.count(User.id).filter(User.is_blocked.is_(True)).label("blocked_users"),
+                func.count(User.id)
+                .filter(User.is_bot_blocked.is_(True))
+                .label("bot_blocked_users"),
+            )
+            .select_from(User)
+            .outerjoin(Subscription, Subscription.id == User.current_subscription_id)
+        )
+        result = await self.session.execute(query)
+        return dict(result.mappings().one())
+
+    async def count_paying_users(self) -> int:
+        query = select(func.count(distinct(Transaction.user_telegram_id))).where(
+            Transaction.status == TransactionStatus.COMPLETED,
+            self._final_amount() != 0,
+        )
+        return await self.session.scalar(query) or 0
+
+    async def get_trial_conversion(self) -> dict[str, Any]:
+        per_user = (
+            select(
+                func.bool_or(Subscription.is_trial).label("had_trial"),
+                func.bool_or(not_(Subscription.is_trial)).label("had_paid"),
+            )
+            .group_by(Subscription.user_telegram_id)
+            .subquery()
+        )
+        query = select(
+            func.count().filter(per_user.c.had_trial).label("trial_users"),
+            func.count()
+            .filter(and_(per_user.c.had_trial, per_user.c.had_paid))
+            .label("converted_from_trial"),
+        ).select_from(per_user)
+        result = await self.session.execute(query)
+        return dict(result.mappings().one())
+
+    async def get_transactions_statistics(self) -> dict[str, Any]:
+        query = select(
+            func.count(Transaction.id).label("total_transactions"),
+            func.count(Transaction.id)
+            .filter(Transaction.status == TransactionStatus.COMPLETED)
+            .label("completed_transactions"),
+            func.count(Transaction.id).filter(self._final_amount() == 0).label("free_transactions"),
+        )
+        result = await self.session.execute(query)
+        return dict(result.mappings().one())
+
+    async def get_gateways_statistics(self, now: datetime) -> list[dict[str, Any]]:
+        final_amount = self._final_amount()
+        original_amount = Transaction.pricing["original_amount"].as_string().cast(Numeric)
+
+        query = (
+            select(
+                Transaction.gateway_type.label("gateway_type"),
+                func.coalesce(func.sum(final_amount), 0).label("total"),
+                func.coalesce(
+                    func.sum(final_amount).filter(Transaction.created_at > now - timedelta(days=1)),
+                    0,
+                ).label("daily"),
+                func.coalesce(
+                    func.sum(final_amount).filter(Transaction.created_at > now - timedelta(days=8)),
+                    0,
+                ).label("weekly"),
+                func.coalesce(
+                    func.sum(final_amount).filter(
+                        Transaction.created_at > now - timedelta(days=31)
+                    ),
+                    0,
+                ).label("monthly"),
+                func.coalesce(func.sum(original_amount - final_amount), 0).label("discount"),
+                func.count(Transaction.id).filter(final_amount != 0).label("paid_count"),
+            )
+            .where(Transaction.status == TransactionStatus.COMPLETED)
+            .group_by(Transaction.gateway_type)
+            .order_by(func.min(Transaction.id))
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def get_subscriptions_statistics(self, now: datetime) -> dict[str, Any]:
+        is_active = self._is_active_subscription(now)
+        is_expired = or_(
+            Subscription.expire_at < now,
+            Subscription.status == SubscriptionStatus.EXPIRED,
+        )
+        is_unlimited = or_(
+            Subscription.device_limit <= 0,
+            Subscription.traffic_limit <= 0,
+            extract("year", Subscription.expire_at) == UNLIMITED_EXPIRE_YEAR,
+        )
+
+        query = select(
+            func.count(Subscription.id).filter(is_active).label("total_active_subscriptions"),
+            func.count(Subscription.id).filter(is_expired).label("total_expire_subscriptions"),
+            func.count(Subscription.id)
+            .filter(is_active, Subscription.is_trial.is_(True))
+            .label("active_trial_subscriptions"),
+            func.count(Subscription.id)
+            .filter(is_active, Subscription.expire_at < now + timedelta(days=8))
+            .label("expiring_subscriptions"),
+            func.count(Subscription.id).filter(is_active, is_unlimited).label("total_unlimited"),
+            func.count(Subscription.id)
+            .filter(is_active, Subscription.traffic_limit != -1)
+            .label("total_traffic"),
+            func.count(Subscription.id)
+            .filter(is_active, Subscription.device_limit != -1)
+            .label("total_devices"),
+        )
+        result = await self.session.execute(query)
+        return dict(result.mappings().one())
+
+    async def get_plans_subscriptions(self, now: datetime) -> list[dict[str, Any]]:
+        plan_id = Subscription.plan["id"].as_integer()
+        query = (
+            select(
+                plan_id.label("plan_id"),
+                Subscription.plan["duration"].as_integer().label("duration"),
+                func.count(Subscription.id).label("total"),
+                func.count(Subscription.id)
+                .filter(self._is_active_subscription(now))
+                .label("active"),
+                func.min(Subscription.id).label("first_id"),
+            )
+            .group_by(plan_id, Subscription.plan["duration"].as_integer())
+            .order_by("first_id")
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def get_plans_income(self) -> list[dict[str, Any]]:
+        plan_id = Transaction.plan["id"].as_integer()
+        query = (
+            select(
+                plan_id.label("plan_id"),
+                Transaction.currency.label("currency"),
+                func.sum(self._final_amount()).label("income"),
+            )
+            .where(
+                Transaction.status == TransactionStatus.COMPLETED,
+                func.coalesce(plan_id, 0) != 0,
+            )
+            .group_by(plan_id, Transaction.currency)
+            .order_by(func.min(Transaction.id))
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def get_promocodes_activations(self) -> list[dict[str, Any]]:
+        query = (
+            select(
+                Promocode.code.label("code"),
+                Promocode.reward_type.label("reward_type"),
+                Promocode.reward.label("reward"),
+                func.count(PromocodeActivation.id).label("activations"),
+            )
+            .outerjoin(PromocodeActivation, PromocodeActivation.promocode_id == Promocode.id)
+            .group_by(Promocode.id)
+            .order_by(Promocode.id)
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
+    @staticmethod
+    def _is_active_subscription(now: datetime) -> Any:
+        return and_(
+            Subscription.status == SubscriptionStatus.ACTIVE,
+            Subscription.expire_at >= now,
+        )
+
+    @staticmethod
+    def _final_amount() -> Any:
+        return Transaction.pricing["final_amount"].as_string().cast(Numeric)
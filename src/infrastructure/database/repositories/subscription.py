@@ -1,25 +1,78 @@
-from typing import Any, Optional
+from typing import Any, Final, Optional
 
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+
+from src.core.enums import LoadProfile
 from src.infrastructure.database.models.sql import Subscription
 
-from .base import BaseRepository
+from .base import BaseRepository, LoadOptions
+
+SUBSCRIPTION_LOAD_PROFILES: Final[dict[LoadProfile, LoadOptions]] = {
+    LoadProfile.BARE: (),
+    LoadProfile.FULL: (selectinload(Subscription.user),),
+}
 
 
 class SubscriptionRepository(BaseRepository):
     async def create(self, subscription: Subscription) -> Subscription:
         return await self.create_instance(subscription)
 
-    async def get(self, subscription_id: int) -> Optional[Subscription]:
-        return await self._get_one(Subscription, Subscription.id == subscription_id)
+    async def create_many(self, rows: list[dict[str, Any]]) -> dict[int, int]:
+        if not rows:
+            return {}
+
+        query = (
+            insert(Subscription)
+            .values(rows)
+            .returning(Subscription.user_telegram_id, Subscription.id)
+        )
+        result = await self.session.execute(query)
+        return dict(result.tuples().all())
 
-    async def get_all_by_user(self, telegram_id: int) -> list[Subscription]:
-        return await self._get_many(Subscription, Subscription.user_telegram_id == telegram_id)
+    async def get(
+        self,
+        subscription_id: int,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> Optional[Subscription]:
+        return await self._get_one(
+            Subscription,
+            Subscription.id == subscription_id,
+            options=SUBSCRIPTION_LOAD_PROFILES[profile],
+        )
 
-    async def get_all(self) -> list[Subscription]:
-        return await self._get_many(Subscription)
+    async def get_all_by_user(
+        self,
+        telegram_id: int,
+        profile: LoadProfile = LoadProfile.BARE,
+    ) -> list[Subscription]:
+        return await self._get_many(
+            Subscription,
+            Subscription.user_telegram_id == telegram_id,
+            options=SUBSCRIPTION_LOAD_PROFILES[profile],
+        )
+
+    async def get_all(self, profile: LoadProfile = LoadProfile.FULL) -> list[Subscription]:
+        return await self._get_many(Subscription, options=SUBSCRIPTION_LOAD_PROFILES[profile])
 
     async def update(self, subscription_id: int, **data: Any) -> Optional[Subscription]:
-        return await self._update(Subscription, Subscription.id == subscription_id, **data)
+        return await self._update(
+            Subscription,
+            Subscription.id == subscription_id,
+            options=SUBSCRIPTION_LOAD_PROFILES[LoadProfile.FULL],
+            **data,
+        )
+
+    async def bulk_update(self, rows: list[dict[str, Any]]) -> None:
+        await self._bulk_update(Subscription, rows)
 
-    async def filter_by_plan_id(self, plan_id: int) -> list[Subscription]:
-        return await self._get_many(Subscription, Subscription.plan["id"].as_integer() == plan_id)
+    async def filter_by_plan_id(
+        self,
+        plan_id: int,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> list[Subscription]:
+        return await self._get_many(
+            Subscription,
+            Subscription.plan["id"].as_integer() == plan_id,
+            options=SUBSCRIPTION_LOAD_PROFILES[profile],
+        )
@@ -1,30 +1,97 @@
-from typing import Any, Optional
+from datetime import timedelta
+from typing import Any, Final, Optional
 from uuid import UUID
 
-from src.core.enums import TransactionStatus
+from sqlalchemy import update
+from sqlalchemy.orm import selectinload
+
+from src.core.enums import LoadProfile, TransactionStatus
 from src.infrastructure.database.models.sql import Transaction
+from src.infrastructure.database.models.sql.timestamp import NOW_FUNC
+
+from .base import BaseRepository, LoadOptions
 
-from .base import BaseRepository
+TRANSACTION_LOAD_PROFILES: Final[dict[LoadProfile, LoadOptions]] = {
+    LoadProfile.BARE: (),
+    LoadProfile.FULL: (selectinload(Transaction.user),),
+}
 
 
 class TransactionRepository(BaseRepository):
     async def create(self, transaction: Transaction) -> Transaction:
         return await self.create_instance(transaction)
 
-    async def get(self, payment_id: UUID) -> Optional[Transaction]:
-        return await self._get_one(Transaction, Transaction.payment_id == payment_id)
+    async def get(
+        self,
+        payment_id: UUID,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> Optional[Transaction]:
+        return await self._get_one(
+            Transaction,
+            Transaction.payment_id == payment_id,
+            options=TRANSACTION_LOAD_PROFILES[profile],
+        )
 
-    async def get_by_user(self, telegram_id: int) -> list[Transaction]:
-        return await self._get_many(Transaction, Transaction.user_telegram_id == telegram_id)
+    async def get_by_user(
+        self,
+        telegram_id: int,
+        profile: LoadProfile = LoadProfile.BARE,
+    ) -> list[Transaction]:
+        return await self._get_many(
+            Transaction,
+            Transaction.user_telegram_id == telegram_id,
+            options=TRANSACTION_LOAD_PROFILES[profile],
+        )
 
-    async def get_all(self) -> list[Transaction]:
-        return await self._get_many(Transaction)
+    async def get_all(self, profile: LoadProfile = LoadProfile.FULL) -> list[Transaction]:
+        return await self._get_many(Transaction, options=TRANSACTION_LOAD_PROFILES[profile])
 
-    async def get_by_status(self, status: TransactionStatus) -> list[Transaction]:
-        return await self._get_many(Transaction, Transaction.status == status)
+    async def get_by_status(
+        self,
+        status: TransactionStatus,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> list[Transaction]:
+        return await self._get_many(
+            Transaction,
+            Transaction.status == status,
+            options=TRANSACTION_LOAD_PROFILES[profile],
+        )
 
     async def update(self, payment_id: UUID, **data: Any) -> Optional[Transaction]:
-        return await self._update(Transaction, Transaction.payment_id == payment_id, **data)
+        return await self._update(
+            Transaction,
+            Transaction.payment_id == payment_id,
+            options=TRANSACTION_LOAD_PROFILES[LoadProfile.FULL],
+            **data,
+        )
+
+    async def transition_status(
+        self,
+        payment_id: UUID,
+        status: TransactionStatus,
+        *expected: TransactionStatus,
+    ) -> bool:
+        query = (
+            update(Transaction)
+            .where(Transaction.payment_id == payment_id, Transaction.status.in_(expected))
+            .values(status=status)
+            .returning(Transaction.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def cancel_stale(self, older_than: timedelta) -> list[int]:
+        query = (
+            update(Transaction)
+            .where(
+                Transaction.status == TransactionStatus.PENDING,
+                Transaction.created_at < NOW_FUNC - older_than,
+            )
+            .values(status=TransactionStatus.CANCELED)
+            .returning(Transaction.id)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
 
     async def count(self) -> int:
         return await self._count(Transaction, Transaction.id)
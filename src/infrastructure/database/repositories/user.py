@@ -1,39 +1,203 @@
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Final, Optional
+from uuid import UUID
 
-from sqlalchemy import func, or_
+from sqlalchemy import BigInteger, Integer, column, exists, func, or_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, with_expression
 
-from src.core.enums import UserRole
-from src.infrastructure.database.models.sql import User
+from src.core.constants import REFERRAL_PREFIX, STREAM_CHUNK_SIZE, USER_SEARCH_LIMIT
+from src.core.enums import LoadProfile, UserRole
+from src.infrastructure.database.models.sql import Referral, Subscription, User
 
-from .base import BaseRepository
+from .base import BaseRepository, ConditionType, LoadOptions
+
+BIGINT_MAX: Final[int] = 2**63 - 1
+BIGINT_MAX_DIGITS: Final[int] = len(str(BIGINT_MAX))
+
+USER_LOAD_PROFILES: Final[dict[LoadProfile, LoadOptions]] = {
+    LoadProfile.BARE: (),
+    LoadProfile.WITH_CURRENT_SUBSCRIPTION: (selectinload(User.current_subscription),),
+    LoadProfile.FULL: (
+        selectinload(User.current_subscription),
+        with_expression(
+            User.has_any_subscription,
+            exists().where(Subscription.user_telegram_id == User.telegram_id),
+        ),
+        with_expression(
+            User.is_invited_user,
+            exists().where(Referral.referred_telegram_id == User.telegram_id),
+        ),
+    ),
+}
 
 
 class UserRepository(BaseRepository):
     async def create(self, user: User) -> User:
-        return await self.create_instance(user)
+        return await self.create_instance(user, options=USER_LOAD_PROFILES[LoadProfile.FULL])
+
+    async def get(
+        self,
+        telegram_id: int,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> Optional[User]:
+        return await self._get_one(
+            User,
+            User.telegram_id == telegram_id,
+            options=USER_LOAD_PROFILES[profile],
+        )
+
+    async def get_by_ids(
+        self,
+        telegram_ids: list[int],
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        return await self._get_many(
+            User,
+            User.telegram_id.in_(telegram_ids),
+            options=USER_LOAD_PROFILES[profile],
+        )
+
+    async def search_by_telegram_id_prefix(
+        self,
+        prefix: str,
+        limit: int = USER_SEARCH_LIMIT,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        is_number = prefix.isascii() and prefix.isdecimal()
+        if not is_number or prefix.startswith("0") or len(prefix) > BIGINT_MAX_DIGITS:
+            return []
+
+        # Every id starting with the prefix falls into one of [p * 10^k, (p + 1) * 10^k),
+        # so the unique btree index on telegram_id serves all of them
+        value = int(prefix)
+        ranges = []
+        scale = 1
+
+        while value * scale <= BIGINT_MAX:
+            upper = min((value + 1) * scale - 1, BIGINT_MAX)
+            ranges.append(User.telegram_id.between(value * scale, upper))
+            scale *= 10
+
+        if not ranges:
+            return []
 
-    async def get(self, telegram_id: int) -> Optional[User]:
-        return await self._get_one(User, User.telegram_id == telegram_id)
+        return await self._get_many(
+            User,
+            or_(*ranges),
+            order_by=User.telegram_id.asc(),
+            limit=limit,
+            options=USER_LOAD_PROFILES[profile],
+        )
 
-    async def get_by_ids(self, telegram_ids: list[int]) -> list[User]:
-        return await self._get_many(User, User.telegram_id.in_(telegram_ids))
+    async def search_by_text(
+        self,
+        text: str,
+        limit: int = USER_SEARCH_LIMIT,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        # ILIKE and the pg_trgm '%' operator are both served by the trigram GIN indexes
+        pattern = f"%{_escape_like(text)}%"
+        similarity = func.greatest(
+            func.similarity(User.name, text),
+            func.coalesce(func.similarity(User.username, text), 0),
+        )
+        conditions = or_(
+            User.name.ilike(pattern, escape="\\"),
+            User.username.ilike(pattern, escape="\\"),
+            User.name.op("%")(text),
+            User.username.op("%")(text),
+            User.referral_code == text.removeprefix(REFERRAL_PREFIX),
+        )
+        return await self._get_many(
+            User,
+            conditions,
+            order_by=(similarity.desc(), User.id.asc()),
+            limit=limit,
+            options=USER_LOAD_PROFILES[profile],
+        )
 
-    async def get_by_partial_name(self, query: str) -> list[User]:
-        search_pattern = f"%{query.lower()}%"
-        conditions = [
-            func.lower(User.name).like(search_pattern),
-            func.lower(User.username).like(search_pattern),
-        ]
-        return await self._get_many(User, or_(*conditions))
+    async def search_by_subscription_uuid(
+        self,
+        user_remna_id: UUID,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        return await self._get_many(
+            User,
+            User.subscriptions.any(Subscription.user_remna_id == user_remna_id),
+            options=USER_LOAD_PROFILES[profile],
+        )
 
-    async def get_by_referral_code(self, referral_code: str) -> Optional[User]:
-        return await self._get_one(User, User.referral_code == referral_code)
+    async def get_by_referral_code(
+        self,
+        referral_code: str,
+        profile: LoadProfile = LoadProfile.FULL,
+    ) -> Optional[User]:
+        return await self._get_one(
+            User,
+            User.referral_code == referral_code,
+            options=USER_LOAD_PROFILES[profile],
+        )
 
-    async def get_all(self) -> list[User]:
-        return await self._get_many(User)
+    async def get_all(
+        self,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        return await self._get_many(User, options=USER_LOAD_PROFILES[profile])
 
-    async def update(self, telegram_id: int, **data: Any) -> Optional[User]:
-        return await self._update(User, User.telegram_id == telegram_id, **data)
+    def stream(
+        self,
+        *conditions: ConditionType,
+        after_id: int = 0,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        profile: LoadProfile = LoadProfile.BARE,
+    ) -> AsyncIterator[list[User]]:
+        return self._stream_many(
+            User,
+            *conditions,
+            chunk_size=chunk_size,
+            after_id=after_id,
+            options=USER_LOAD_PROFILES[profile],
+        )
+
+    async def update(
+        self,
+        telegram_id: int,
+        load_result: bool = True,
+        **data: Any,
+    ) -> Optional[User]:
+        return await self._update(
+            User,
+            User.telegram_id == telegram_id,
+            load_result=load_result,
+            options=USER_LOAD_PROFILES[LoadProfile.FULL],
+            **data,
+        )
+
+    async def create_many_if_absent(self, rows: list[dict[str, Any]]) -> list[int]:
+        if not rows:
+            return []
+
+        query = insert(User).values(rows).on_conflict_do_nothing().returning(User.telegram_id)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def set_current_subscriptions(self, subscriptions: dict[int, int]) -> None:
+        if not subscriptions:
+            return
+
+        current = values(
+            column("telegram_id", BigInteger),
+            column("subscription_id", Integer),
+            name="current",
+        ).data(list(subscriptions.items()))
+
+        query = (
+            update(User)
+            .where(User.telegram_id == current.c.telegram_id)
+            .values(current_subscription_id=current.c.subscription_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
 
     async def delete(self, telegram_id: int) -> bool:
         return bool(await self._delete(User, User.telegram_id == telegram_id))
@@ -41,8 +205,24 @@ class UserRepository(BaseRepository):
     async def count(self) -> int:
         return await self._count(User)
 
-    async def filter_by_role(self, role: UserRole) -> list[User]:
-        return await self._get_many(User, User.role == role)
+    async def filter_by_role(
+        self,
+        role: UserRole,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        return await self._get_many(User, User.role == role, options=USER_LOAD_PROFILES[profile])
+
+    async def filter_by_blocked(
+        self,
+        blocked: bool,
+        profile: LoadProfile = LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+    ) -> list[User]:
+        return await self._get_many(
+            User,
+            User.is_blocked == blocked,
+            options=USER_LOAD_PROFILES[profile],
+        )
+
 
-    async def filter_by_blocked(self, blocked: bool) -> list[User]:
-        return await self._get_many(User, User.is_blocked == blocked)
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -6,8 +6,10 @@ from fluentogram import TranslatorHub, TranslatorRunner
 from fluentogram.storage import FileStorage
 from loguru import logger
 
+from src.bot.keyboard_registry import KeyboardRegistry
 from src.core.config import AppConfig
 from src.core.constants import USER_KEY
+from src.core.i18n.render_cache import RenderCache
 from src.infrastructure.database.models.dto import UserDto
 
 
@@ -38,6 +40,14 @@ class I18nProvider(Provider):
 
         return TranslatorHub(locales_map, root_locale=config.default_locale, storage=storage)
 
+    @provide
+    def get_keyboard_registry(self, config: AppConfig, hub: TranslatorHub) -> KeyboardRegistry:
+        return KeyboardRegistry(hub, config.locales, config.default_locale)
+
+    @provide
+    def get_render_cache(self) -> RenderCache:
+        return RenderCache()
+
     @provide(scope=Scope.REQUEST)
     def get_translator(
         self,
@@ -5,7 +5,15 @@ from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 
 from src.core.config import AppConfig
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import (
+    ActivityTracker,
+    LocalCache,
+    MessageDeleter,
+    PlanCatalogue,
+    RedisRepository,
+    RemnawaveEventStream,
+    TelegramRateLimiter,
+)
 
 
 class RedisProvider(Provider):
@@ -30,4 +38,21 @@ class RedisProvider(Provider):
         await client.close()
         await connection_pool.disconnect()
 
+    @provide
+    async def get_local_cache(self, client: Redis) -> AsyncGenerator[LocalCache, None]:
+        local_cache = LocalCache(client)
+        yield local_cache
+        await local_cache.close()
+
+    @provide
+    async def get_plan_catalogue(self, client: Redis) -> AsyncGenerator[PlanCatalogue, None]:
+        plan_catalogue = PlanCatalogue(client)
+        await plan_catalogue.start()
+        yield plan_catalogue
+        await plan_catalogue.close()
+
     redis_repository = provide(source=RedisRepository)
+    rate_limiter = provide(source=TelegramRateLimiter)
+    activity_tracker = provide(source=ActivityTracker)
+    message_deleter = provide(source=MessageDeleter)
+    remnawave_event_stream = provide(source=RemnawaveEventStream)
@@ -5,6 +5,7 @@ from src.services.broadcast import BroadcastService
 from src.services.command import CommandService
 from src.services.importer import ImporterService
 from src.services.notification import NotificationService
+from src.services.panel_sync import PanelSyncService
 from src.services.payment_gateway import PaymentGatewayService
 from src.services.plan import PlanService
 from src.services.pricing import PricingService
@@ -12,6 +13,7 @@ from src.services.promocode import PromocodeService
 from src.services.referral import ReferralService
 from src.services.remnawave import RemnawaveService
 from src.services.settings import SettingsService
+from src.services.statistics import StatisticsService
 from src.services.subscription import SubscriptionService
 from src.services.transaction import TransactionService
 from src.services.user import UserService
@@ -37,3 +39,5 @@ class ServicesProvider(Provider):
     pricing_service = provide(source=PricingService)
     importer_service = provide(source=ImporterService)
     referral_service = provide(source=ReferralService, scope=Scope.REQUEST)
+    statistics_service = provide(source=StatisticsService, scope=Scope.REQUEST)
+    panel_sync_service = provide(source=PanelSyncService, scope=Scope.REQUEST)
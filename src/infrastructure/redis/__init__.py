@@ -1,7 +1,21 @@
-from .cache import redis_cache
+from .activity import ActivityTracker
+from .cache import invalidate_cache, redis_cache
+from .event_stream import RemnawaveEventStream
+from .local_cache import LocalCache
+from .message_deleter import MessageDeleter
+from .plan_catalogue import PlanCatalogue, PlanCatalogueSnapshot
+from .rate_limiter import TelegramRateLimiter
 from .repository import RedisRepository
 
 __all__ = [
+    "ActivityTracker",
+    "invalidate_cache",
     "redis_cache",
+    "LocalCache",
+    "MessageDeleter",
+    "PlanCatalogue",
+    "PlanCatalogueSnapshot",
     "RedisRepository",
+    "RemnawaveEventStream",
+    "TelegramRateLimiter",
 ]
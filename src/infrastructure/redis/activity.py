@@ -0,0 +1,64 @@
+import time
+from typing import Final, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import RECENT_ACTIVITY_COALESCE_WINDOW, RECENT_ACTIVITY_RETENTION
+from src.core.storage.keys import RecentActivityUsersKey
+
+MAX_TRACKED_USERS: Final[int] = 10_000
+
+
+class ActivityTracker:
+    client: Redis
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+        self._key = RecentActivityUsersKey().pack()
+        self._last_written: dict[int, float] = {}
+
+    async def touch(self, telegram_id: int) -> None:
+        now = time.time()
+        last_written = self._last_written.get(telegram_id)
+
+        # Repeated updates from the same user inside the window keep the stored score
+        if last_written is not None and now - last_written < RECENT_ACTIVITY_COALESCE_WINDOW:
+            return
+
+        self._last_written[telegram_id] = now
+        if len(self._last_written) > MAX_TRACKED_USERS:
+            self._prune(now)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._key, {str(telegram_id): now})
+            pipe.zremrangebyscore(self._key, "-inf", now - RECENT_ACTIVITY_RETENTION)
+            await pipe.execute()
+
+        logger.debug(f"User '{telegram_id}' activity updated in recent cache")
+
+    async def remove(self, telegram_id: int) -> None:
+        self._last_written.pop(telegram_id, None)
+        await self.client.zrem(self._key, str(telegram_id))
+        logger.debug(f"User '{telegram_id}' removed from recent activity cache")
+
+    async def get_recent(self, limit: int, since: Optional[float] = None) -> list[int]:
+        min_score = since if since is not None else time.time() - RECENT_ACTIVITY_RETENTION
+        items = await self.client.zrevrangebyscore(
+            self._key,
+            "+inf",
+            min_score,
+            start=0,
+            num=limit,
+        )
+        return [int(item) for item in items]
+
+    async def count_active(self, period: float) -> int:
+        return int(await self.client.zcount(self._key, time.time() - period, "+inf"))
+
+    def _prune(self, now: float) -> None:
+        self._last_written = {
+            telegram_id: written_at
+            for telegram_id, written_at in self._last_written.items()
+            if now - written_at < RECENT_ACTIVITY_COALESCE_WINDOW
+        }
@@ -1,17 +1,31 @@
+import inspect
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    ParamSpec,
+    Sequence,
+    TypeVar,
+    get_type_hints,
+)
 
 from loguru import logger
 from pydantic import SecretStr, TypeAdapter
 from redis.asyncio import Redis
 from redis.typing import ExpiryT
 
-from src.core.constants import TIME_1M
+from src.core.constants import TIME_1D, TIME_1M
+from src.core.storage.key_builder import StorageKey, build_key
 from src.core.utils import json_utils
 
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
 
+CACHE_PREFIX = "cache"
+CACHE_TAG_PREFIX = "cache_tag"
+
 
 def prepare_for_cache(obj: Any) -> Any:
     if isinstance(obj, SecretStr):
@@ -23,34 +37,64 @@ def prepare_for_cache(obj: Any) -> Any:
     return obj
 
 
+def build_tag_key(tag: str) -> str:
+    return build_key(CACHE_TAG_PREFIX, tag)
+
+
+async def invalidate_cache(redis: Redis, *tags: str) -> None:
+    # Bumping a tag version makes every entry cached under the old version unreachable,
+    # stale entries are then evicted by their own ttl
+    if not tags:
+        return
+
+    async with redis.pipeline(transaction=False) as pipeline:
+        for tag in tags:
+            tag_key = build_tag_key(tag)
+            pipeline.incr(tag_key)
+            pipeline.expire(tag_key, TIME_1D)
+        await pipeline.execute()
+
+    logger.debug(f"Cache tags invalidated: {', '.join(tags)}")
+
+
 def redis_cache(
     prefix: Optional[str] = None,
     ttl: ExpiryT = TIME_1M,
+    tags: Sequence[str] = (),
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         return_type: Any = get_type_hints(func)["return"]
         type_adapter: TypeAdapter[T] = TypeAdapter(return_type)
+        signature = inspect.signature(func)
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             self: Any = args[0]
             redis: Redis = self.redis_client
 
-            # Build cache key
-            key_parts = [
-                "cache",
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+
+            # Build cache key and the tag version keys it depends on
+            key: str = build_key(
+                CACHE_PREFIX,
                 prefix or func.__name__,
-                *map(str, args[1:]),
-                *map(str, kwargs.values()),
-            ]
-            key: str = ":".join(key_parts)
+                *map(StorageKey.encode_value, arguments.values()),
+            )
+            tag_keys = [build_tag_key(tag.format(**arguments)) for tag in tags]
+            versions: list[int] = []
 
             try:
-                cached_value: Optional[bytes] = await redis.get(key)
+                cached_value, *raw_versions = await redis.mget(key, *tag_keys)
+                versions = [int(v) if v is not None else 0 for v in raw_versions]
+
                 if cached_value is not None:
-                    logger.debug(f"Cache hit: '{key}'")
-                    parsed = json_utils.decode(cached_value.decode())
-                    return type_adapter.validate_python(parsed)
+                    cached = json_utils.decode(cached_value.decode())
+                    if cached["versions"] == versions:
+                        logger.debug(f"Cache hit: '{key}'")
+                        return type_adapter.validate_python(cached["data"])
+                    logger.debug(f"Cache entry '{key}' is outdated")
             except Exception as exception:
                 logger.warning(f"Cache read failed for key '{key}': {exception}")
 
@@ -59,7 +103,8 @@ def redis_cache(
 
             try:
                 safe_result = prepare_for_cache(type_adapter.dump_python(result))
-                await redis.setex(key, ttl, json_utils.encode(safe_result))
+                cached = {"versions": versions, "data": safe_result}
+                await redis.setex(key, ttl, json_utils.encode(cached))
                 logger.debug(f"Result cached: '{key}' (ttl={ttl})")
             except Exception as exception:
                 logger.warning(f"Cache write failed for key '{key}': {exception}")
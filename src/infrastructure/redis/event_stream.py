@@ -0,0 +1,153 @@
+import json
+import socket
+import time
+from typing import Any, Optional, cast
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from src.core.constants import (
+    REMNAWAVE_EVENTS_BATCH_SIZE,
+    REMNAWAVE_EVENTS_BLOCK_TIMEOUT,
+    REMNAWAVE_EVENTS_CLAIM_IDLE,
+    REMNAWAVE_EVENTS_CLAIM_INTERVAL,
+    REMNAWAVE_EVENTS_GROUP,
+    REMNAWAVE_EVENTS_MAX_LENGTH,
+)
+from src.core.storage.keys import RemnawaveEventsKey
+
+StreamEntry = tuple[str, dict[str, str]]
+
+
+class RemnawaveEventStream:
+    client: Redis
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+        self.consumer = socket.gethostname()
+        self._key = RemnawaveEventsKey().pack()
+        self._group_ready = False
+        # Entries delivered before a restart but never acknowledged are read first
+        self._pending_cursor: Optional[str] = "0"
+        self._claim_cursor = "0-0"
+        self._next_claim_at = 0.0
+
+    async def publish(self, event: str, body: str, headers: dict[str, str], user_uuid: str) -> str:
+        entry_id = await self.client.xadd(
+            self._key,
+            {
+                "event": event,
+                "body": body,
+                "headers": json.dumps(headers),
+                "user_uuid": user_uuid,
+            },
+            maxlen=REMNAWAVE_EVENTS_MAX_LENGTH,
+            approximate=True,
+        )
+        stream_id = cast(bytes, entry_id).decode()
+        logger.debug(f"Queued Remnawave event '{event}' as '{stream_id}'")
+        return stream_id
+
+    async def read(
+        self, block: Optional[int] = REMNAWAVE_EVENTS_BLOCK_TIMEOUT
+    ) -> list[StreamEntry]:
+        await self._ensure_group()
+
+        if self._pending_cursor is not None:
+            entries = await self._read_pending()
+            if entries:
+                return entries
+
+        if time.monotonic() >= self._next_claim_at:
+            entries = await self._claim_idle()
+            if entries:
+                return entries
+
+        return self._decode(await self._read(stream_id=">", block=block))
+
+    async def ack(self, entry_ids: list[str]) -> None:
+        if not entry_ids:
+            return
+
+        async with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.xack(self._key, REMNAWAVE_EVENTS_GROUP, *entry_ids)
+            pipeline.xdel(self._key, *entry_ids)
+            await pipeline.execute()
+
+    async def _read_pending(self) -> list[StreamEntry]:
+        # Our own entries delivered before a restart but never acknowledged, walked page by page
+        messages = await self._read(stream_id=cast(str, self._pending_cursor), block=None)
+
+        if not messages:
+            self._pending_cursor = None
+            return []
+
+        self._pending_cursor = messages[-1][0].decode()
+        entries = self._decode(messages)
+        logger.info(f"Recovered '{len(entries)}' unacknowledged Remnawave events")
+        return entries
+
+    async def _claim_idle(self) -> list[StreamEntry]:
+        # Entries stuck with consumers that are gone, e.g. a container recreated with a new hostname
+        next_start, messages, *_ = await self.client.xautoclaim(
+            self._key,
+            REMNAWAVE_EVENTS_GROUP,
+            self.consumer,
+            min_idle_time=REMNAWAVE_EVENTS_CLAIM_IDLE,
+            start_id=self._claim_cursor,
+            count=REMNAWAVE_EVENTS_BATCH_SIZE,
+        )
+        self._claim_cursor = next_start.decode()
+
+        if self._claim_cursor == "0-0":
+            self._next_claim_at = time.monotonic() + REMNAWAVE_EVENTS_CLAIM_INTERVAL
+
+        entries = self._decode(messages)
+        if entries:
+            logger.info(f"Claimed '{len(entries)}' idle Remnawave events from other consumers")
+        return entries
+
+    async def _read(self, stream_id: str, block: Optional[int]) -> list[Any]:
+        response = await self.client.xreadgroup(
+            groupname=REMNAWAVE_EVENTS_GROUP,
+            consumername=self.consumer,
+            streams={self._key: stream_id},
+            count=REMNAWAVE_EVENTS_BATCH_SIZE,
+            block=block,
+        )
+
+        if not response:
+            return []
+
+        _, messages = response[0]
+        return list(messages)
+
+    @staticmethod
+    def _decode(messages: list[Any]) -> list[StreamEntry]:
+        return [
+            (
+                entry_id.decode(),
+                {key.decode(): value.decode() for key, value in fields.items()},
+            )
+            for entry_id, fields in messages
+            if fields  # Entries deleted while pending come back without fields
+        ]
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+
+        try:
+            await self.client.xgroup_create(
+                self._key,
+                REMNAWAVE_EVENTS_GROUP,
+                id="0",
+                mkstream=True,
+            )
+            logger.debug(f"Created consumer group '{REMNAWAVE_EVENTS_GROUP}' for '{self._key}'")
+        except ResponseError as exception:
+            if "BUSYGROUP" not in str(exception):
+                raise
+
+        self._group_ready = True
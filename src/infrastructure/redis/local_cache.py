@@ -0,0 +1,97 @@
+import asyncio
+import time
+from typing import Any, Final, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import TIME_1M
+
+LOCAL_CACHE_CHANNEL: Final[str] = "local_cache_invalidate"
+RECONNECT_DELAY: Final[int] = 5
+
+
+class LocalCache:
+    client: Redis
+    ttl: float
+
+    def __init__(self, client: Redis, ttl: float = TIME_1M) -> None:
+        self.client = client
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._generation = 0
+        self._subscribed = False
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        self._ensure_listener()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any, generation: int) -> None:
+        # Without a live subscription invalidations from other processes would be lost,
+        # and a value loaded before the latest invalidation must not be stored
+        if not self._subscribed or generation != self._generation:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    async def invalidate(self, key: str) -> None:
+        self._drop(key)
+        await self.client.publish(LOCAL_CACHE_CHANNEL, key)
+        logger.debug(f"Local cache '{key}' invalidated")
+
+    async def close(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+        self._subscribed = False
+        self._entries.clear()
+
+    def _drop(self, key: Optional[str] = None) -> None:
+        self._generation += 1
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(LOCAL_CACHE_CHANNEL)
+                    self._subscribed = True
+                    self._drop()
+                    logger.debug(f"Subscribed to '{LOCAL_CACHE_CHANNEL}'")
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._drop(message["data"].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                logger.warning(f"Local cache subscription lost: {exception}")
+            finally:
+                self._subscribed = False
+                self._drop()
+
+            await asyncio.sleep(RECONNECT_DELAY)
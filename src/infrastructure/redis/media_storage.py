@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from aiogram.types import ContentType
+from aiogram_dialog.api.entities import MediaId
+from aiogram_dialog.api.protocols import MediaIdStorageProtocol
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.storage.keys import MediaIdKey
+from src.core.utils import json_utils
+
+
+class RedisMediaIdStorage(MediaIdStorageProtocol):
+    client: Redis
+    bot_id: int
+
+    def __init__(self, client: Redis, bot_id: int) -> None:
+        self.client = client
+        self.bot_id = bot_id
+        self._hashes: dict[str, tuple[float, str]] = {}
+        self._media_ids: dict[str, MediaId] = {}
+
+    async def get_media_id(
+        self,
+        path: Optional[Union[str, Path]],
+        url: Optional[str],
+        type: ContentType,
+    ) -> Optional[MediaId]:
+        key = await self._get_key(path, url, type)
+        if key is None:
+            return None
+
+        media_id = self._media_ids.get(key)
+        if media_id is not None:
+            return media_id
+
+        value = await self.client.get(key)
+        if value is None:
+            return None
+
+        data = json_utils.decode(value)
+        media_id = MediaId(file_id=data["file_id"], file_unique_id=data.get("file_unique_id"))
+        self._media_ids[key] = media_id
+        return media_id
+
+    async def save_media_id(
+        self,
+        path: Optional[Union[str, Path]],
+        url: Optional[str],
+        type: ContentType,
+        media_id: MediaId,
+    ) -> None:
+        key = await self._get_key(path, url, type)
+        if key is None:
+            return
+
+        self._media_ids[key] = media_id
+        value = {"file_id": media_id.file_id, "file_unique_id": media_id.file_unique_id}
+        await self.client.set(key, json_utils.encode(value))
+        logger.debug(f"Stored media id for '{path or url}'")
+
+    async def _get_key(
+        self,
+        path: Optional[Union[str, Path]],
+        url: Optional[str],
+        type: ContentType,
+    ) -> Optional[str]:
+        if path:
+            content_hash = await self._get_content_hash(str(path))
+        elif url:
+            content_hash = hashlib.sha256(url.encode()).hexdigest()
+        else:
+            return None
+
+        if content_hash is None:
+            return None
+
+        return MediaIdKey(
+            bot_id=self.bot_id,
+            content_type=type,
+            content_hash=content_hash,
+        ).pack()
+
+    async def _get_content_hash(self, path: str) -> Optional[str]:
+        # The file is only re-read when its mtime moves, so an edited banner gets a new key
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+
+        cached = self._hashes.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        content_hash = await asyncio.to_thread(_hash_file, path)
+        self._hashes[path] = (mtime, content_hash)
+        return content_hash
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
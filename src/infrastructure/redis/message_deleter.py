@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import Final
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import (
+    DELETION_BATCH_SIZE,
+    DELETION_POLL_INTERVAL,
+    DELETION_RETRY_ATTEMPTS,
+    DELETION_RETRY_DELAY,
+)
+from src.core.storage.keys import MessageDeletionsKey
+
+from .rate_limiter import TelegramRateLimiter
+
+# KEYS[1] - deletions sorted set, ARGV[1] - now, ARGV[2] - batch size
+# Due entries are removed in the same call, so concurrent consumers never claim one twice.
+# The flip side is at-most-once delivery: entries claimed by a process that crashes before
+# deleting the messages are lost and those messages stay in the chat
+CLAIM_SCRIPT: Final[str] = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #items > 0 then
+    redis.call('ZREM', KEYS[1], unpack(items))
+end
+return items
+"""
+
+
+class MessageDeleter:
+    client: Redis
+    bot: Bot
+    rate_limiter: TelegramRateLimiter
+
+    def __init__(self, client: Redis, bot: Bot, rate_limiter: TelegramRateLimiter) -> None:
+        self.client = client
+        self.bot = bot
+        self.rate_limiter = rate_limiter
+        self._key = MessageDeletionsKey().pack()
+        self._claim = client.register_script(CLAIM_SCRIPT)
+
+    async def schedule(self, chat_id: int, message_id: int, delay: float, attempt: int = 0) -> None:
+        member = f"{chat_id}:{message_id}:{attempt}"
+        await self.client.zadd(self._key, {member: time.time() + delay})
+        logger.debug(
+            f"Scheduled message '{message_id}' for auto-deletion in '{delay}' (chat '{chat_id}')"
+        )
+
+    async def run(self) -> None:
+        logger.info("Message deletion consumer started")
+
+        while True:
+            try:
+                batch = await self._claim(keys=[self._key], args=[time.time(), DELETION_BATCH_SIZE])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                logger.warning(f"Failed to claim due message deletions: {exception}")
+                batch = []
+
+            if not batch:
+                await asyncio.sleep(DELETION_POLL_INTERVAL)
+                continue
+
+            results = await asyncio.gather(
+                *(self._delete(member.decode()) for member in batch),
+                return_exceptions=True,
+            )
+            for member, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to process deletion '{member.decode()}': {result}")
+
+    async def _delete(self, member: str) -> None:
+        chat_id, message_id, attempt = map(int, member.split(":"))
+
+        try:
+            await self.rate_limiter.acquire(chat_id=chat_id)
+            await self.bot.delete_message(chat_id=chat_id, message_id=message_id)
+            logger.debug(f"Message '{message_id}' in chat '{chat_id}' auto-deleted")
+            return
+        except (TelegramBadRequest, TelegramForbiddenError) as exception:
+            # Already deleted, too old or the user blocked the bot - nothing left to retry
+            logger.debug(f"Skipping deletion of '{message_id}' in chat '{chat_id}': {exception}")
+            return
+        except TelegramRetryAfter as exception:
+            await self.rate_limiter.pause(exception.retry_after)
+            delay: float = exception.retry_after
+        except Exception as exception:
+            logger.warning(
+                f"Failed to delete message '{message_id}' in chat '{chat_id}': {exception}"
+            )
+            delay = DELETION_RETRY_DELAY * 2**attempt
+
+        if attempt + 1 >= DELETION_RETRY_ATTEMPTS:
+            logger.error(
+                f"Giving up deleting message '{message_id}' in chat '{chat_id}' "
+                f"after '{DELETION_RETRY_ATTEMPTS}' attempts"
+            )
+            return
+
+        try:
+            await self.schedule(chat_id, message_id, delay, attempt=attempt + 1)
+        except Exception as exception:
+            logger.error(
+                f"Failed to reschedule deletion of '{message_id}' in chat '{chat_id}': {exception}"
+            )
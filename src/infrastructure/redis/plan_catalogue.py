@@ -0,0 +1,133 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, Self
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.enums import PlanAvailability
+from src.core.storage.keys import PlanCatalogueVersionKey
+from src.infrastructure.database.models.dto import PlanDto
+
+PLAN_CATALOGUE_CHANNEL: Final[str] = "plan_catalogue"
+RECONNECT_DELAY: Final[int] = 5
+
+
+@dataclass(frozen=True)
+class PlanCatalogueSnapshot:
+    version: int
+    plans: tuple[PlanDto, ...]
+    by_id: Mapping[int, PlanDto]
+    by_availability: Mapping[PlanAvailability, tuple[PlanDto, ...]]
+    by_allowed_user: Mapping[int, tuple[PlanDto, ...]]
+
+    @classmethod
+    def build(cls, version: int, plans: list[PlanDto]) -> Self:
+        ordered = tuple(sorted(plans, key=lambda p: p.order_index))
+        by_availability: dict[PlanAvailability, list[PlanDto]] = {}
+        by_allowed_user: dict[int, list[PlanDto]] = {}
+
+        for plan in ordered:
+            by_availability.setdefault(plan.availability, []).append(plan)
+            for telegram_id in plan.allowed_user_ids:
+                by_allowed_user.setdefault(telegram_id, []).append(plan)
+
+        return cls(
+            version=version,
+            plans=ordered,
+            by_id=MappingProxyType({plan.id: plan for plan in ordered if plan.id is not None}),
+            by_availability=MappingProxyType({k: tuple(v) for k, v in by_availability.items()}),
+            by_allowed_user=MappingProxyType({k: tuple(v) for k, v in by_allowed_user.items()}),
+        )
+
+
+class PlanCatalogue:
+    client: Redis
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+        self._key = PlanCatalogueVersionKey().pack()
+        self._snapshot: Optional[PlanCatalogueSnapshot] = None
+        self._latest_version = 0
+        self._subscribed = asyncio.Event()
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    @property
+    def snapshot(self) -> Optional[PlanCatalogueSnapshot]:
+        self._ensure_listener()
+
+        # Without a live subscription a bump from another process could be missed
+        if not self._subscribed.is_set():
+            return None
+
+        return self._snapshot
+
+    async def start(self) -> None:
+        # Subscribe up front, otherwise the first snapshot loaded would not be kept
+        self._ensure_listener()
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._subscribed.wait(), timeout=RECONNECT_DELAY)
+
+    async def get_version(self) -> int:
+        value = await self.client.get(self._key)
+        return int(value) if value is not None else 0
+
+    def install(self, snapshot: PlanCatalogueSnapshot) -> None:
+        # A bump announced while the snapshot was being loaded makes it outdated already
+        if not self._subscribed.is_set() or snapshot.version < self._latest_version:
+            return
+
+        self._snapshot = snapshot
+        logger.debug(
+            f"Plan catalogue v{snapshot.version} installed with '{len(snapshot.plans)}' plans"
+        )
+
+    async def bump(self) -> int:
+        version = int(await self.client.incr(self._key))
+        self._drop(version)
+        await self.client.publish(PLAN_CATALOGUE_CHANNEL, version)
+        logger.info(f"Plan catalogue version bumped to '{version}'")
+        return version
+
+    async def close(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+        self._subscribed.clear()
+        self._snapshot = None
+
+    def _drop(self, version: Optional[int] = None) -> None:
+        if version is not None:
+            self._latest_version = max(self._latest_version, version)
+
+        if version is None or (self._snapshot and self._snapshot.version < version):
+            self._snapshot = None
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(PLAN_CATALOGUE_CHANNEL)
+                    self._drop()
+                    self._subscribed.set()
+                    logger.debug(f"Subscribed to '{PLAN_CATALOGUE_CHANNEL}'")
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._drop(int(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                logger.warning(f"Plan catalogue subscription lost: {exception}")
+            finally:
+                self._subscribed.clear()
+                self._drop()
+
+            await asyncio.sleep(RECONNECT_DELAY)
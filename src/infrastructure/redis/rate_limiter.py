@@ -0,0 +1,109 @@
+import asyncio
+from typing import Final, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.exceptions import RateLimitTimeoutError
+from src.core.storage.keys import SendBucketKey, SendPauseKey
+
+GLOBAL_BUCKET: Final[str] = "global"
+
+# KEYS[1] - global bucket, KEYS[2] - chat bucket, KEYS[3] - flood pause
+# ARGV: global rate, global capacity, chat rate, chat capacity (rates in tokens/sec)
+# Returns 0 when a token was taken from both buckets, otherwise milliseconds to wait
+ACQUIRE_SCRIPT: Final[str] = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local paused_until = tonumber(redis.call('GET', KEYS[3]) or '0')
+if paused_until > now then
+    return paused_until - now
+end
+
+local function refill(key, rate, capacity)
+    local data = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    return math.min(capacity, tokens + (now - ts) * rate / 1000)
+end
+
+local global_rate, global_capacity = tonumber(ARGV[1]), tonumber(ARGV[2])
+local chat_rate, chat_capacity = tonumber(ARGV[3]), tonumber(ARGV[4])
+
+local global_tokens = refill(KEYS[1], global_rate, global_capacity)
+local chat_tokens = refill(KEYS[2], chat_rate, chat_capacity)
+
+if global_tokens < 1 then
+    return math.ceil((1 - global_tokens) * 1000 / global_rate)
+end
+if chat_tokens < 1 then
+    return math.ceil((1 - chat_tokens) * 1000 / chat_rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', global_tokens - 1, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(global_capacity * 1000 / global_rate) + 1000)
+redis.call('HSET', KEYS[2], 'tokens', chat_tokens - 1, 'ts', now)
+redis.call('PEXPIRE', KEYS[2], math.ceil(chat_capacity * 1000 / chat_rate) + 1000)
+return 0
+"""
+
+# KEYS[1] - flood pause, ARGV[1] - pause duration in milliseconds
+PAUSE_SCRIPT: Final[str] = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local until_ts = now + tonumber(ARGV[1])
+
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if until_ts > current then
+    redis.call('SET', KEYS[1], until_ts, 'PX', tonumber(ARGV[1]))
+end
+return until_ts
+"""
+
+
+class TelegramRateLimiter:
+    config: AppConfig
+    client: Redis
+
+    def __init__(self, config: AppConfig, client: Redis) -> None:
+        self.config = config
+        self.client = client
+        self._acquire = client.register_script(ACQUIRE_SCRIPT)
+        self._pause = client.register_script(PAUSE_SCRIPT)
+
+    async def acquire(self, chat_id: int, timeout: Optional[float] = None) -> float:
+        bot_config = self.config.bot
+        keys = [
+            SendBucketKey(bucket=GLOBAL_BUCKET).pack(),
+            SendBucketKey(bucket=str(chat_id)).pack(),
+            SendPauseKey().pack(),
+        ]
+        args = [
+            bot_config.send_rate_limit,
+            bot_config.send_rate_limit,
+            bot_config.chat_send_rate_limit,
+            bot_config.chat_send_burst,
+        ]
+
+        waited = 0.0
+        while True:
+            wait_ms = int(await self._acquire(keys=keys, args=args))
+            if wait_ms <= 0:
+                if waited:
+                    logger.debug(f"Send slot for chat '{chat_id}' acquired after {waited:.2f}s")
+                return waited
+
+            delay = wait_ms / 1000
+            if timeout is not None and waited + delay > timeout:
+                raise RateLimitTimeoutError(
+                    f"Send slot for chat '{chat_id}' not available within {timeout}s"
+                )
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+    async def pause(self, retry_after: float) -> None:
+        logger.warning(f"Telegram flood control hit, pausing all sends for {retry_after}s")
+        await self._pause(keys=[SendPauseKey().pack()], args=[int(retry_after * 1000)])
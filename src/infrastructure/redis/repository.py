@@ -38,6 +38,13 @@ class RedisRepository:
             value = value.model_dump(exclude_defaults=True)
         await self.client.set(name=key.pack(), value=json_utils.encode(value), ex=ex)
 
+    async def set_if_absent(
+        self, key: StorageKey, value: Any, ex: Optional[ExpiryT] = None
+    ) -> bool:
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude_defaults=True)
+        return bool(await self.client.set(key.pack(), json_utils.encode(value), ex=ex, nx=True))
+
     async def exists(self, key: StorageKey) -> bool:
         return cast(bool, await self.client.exists(key.pack()))
 
@@ -95,3 +102,16 @@ class RedisRepository:
     async def sorted_collection_remove(self, key: StorageKey, *values: Any) -> int:
         str_values = [str(v) for v in values]
         return await cast(Awaitable[int], self.client.zrem(key.pack(), *str_values))
+
+    #
+
+    async def hash_set(self, key: StorageKey, mapping: dict[str, Any]) -> int:
+        str_mapping = {k: str(v) for k, v in mapping.items()}
+        return await cast(Awaitable[int], self.client.hset(key.pack(), mapping=str_mapping))
+
+    async def hash_get_all(self, key: StorageKey) -> dict[str, str]:
+        items_bytes = await cast(Awaitable[dict[bytes, bytes]], self.client.hgetall(key.pack()))
+        return {k.decode(): v.decode() for k, v in items_bytes.items()}
+
+    async def expire(self, key: StorageKey, ex: ExpiryT) -> None:
+        await self.client.expire(key.pack(), ex)
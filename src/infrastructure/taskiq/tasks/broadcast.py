@@ -2,54 +2,67 @@ import asyncio
 from typing import Optional, cast
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 
+from src.core.constants import BATCH_SIZE
 from src.core.enums import BroadcastMessageStatus, BroadcastStatus
 from src.core.utils.iterables import chunked
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import BroadcastDto, BroadcastMessageDto, UserDto
+from src.infrastructure.redis import TelegramRateLimiter
 from src.infrastructure.taskiq.broker import broker
 from src.services.broadcast import BroadcastService
 from src.services.notification import NotificationService
 
 
-@broker.task
+@broker.task(retry_on_error=True)
 @inject
-async def send_broadcast_task(
+async def send_broadcast_task(  # noqa: C901
     broadcast: BroadcastDto,
-    users: list[UserDto],
+    plan_id: Optional[int],
     payload: MessagePayload,
     notification_service: FromDishka[NotificationService],
     broadcast_service: FromDishka[BroadcastService],
 ) -> None:
     broadcast_id = cast(int, broadcast.id)
-    total_users = len(users)
     loop = asyncio.get_running_loop()
     start_time = loop.time()
 
-    logger.info(f"Started sending broadcast '{broadcast_id}', total users: {total_users}")
+    checkpoint = await broadcast_service.get_checkpoint(broadcast.task_id)
 
-    try:
-        broadcast_messages = await broadcast_service.create_messages(
-            broadcast_id,
-            [
-                BroadcastMessageDto(user_id=user.telegram_id, status=BroadcastMessageStatus.PENDING)
-                for user in users
-            ],
-        )
-        logger.debug(
-            f"Created '{len(broadcast_messages)}' message DTOs for broadcast '{broadcast_id}'"
+    if not checkpoint or checkpoint.status != BroadcastStatus.PROCESSING:
+        logger.info(
+            f"Broadcast '{broadcast_id}' is not processing "
+            f"('{checkpoint.status if checkpoint else None}'), nothing to send"
         )
-    except Exception:
-        logger.exception(f"Failed to create message DTOs for broadcast '{broadcast_id}'")
-        broadcast.status = BroadcastStatus.ERROR
-        await broadcast_service.update(broadcast)
         return
 
+    broadcast = checkpoint
+    after_id = broadcast.last_user_id or 0
+
+    if after_id:
+        logger.info(
+            f"Resuming broadcast '{broadcast_id}' after user '{after_id}' "
+            f"(sent: {broadcast.success_count}, failed: {broadcast.failed_count})"
+        )
+    else:
+        logger.info(
+            f"Started sending broadcast '{broadcast_id}' to audience '{broadcast.audience}' "
+            f"(plan={plan_id}), total users: {broadcast.total_count}"
+        )
+
+    # Text and keyboard only depend on the locale, so they are rendered once per locale
+    rendered = notification_service.prerender(payload, notification_service.config.locales)
+
     async def send_message(user: UserDto, message: BroadcastMessageDto) -> None:
         try:
-            tg_message = await notification_service.notify_user(user=user, payload=payload)
+            tg_message = await notification_service.notify_user(
+                user=user,
+                payload=payload,
+                rendered=rendered.get(user.language),
+            )
             if tg_message:
                 message.message_id = tg_message.message_id
                 message.status = BroadcastMessageStatus.SENT
@@ -61,43 +74,80 @@ async def send_broadcast_task(
             )
             message.status = BroadcastMessageStatus.FAILED
 
-    user_message_pairs = list(zip(users, broadcast_messages))
     last_known_status: Optional[BroadcastStatus] = broadcast.status
+    batch_number = 0
 
-    for i, batch in enumerate(chunked(user_message_pairs, 20), start=1):
-        batch_start = loop.time()
+    users_pages = broadcast_service.iter_audience_users(
+        broadcast.audience,
+        plan_id=plan_id,
+        after_id=after_id,
+    )
+
+    async for users in users_pages:
+        broadcast_messages = await broadcast_service.prepare_messages(
+            broadcast_id,
+            [user.telegram_id for user in users],
+        )
+        user_message_pairs = list(zip(users, broadcast_messages))
+
+        for batch in chunked(user_message_pairs, BATCH_SIZE):
+            batch_number += 1
+            batch_start = loop.time()
+
+            last_known_status = await broadcast_service.get_status(broadcast.task_id)
+            if last_known_status == BroadcastStatus.CANCELED:
+                break
+
+            pending = [(u, m) for u, m in batch if m.status == BroadcastMessageStatus.PENDING]
+            interrupted = [m for _, m in batch if m.status == BroadcastMessageStatus.SENDING]
+
+            if interrupted:
+                # Claimed by a run that died mid-batch: delivery is unknown, so they are settled
+                # as failed instead of being sent again, and the totals still add up
+                logger.warning(
+                    f"Marking '{len(interrupted)}' messages of broadcast '{broadcast_id}' "
+                    "left claimed by an interrupted run as failed"
+                )
+                for message in interrupted:
+                    message.status = BroadcastMessageStatus.FAILED
+
+                await broadcast_service.bulk_update_messages(interrupted)
+                broadcast.failed_count += len(interrupted)
+                # Rows and counter are committed together, a second crash cannot lose the count
+                await broadcast_service.save_checkpoint(broadcast)
+
+            if pending:
+                await broadcast_service.claim_messages([m for _, m in pending])
+                tasks = [send_message(u, m) for u, m in pending]
+                await asyncio.gather(*tasks)
+                await broadcast_service.bulk_update_messages([m for _, m in pending])
+
+                broadcast.success_count += sum(
+                    1 for _, m in pending if m.status == BroadcastMessageStatus.SENT
+                )
+                broadcast.failed_count += sum(
+                    1 for _, m in pending if m.status == BroadcastMessageStatus.FAILED
+                )
+
+            broadcast.last_user_id = cast(int, batch[-1][0].id)
+            await broadcast_service.save_checkpoint(broadcast)
+
+            batch_elapsed = loop.time() - batch_start
+            logger.info(
+                f"Batch {batch_number}: sent {len(pending)} messages "
+                f"({len(batch) - len(pending)} already processed) in {batch_elapsed:.2f}s"
+            )
 
-        last_known_status = await broadcast_service.get_status(broadcast.task_id)
         if last_known_status == BroadcastStatus.CANCELED:
             break
 
-        tasks = [send_message(u, m) for u, m in batch]
-        await asyncio.gather(*tasks)
-
-        _, messages_batch = zip(*batch)
-        await broadcast_service.bulk_update_messages(list(messages_batch))
-
-        batch_elapsed = loop.time() - batch_start
-        logger.info(f"Batch {i}: sent {len(batch)} messages in {batch_elapsed:.2f}s")
-
-        wait_time = 1.0 - batch_elapsed
-        if wait_time > 0:
-            await asyncio.sleep(wait_time)
-
-    broadcast.success_count = sum(
-        1 for m in broadcast_messages if m.status == BroadcastMessageStatus.SENT
-    )
-    broadcast.failed_count = sum(
-        1 for m in broadcast_messages if m.status == BroadcastMessageStatus.FAILED
-    )
-
     broadcast.status = (
         BroadcastStatus.CANCELED
         if last_known_status == BroadcastStatus.CANCELED
         else BroadcastStatus.COMPLETED
     )
 
-    await broadcast_service.update(broadcast)
+    await broadcast_service.save_checkpoint(broadcast)
 
     total_elapsed = loop.time() - start_time
     logger.info(
@@ -111,6 +161,7 @@ async def send_broadcast_task(
 async def delete_broadcast_task(
     broadcast: BroadcastDto,
     bot: FromDishka[Bot],
+    rate_limiter: FromDishka[TelegramRateLimiter],
     broadcast_service: FromDishka[BroadcastService],
 ) -> tuple[int, int, int]:
     broadcast_id = cast(int, broadcast.id)
@@ -137,16 +188,20 @@ async def delete_broadcast_task(
             return message
 
         try:
+            await rate_limiter.acquire(chat_id=user_id)
             deleted = await bot.delete_message(chat_id=user_id, message_id=message_id)
             if deleted:
                 message.status = BroadcastMessageStatus.DELETED
             else:
                 logger.debug(f"Deletion FAILED for user '{user_id}'. ID: '{message_id}'")
+        except TelegramRetryAfter as exception:
+            logger.warning(f"Flood control while deleting message for user '{user_id}'")
+            await rate_limiter.pause(exception.retry_after)
         except Exception:
             logger.exception(f"Exception deleting message for user '{user_id}'. ID: '{message_id}'")
         return message
 
-    for i, batch in enumerate(chunked(broadcast.messages, 20), start=1):
+    for i, batch in enumerate(chunked(broadcast.messages, BATCH_SIZE), start=1):
         batch_start = loop.time()
         tasks = [delete_message(m) for m in batch]
         results = await asyncio.gather(*tasks)
@@ -158,10 +213,6 @@ async def delete_broadcast_task(
         batch_elapsed = loop.time() - batch_start
         logger.info(f"Batch {i}: processed {len(batch)} messages in {batch_elapsed:.2f}s")
 
-        wait_time = 1.0 - batch_elapsed
-        if wait_time > 0:
-            await asyncio.sleep(wait_time)
-
     total_elapsed = loop.time() - start_time
     logger.info(
         f"Deletion finished for broadcast '{broadcast_id}'. "
@@ -1,125 +1,225 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Final, Optional
 from uuid import UUID
 
 from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 from remnapy import RemnawaveSDK
 from remnapy.exceptions import BadRequestError
-from remnapy.models import CreateUserRequestDto, UserResponseDto
-
-from src.core.storage.keys import SyncRunningKey
+from remnapy.models import CreateUserRequestDto
+
+from src.core.constants import (
+    IMPORT_CHECKPOINT_SIZE,
+    IMPORT_ERROR_BACKOFF,
+    IMPORT_INITIAL_CONCURRENCY,
+    IMPORT_MAX_CONCURRENCY,
+    IMPORT_TARGET_LATENCY,
+    PROGRESS_UPDATE_INTERVAL,
+    TIME_1D,
+)
+from src.core.storage.keys import ImportCheckpointKey, SyncRunningKey
+from src.core.utils.concurrency import AdaptiveConcurrency
+from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.redis.repository import RedisRepository
 from src.infrastructure.taskiq.broker import broker
-from src.services.remnawave import RemnawaveService
-from src.services.subscription import SubscriptionService
+from src.services.notification import NotificationService
+from src.services.panel_sync import SYNC_COUNTERS, PanelSyncService
 from src.services.user import UserService
 
+IMPORT_SUCCESS: Final[str] = "1"
+IMPORT_FAILED: Final[str] = "0"
+
 
 @broker.task(retry_on_error=False)
 @inject
 async def import_exported_users_task(
     imported_users: list[dict],
     active_internal_squads: list[UUID],
+    user: UserDto,
+    notification_id: Optional[int],
     remnawave: FromDishka[RemnawaveSDK],
+    redis_repository: FromDishka[RedisRepository],
+    notification_service: FromDishka[NotificationService],
 ) -> tuple[int, int]:
-    logger.info(f"Starting import of '{len(imported_users)}' users")
-
-    success_count = 0
-    failed_count = 0
-
-    for user in imported_users:
-        try:
-            username = user["username"]
-            created_user = CreateUserRequestDto.model_validate(user)
-            created_user.active_internal_squads = active_internal_squads
-            await remnawave.users.create_user(created_user)
-            success_count += 1
-        except BadRequestError as error:
-            logger.warning(f"User '{username}' already exists, skipping. Error: {error}")
-            failed_count += 1
-
-        except Exception as exception:
-            logger.exception(f"Failed to create user '{username}' exception: {exception}")
-            failed_count += 1
+    key = ImportCheckpointKey(import_id=get_import_id(imported_users, active_internal_squads))
+    checkpoint = await redis_repository.hash_get_all(key)
+
+    success_count = sum(1 for outcome in checkpoint.values() if outcome == IMPORT_SUCCESS)
+    failed_count = len(checkpoint) - success_count
+    pending_users = [u for u in imported_users if u["username"] not in checkpoint]
+
+    if checkpoint:
+        logger.info(f"Resuming import '{key.import_id}' after '{len(checkpoint)}' processed users")
+
+    logger.info(f"Starting import of '{len(pending_users)}' users")
+
+    limiter = AdaptiveConcurrency(
+        initial=IMPORT_INITIAL_CONCURRENCY,
+        maximum=IMPORT_MAX_CONCURRENCY,
+        target_latency=IMPORT_TARGET_LATENCY,
+    )
+    outcomes: dict[str, str] = {}
+    # Transient failures stay out of the checkpoint, so the next run retries them
+    retryable: set[str] = set()
+    tasks: set[asyncio.Task[None]] = set()
+    last_progress_at = time.monotonic()
+
+    for imported_user in pending_users:
+        await limiter.acquire()
+        task = asyncio.create_task(
+            _create_user(
+                remnawave,
+                limiter,
+                imported_user,
+                active_internal_squads,
+                outcomes,
+                retryable,
+            )
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+        if len(outcomes) < IMPORT_CHECKPOINT_SIZE:
+            continue
+
+        succeeded, failed = await _save_checkpoint(redis_repository, key, outcomes)
+        success_count += succeeded
+        failed_count += failed
+
+        if notification_id and time.monotonic() - last_progress_at >= PROGRESS_UPDATE_INTERVAL:
+            last_progress_at = time.monotonic()
+            await notification_service.edit_notification(
+                user=user,
+                message_id=notification_id,
+                payload=MessagePayload.not_deleted(
+                    i18n_key="ntf-importer-import-progress",
+                    i18n_kwargs={
+                        "processed": success_count + failed_count + len(retryable),
+                        "total": len(imported_users),
+                    },
+                ),
+            )
+
+    await asyncio.gather(*tasks)
+    succeeded, failed = await _save_checkpoint(redis_repository, key, outcomes)
+    success_count += succeeded
+    failed_count += failed + len(retryable)
+
+    if retryable:
+        logger.warning(f"'{len(retryable)}' users failed transiently, keeping import checkpoint")
+    else:
+        await redis_repository.delete(key)
 
     logger.info(f"Import completed: '{success_count}' successful, '{failed_count}' failed")
     return success_count, failed_count
 
 
-@broker.task(retry_on_error=False)
-@inject
-async def sync_all_users_from_panel_task(
-    redis_repository: FromDishka[RedisRepository],
-    remnawave: FromDishka[RemnawaveSDK],
-    remnawave_service: FromDishka[RemnawaveService],
-    user_service: FromDishka[UserService],
-    subscription_service: FromDishka[SubscriptionService],
-) -> dict[str, int]:
-    key = SyncRunningKey()
-    all_remna_users: list[UserResponseDto] = []
-    start = 0
-    size = 50
+def get_import_id(imported_users: list[dict], active_internal_squads: list[UUID]) -> str:
+    payload = json.dumps(
+        [sorted(u["username"] for u in imported_users), sorted(map(str, active_internal_squads))]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
 
-    stats = await remnawave.system.get_stats()
-    total_users = stats.users.total_users
+async def _create_user(
+    remnawave: RemnawaveSDK,
+    limiter: AdaptiveConcurrency,
+    user: dict,
+    active_internal_squads: list[UUID],
+    outcomes: dict[str, str],
+    retryable: set[str],
+) -> None:
+    username = user["username"]
+    started_at = time.monotonic()
+    healthy = True
 
-    for start in range(0, total_users, size):
-        response = await remnawave.users.get_all_users(start=start, size=size)
-        if not response.users:
-            break
+    try:
+        created_user = CreateUserRequestDto.model_validate(user)
+        created_user.active_internal_squads = active_internal_squads
+        await remnawave.users.create_user(created_user)
+        outcomes[username] = IMPORT_SUCCESS
+    except BadRequestError as error:
+        logger.warning(f"User '{username}' already exists, skipping. Error: {error}")
+        outcomes[username] = IMPORT_FAILED
+    except Exception as exception:
+        logger.exception(f"Failed to create user '{username}' exception: {exception}")
+        retryable.add(username)
+        healthy = False
+        await asyncio.sleep(IMPORT_ERROR_BACKOFF)
+    finally:
+        await limiter.release(time.monotonic() - started_at, healthy)
 
-        all_remna_users.extend(response.users)
-        start += len(response.users)
 
-        if len(response.users) < size:
-            break
+async def _save_checkpoint(
+    redis_repository: RedisRepository,
+    key: ImportCheckpointKey,
+    outcomes: dict[str, str],
+) -> tuple[int, int]:
+    # Taken in one step without awaits, so workers finishing meanwhile land in the next batch
+    batch = dict(outcomes)
+    outcomes.clear()
 
-    bot_users = await user_service.get_all()
-    bot_users_map = {user.telegram_id: user for user in bot_users}
+    if not batch:
+        return 0, 0
 
-    logger.info(f"Total users in panel: '{len(all_remna_users)}'")
-    logger.info(f"Total users in bot: '{len(bot_users)}'")
+    await redis_repository.hash_set(key, batch)
+    await redis_repository.expire(key, TIME_1D)
 
-    added_users = 0
-    added_subscription = 0
-    updated = 0
-    errors = 0
-    missing_telegram = 0
+    succeeded = sum(1 for outcome in batch.values() if outcome == IMPORT_SUCCESS)
+    return succeeded, len(batch) - succeeded
+
+
+@broker.task(retry_on_error=False)
+@inject
+async def sync_all_users_from_panel_task(
+    user: UserDto,
+    notification_id: Optional[int],
+    redis_repository: FromDishka[RedisRepository],
+    panel_sync_service: FromDishka[PanelSyncService],
+    user_service: FromDishka[UserService],
+    notification_service: FromDishka[NotificationService],
+) -> dict[str, int]:
+    key = SyncRunningKey()
 
     try:
-        for remna_user in all_remna_users:
-            try:
-                if not remna_user.telegram_id:
-                    missing_telegram += 1
-                    continue
-
-                user = bot_users_map.get(remna_user.telegram_id)
-
-                if not user:
-                    await remnawave_service.sync_user(remna_user)
-                    added_users += 1
-                else:
-                    current_subscription = await subscription_service.get_current(user.telegram_id)
-                    if not current_subscription:
-                        await remnawave_service.sync_user(remna_user)
-                        added_subscription += 1
-                    else:
-                        await remnawave_service.sync_user(remna_user)
-                        updated += 1
-
-            except Exception as exception:
-                logger.exception(
-                    f"Error syncing RemnaUser '{remna_user.telegram_id}' exception: {exception}"
+        total_panel_users = await panel_sync_service.get_panel_users_count()
+        total_bot_users = await user_service.count()
+
+        logger.info(f"Total users in panel: '{total_panel_users}'")
+        logger.info(f"Total users in bot: '{total_bot_users}'")
+
+        counters = dict.fromkeys(SYNC_COUNTERS, 0)
+        processed = 0
+        last_progress_at = time.monotonic()
+
+        async for page in panel_sync_service.iter_panel_pages(total_panel_users):
+            page_result = await panel_sync_service.sync_page(page)
+            processed += len(page)
+
+            for name, value in page_result.items():
+                counters[name] += value
+
+            if notification_id and (
+                time.monotonic() - last_progress_at >= PROGRESS_UPDATE_INTERVAL
+            ):
+                last_progress_at = time.monotonic()
+                await notification_service.edit_notification(
+                    user=user,
+                    message_id=notification_id,
+                    payload=MessagePayload.not_deleted(
+                        i18n_key="ntf-importer-sync-progress",
+                        i18n_kwargs={"processed": processed, "total": total_panel_users},
+                    ),
                 )
-                errors += 1
 
         result = {
-            "total_panel_users": len(all_remna_users),
-            "total_bot_users": len(bot_users),
-            "added_users": added_users,
-            "added_subscription": added_subscription,
-            "updated": updated,
-            "errors": errors,
-            "missing_telegram": missing_telegram,
+            "total_panel_users": processed,
+            "total_bot_users": total_bot_users,
+            **counters,
         }
 
         logger.info(f"Sync users summary: '{result}'")
@@ -1,13 +1,9 @@
-import asyncio
 from typing import Any, Union, cast
 
 from aiogram.types import BufferedInputFile
 from dishka.integrations.taskiq import FromDishka, inject
 
-from src.bot.keyboards import get_buy_keyboard, get_renew_keyboard
-from src.core.constants import BATCH_DELAY, BATCH_SIZE
-from src.core.enums import MediaType, UserNotificationType
-from src.core.utils.iterables import chunked
+from src.core.enums import KeyboardName, MediaType, UserNotificationType
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import RemnaUserDto
 from src.infrastructure.taskiq.broker import broker
@@ -39,18 +35,16 @@ async def send_access_opened_notifications_task(
     user_service: FromDishka[UserService],
     notification_service: FromDishka[NotificationService],
 ) -> None:
-    for batch in chunked(waiting_user_ids, BATCH_SIZE):
-        for user_telegram_id in batch:
-            user = await user_service.get(user_telegram_id)
-            await notification_service.notify_user(
-                user=user,
-                payload=MessagePayload(
-                    i18n_key="ntf-access-allowed",
-                    auto_delete_after=None,
-                    add_close_button=True,
-                ),
-            )
-        await asyncio.sleep(BATCH_DELAY)
+    for user_telegram_id in waiting_user_ids:
+        user = await user_service.get(user_telegram_id)
+        await notification_service.notify_user(
+            user=user,
+            payload=MessagePayload(
+                i18n_key="ntf-access-allowed",
+                auto_delete_after=None,
+                add_close_button=True,
+            ),
+        )
 
 
 @broker.task(retry_on_error=True)
@@ -90,14 +84,14 @@ async def send_subscription_expire_notification_task(
         raise ValueError(f"Current subscription for user '{telegram_id}' not found")
 
     i18n_kwargs_extra.update({"is_trial": user.current_subscription.is_trial})
-    keyboard = get_buy_keyboard() if user.current_subscription.is_trial else get_renew_keyboard()
+    keyboard = KeyboardName.BUY if user.current_subscription.is_trial else KeyboardName.RENEW
 
     await notification_service.notify_user(
         user=user,
         payload=MessagePayload(
             i18n_key=i18n_key,
             i18n_kwargs={**i18n_kwargs, **i18n_kwargs_extra},
-            reply_markup=keyboard,
+            keyboard=keyboard,
             auto_delete_after=None,
             add_close_button=True,
         ),
@@ -128,14 +122,14 @@ async def send_subscription_limited_notification_task(
         "reset_time": user.current_subscription.get_expire_time,
     }
 
-    keyboard = get_buy_keyboard() if user.current_subscription.is_trial else get_renew_keyboard()
+    keyboard = KeyboardName.BUY if user.current_subscription.is_trial else KeyboardName.RENEW
 
     await notification_service.notify_user(
         user=user,
         payload=MessagePayload(
             i18n_key="ntf-event-user-limited",
             i18n_kwargs={**i18n_kwargs, **i18n_kwargs_extra},
-            reply_markup=keyboard,
+            keyboard=keyboard,
             auto_delete_after=None,
             add_close_button=True,
         ),
@@ -6,8 +6,7 @@ from loguru import logger
 from packaging.version import Version
 
 from src.__version__ import __version__ as local_version
-from src.bot.keyboards import get_remnashop_update_keyboard
-from src.core.enums import SystemNotificationType
+from src.core.enums import KeyboardName, SystemNotificationType
 from src.core.storage.keys import LastNotifiedVersionKey
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.redis.repository import RedisRepository
@@ -60,7 +59,7 @@ async def check_bot_update(
                         "local_version": local_version,
                         "remote_version": remote_version,
                     },
-                    reply_markup=get_remnashop_update_keyboard(),
+                    keyboard=KeyboardName.REMNASHOP_UPDATE,
                 ),
             )
         elif rv == lv:
@@ -11,10 +11,12 @@ from fastapi import FastAPI
 from loguru import logger
 
 from src.__version__ import __version__
-from src.api.endpoints import TelegramWebhookEndpoint
+from src.api.endpoints import TelegramWebhookEndpoint, consume_remnawave_events
+from src.bot.keyboard_registry import KeyboardRegistry
 from src.core.config.app import AppConfig
 from src.core.enums import SystemNotificationType
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis import MessageDeleter, PlanCatalogue
 from src.infrastructure.taskiq.tasks.updates import check_bot_update
 from src.services.command import CommandService
 from src.services.notification import NotificationService
@@ -57,6 +59,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             ),
         )
 
+    # Static keyboards are translated once here instead of on the first notification
+    await container.get(KeyboardRegistry)
     await command_service.setup()
     await telegram_webhook_endpoint.startup()
 
@@ -89,6 +93,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         <yellow>Registration allowed: '{settings.registration_allowed}'</>
         """  # noqa: W605
     )
+    await container.get(PlanCatalogue)  # Subscribes to plan version bumps before any read
+    message_deleter: MessageDeleter = await container.get(MessageDeleter)
+    message_deleter_task = asyncio.create_task(message_deleter.run())
+    remnawave_events_task = asyncio.create_task(consume_remnawave_events(container))
+
     await check_bot_update.kiq()
     await notification_service.remnashop_notify()
     await asyncio.sleep(2)
@@ -128,6 +137,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         payload=MessagePayload.not_deleted(i18n_key="ntf-event-bot-shutdown"),
     )
 
+    message_deleter_task.cancel()
+    remnawave_events_task.cancel()
     await telegram_webhook_endpoint.shutdown()
     await command_service.delete()
     await webhook_service.delete()
@@ -1,15 +1,17 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from aiogram import Bot
 from fluentogram import TranslatorHub
 from loguru import logger
 from redis.asyncio import Redis
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, and_
 
 from src.core.config import AppConfig
+from src.core.constants import AUDIENCE_PAGE_SIZE
 from src.core.enums import (
     BroadcastAudience,
+    BroadcastMessageStatus,
     BroadcastStatus,
     PlanAvailability,
     SubscriptionStatus,
@@ -62,6 +64,33 @@ class BroadcastService(BaseService):
         db_created_messages = await self.uow.repository.broadcasts.create_messages(db_messages)
         return BroadcastMessageDto.from_model_list(db_created_messages)
 
+    async def prepare_messages(
+        self,
+        broadcast_id: int,
+        user_ids: list[int],
+    ) -> list[BroadcastMessageDto]:
+        db_existing = await self.uow.repository.broadcasts.get_messages_by_users(
+            broadcast_id,
+            user_ids,
+        )
+        messages = {m.user_id: m for m in BroadcastMessageDto.from_model_list(db_existing)}
+
+        missing = [
+            BroadcastMessageDto(user_id=user_id, status=BroadcastMessageStatus.PENDING)
+            for user_id in user_ids
+            if user_id not in messages
+        ]
+
+        if missing:
+            created = await self.create_messages(broadcast_id, missing)
+            messages.update({m.user_id: m for m in created})
+
+        logger.debug(
+            f"Prepared '{len(user_ids)}' messages for broadcast '{broadcast_id}' "
+            f"('{len(missing)}' new, '{len(db_existing)}' existing)"
+        )
+        return [messages[user_id] for user_id in user_ids]
+
     async def get(self, task_id: UUID) -> Optional[BroadcastDto]:
         db_broadcast = await self.uow.repository.broadcasts.get(task_id)
 
@@ -92,6 +121,21 @@ class BroadcastService(BaseService):
 
         return BroadcastDto.from_model(db_updated_broadcast)
 
+    async def get_checkpoint(self, task_id: UUID) -> Optional[BroadcastDto]:
+        db_broadcast = await self.uow.repository.broadcasts.get_without_messages(task_id)
+        return BroadcastDto.from_model(db_broadcast)
+
+    async def save_checkpoint(self, broadcast: BroadcastDto) -> None:
+        await self.uow.repository.broadcasts.update(
+            task_id=broadcast.task_id,
+            load_result=False,
+            **broadcast.changed_data,
+        )
+        await self.uow.commit()
+        logger.debug(
+            f"Broadcast '{broadcast.task_id}' checkpoint saved at user '{broadcast.last_user_id}'"
+        )
+
     async def update_message(self, broadcast_id: int, message: BroadcastMessageDto) -> None:
         await self.uow.repository.broadcasts.update_message(
             broadcast_id=broadcast_id,
@@ -104,11 +148,19 @@ class BroadcastService(BaseService):
             data=[m.model_dump() for m in messages],
         )
 
+    async def claim_messages(self, messages: list[BroadcastMessageDto]) -> None:
+        # Committed before sending, a resumed task skips these instead of messaging twice
+        for message in messages:
+            message.status = BroadcastMessageStatus.SENDING
+
+        await self.bulk_update_messages(messages)
+        await self.uow.commit()
+
     async def delete_broadcast(self, broadcast_id: int) -> None:
         await self.uow.repository.broadcasts._delete(Broadcast, Broadcast.id == broadcast_id)
 
     async def get_status(self, task_id: UUID) -> Optional[BroadcastStatus]:
-        db_broadcast = await self.uow.repository.broadcasts.get(task_id)
+        db_broadcast = await self.uow.repository.broadcasts.get_without_messages(task_id)
         return db_broadcast.status if db_broadcast else None
 
     #
@@ -120,23 +172,7 @@ class BroadcastService(BaseService):
     ) -> int:
         logger.debug(f"Counting audience '{audience}' for plan '{plan_id}'")
 
-        is_not_block = and_(
-            User.is_blocked.is_(False),
-            User.is_bot_blocked.is_(False),
-        )
-
-        if audience == BroadcastAudience.PLAN:
-            if plan_id:
-                db_subs = await self.uow.repository.subscriptions.filter_by_plan_id(plan_id)
-                active_subs = [
-                    s
-                    for s in db_subs
-                    if s.status == SubscriptionStatus.ACTIVE
-                    and not s.user.is_blocked
-                    and not s.user.is_bot_blocked
-                ]
-                return len(active_subs)
-
+        if audience == BroadcastAudience.PLAN and not plan_id:
             count = await self.uow.repository.plans._count(
                 Plan,
                 Plan.availability != PlanAvailability.TRIAL,
@@ -144,98 +180,72 @@ class BroadcastService(BaseService):
             logger.debug(f"Audience count for '{audience}' (plan={plan_id}) is '{count}'")
             return count
 
-        if audience == BroadcastAudience.ALL:
-            return await self.uow.repository.users._count(User, is_not_block)
-
-        if audience == BroadcastAudience.SUBSCRIBED:
-            conditions = and_(
-                is_not_block,
-                User.current_subscription.has(Subscription.status == SubscriptionStatus.ACTIVE),
-            )
-            return await self.uow.repository.users._count(User, conditions)
-
-        if audience == BroadcastAudience.UNSUBSCRIBED:
-            conditions = and_(
-                is_not_block,
-                User.current_subscription_id.is_(None),
-            )
-            return await self.uow.repository.users._count(User, conditions)
+        conditions = self._get_audience_conditions(audience, plan_id)
+        return await self.uow.repository.users._count(User, conditions)
 
-        if audience == BroadcastAudience.EXPIRED:
-            conditions = and_(
-                is_not_block,
-                User.current_subscription.has(Subscription.status == SubscriptionStatus.EXPIRED),
-            )
-            return await self.uow.repository.users._count(User, conditions)
-
-        if audience == BroadcastAudience.TRIAL:
-            conditions = and_(
-                is_not_block,
-                User.current_subscription.has(Subscription.is_trial.is_(True)),
-            )
-            return await self.uow.repository.users._count(User, conditions)
+    async def iter_audience_users(
+        self,
+        audience: BroadcastAudience,
+        plan_id: Optional[int] = None,
+        after_id: int = 0,
+        page_size: int = AUDIENCE_PAGE_SIZE,
+    ) -> AsyncIterator[list[UserDto]]:
+        logger.debug(
+            f"Streaming users for audience '{audience}', plan_id: {plan_id}, after: {after_id}"
+        )
+        conditions = self._get_audience_conditions(audience, plan_id)
+        chunks = self.uow.repository.users.stream(
+            conditions,
+            after_id=after_id,
+            chunk_size=page_size,
+        )
 
-        raise Exception(f"Unknown broadcast audience: {audience}")
+        async for db_users in chunks:
+            yield UserDto.from_model_list(db_users)
 
-    async def get_audience_users(
+    def _get_audience_conditions(
         self,
         audience: BroadcastAudience,
         plan_id: Optional[int] = None,
-    ) -> list[UserDto]:
-        logger.debug(f"Retrieving users for audience '{audience}', plan_id: {plan_id}")
-
+    ) -> ColumnElement[bool]:
         is_not_block = and_(
             User.is_blocked.is_(False),
             User.is_bot_blocked.is_(False),
         )
 
         if audience == BroadcastAudience.PLAN and plan_id:
-            db_subscriptions = await self.uow.repository.subscriptions.filter_by_plan_id(plan_id)
-            active_subs = [
-                s
-                for s in db_subscriptions
-                if s.status == SubscriptionStatus.ACTIVE
-                and not s.user.is_blocked
-                and not s.user.is_bot_blocked
-            ]
-            user_ids = [sub.user_telegram_id for sub in active_subs]
-            db_users = await self.uow.repository.users.get_by_ids(telegram_ids=user_ids)
-            logger.debug(
-                f"Retrieved '{len(db_users)}' users for audience '{audience}' (plan={plan_id})"
+            return and_(
+                is_not_block,
+                User.subscriptions.any(
+                    and_(
+                        Subscription.plan["id"].as_integer() == plan_id,
+                        Subscription.status == SubscriptionStatus.ACTIVE,
+                    )
+                ),
             )
-            return UserDto.from_model_list(db_users)
 
         if audience == BroadcastAudience.ALL:
-            db_users = await self.uow.repository.users._get_many(User, is_not_block)
-            return UserDto.from_model_list(db_users)
+            return is_not_block
 
         if audience == BroadcastAudience.SUBSCRIBED:
-            conditions = and_(
+            return and_(
                 is_not_block,
                 User.current_subscription.has(Subscription.status == SubscriptionStatus.ACTIVE),
             )
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
 
         if audience == BroadcastAudience.UNSUBSCRIBED:
-            conditions = and_(is_not_block, User.current_subscription_id.is_(None))
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
+            return and_(is_not_block, User.current_subscription_id.is_(None))
 
         if audience == BroadcastAudience.EXPIRED:
-            conditions = and_(
+            return and_(
                 is_not_block,
                 User.current_subscription.has(Subscription.status == SubscriptionStatus.EXPIRED),
             )
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
 
         if audience == BroadcastAudience.TRIAL:
-            conditions = and_(
+            return and_(
                 is_not_block,
                 User.current_subscription.has(Subscription.is_trial.is_(True)),
             )
-            db_users = await self.uow.repository.users._get_many(User, conditions)
-            return UserDto.from_model_list(db_users)
 
         raise Exception(f"Unknown broadcast audience: {audience}")
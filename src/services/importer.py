@@ -1,29 +1,67 @@
+import asyncio
 import json
 import re
 import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 from loguru import logger
 
-from src.core.constants import IMPORTED_TAG, REMNASHOP_PREFIX
+from src.core.constants import IMPORTED_TAG, PROGRESS_UPDATE_INTERVAL, REMNASHOP_PREFIX
 from src.core.enums import SubscriptionStatus
 from src.core.utils.time import datetime_now
 
 from .base import BaseService
 
 
+@dataclass
+class ImportProgress:
+    processed: int = 0
+    total: int = 0
+
+
 class ImporterService(BaseService):
-    def get_users_from_xui(self, db_path: Path) -> list[dict[str, Any]]:
-        if not self._xui_validate_db(db_path):
-            raise ValueError("Invalid or inaccessible 3X-UI database")
+    async def read_users_from_xui(
+        self,
+        db_path: Path,
+        on_progress: Optional[Callable[[ImportProgress], Awaitable[None]]] = None,
+    ) -> list[dict[str, Any]]:
+        progress = ImportProgress()
+        worker = asyncio.ensure_future(
+            asyncio.to_thread(self.get_users_from_xui, db_path, progress)
+        )
+
+        while on_progress:
+            done, _ = await asyncio.wait({worker}, timeout=PROGRESS_UPDATE_INTERVAL)
+            if done:
+                break
+
+            # The worker thread cannot be stopped, so a failing callback must not orphan it
+            try:
+                await on_progress(progress)
+            except Exception as exception:
+                logger.warning(f"Import progress callback failed: {exception}")
+
+        return await worker
 
-        inbound_id = self._xui_get_inbound_with_most_clients(db_path)
-        users = self._xui_get_users_from_inbound(db_path, inbound_id)
+    def get_users_from_xui(
+        self,
+        db_path: Path,
+        progress: Optional[ImportProgress] = None,
+    ) -> list[dict[str, Any]]:
+        progress = progress or ImportProgress()
 
-        logger.info(f"Fetched '{len(users)}' clients from inbound '{inbound_id}'")
-        return self.transform_xui_users(users)
+        try:
+            with closing(self._xui_connect_db(db_path)) as conn:
+                inbound_id, clients = self._xui_find_largest_inbound(conn, progress)
+        except sqlite3.Error as exception:
+            raise ValueError("Invalid or inaccessible 3X-UI database") from exception
+
+        logger.info(f"Fetched '{len(clients)}' clients from inbound '{inbound_id}'")
+        return self.transform_xui_users(clients)
 
     def split_active_and_expired(
         self, users: list[dict[str, Any]]
@@ -66,9 +104,16 @@ class ImporterService(BaseService):
             "tag": IMPORTED_TAG,
         }
 
-    def transform_xui_users(self, users: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        transformed = [u for u in (self.transform_xui_user(u) for u in users) if u]
-        logger.info(f"Transformed '{len(transformed)}' / '{len(users)}' 3X-UI users")
+    def transform_xui_users(self, users: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        total = 0
+        transformed = []
+
+        for user in users:
+            total += 1
+            if transformed_user := self.transform_xui_user(user):
+                transformed.append(transformed_user)
+
+        logger.info(f"Transformed '{len(transformed)}' / '{total}' 3X-UI users")
         return transformed
 
     #
@@ -76,57 +121,33 @@ class ImporterService(BaseService):
     def _xui_connect_db(self, db_path: Path) -> sqlite3.Connection:
         return sqlite3.connect(db_path)
 
-    def _xui_fetch_inbounds(self, conn: sqlite3.Connection) -> list[tuple[int, str]]:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, settings FROM inbounds")
-        return cursor.fetchall()
-
-    def _xui_validate_db(self, db_path: Path) -> bool:
-        try:
-            with self._xui_connect_db(db_path) as conn:
-                return bool(self._xui_fetch_inbounds(conn))
-        except sqlite3.Error as exception:
-            logger.warning(f"Database validation failed: {exception}")
-            return False
-
-    def _xui_get_inbound_with_most_clients(self, db_path: Path) -> int:
-        max_clients = -1
+    def _xui_find_largest_inbound(
+        self,
+        conn: sqlite3.Connection,
+        progress: ImportProgress,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        progress.total = conn.execute("SELECT COUNT(*) FROM inbounds").fetchone()[0]
         best_inbound_id = 0
+        best_clients: list[dict[str, Any]] = []
+
+        # Each settings blob is decoded once and dropped unless it beats the current best
+        for inbound_id, settings_raw in conn.execute("SELECT id, settings FROM inbounds"):
+            progress.processed += 1
 
-        with self._xui_connect_db(db_path) as conn:
-            for inbound_id, settings_raw in self._xui_fetch_inbounds(conn):
-                try:
-                    settings = json.loads(settings_raw)
-                except json.JSONDecodeError:
-                    logger.debug(f"Skipping inbound '{inbound_id}': invalid JSON")
-                    continue
+            try:
+                settings = json.loads(settings_raw)
+            except (json.JSONDecodeError, TypeError):
+                logger.debug(f"Skipping inbound '{inbound_id}': invalid JSON")
+                continue
 
-                clients = settings.get("clients")
-                if isinstance(clients, list) and len(clients) > max_clients:
-                    max_clients, best_inbound_id = len(clients), inbound_id
+            clients = settings.get("clients") if isinstance(settings, dict) else None
+            if isinstance(clients, list) and (
+                not best_inbound_id or len(clients) > len(best_clients)
+            ):
+                best_inbound_id, best_clients = inbound_id, clients
 
         if not best_inbound_id:
             raise ValueError("No valid inbounds containing clients found")
 
-        logger.debug(f"Selected inbound '{best_inbound_id}' with '{max_clients}' clients")
-        return best_inbound_id
-
-    def _xui_get_users_from_inbound(self, db_path: Path, inbound_id: int) -> list[dict[str, Any]]:
-        with self._xui_connect_db(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT settings FROM inbounds WHERE id = ?", (inbound_id,))
-            row = cursor.fetchone()
-
-        if not row:
-            raise ValueError(f"Inbound '{inbound_id}' not found in database")
-
-        try:
-            settings = json.loads(row[0])
-        except json.JSONDecodeError as exception:
-            raise ValueError(f"Invalid JSON for inbound '{inbound_id}'") from exception
-
-        clients = settings.get("clients")
-        if not isinstance(clients, list):
-            raise TypeError(f"Invalid clients format in inbound '{inbound_id}'")
-
-        return clients
+        logger.debug(f"Selected inbound '{best_inbound_id}' with '{len(best_clients)}' clients")
+        return best_inbound_id, best_clients
@@ -1,27 +1,29 @@
 import asyncio
 import uuid
-from typing import Any, Optional, Union, cast
+from typing import Any, Iterable, Optional, Union, cast
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramForbiddenError
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
 from aiogram.types import (
     BufferedInputFile,
-    InlineKeyboardButton,
     InlineKeyboardMarkup,
     Message,
     ReplyKeyboardMarkup,
 )
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from fluentogram import TranslatorHub
 from loguru import logger
 from redis.asyncio import Redis
 
 from src.__version__ import __version__
-from src.bot.keyboards import get_remnashop_keyboard
-from src.bot.states import Notification
+from src.bot.keyboard_registry import KeyboardRegistry, with_close_button
 from src.core.config import AppConfig
-from src.core.constants import REPOSITORY
+from src.core.constants import REPOSITORY, SEND_RETRY_ATTEMPTS
 from src.core.enums import (
+    KeyboardName,
     Locale,
     MediaType,
     MessageEffect,
@@ -29,12 +31,14 @@ from src.core.enums import (
     UserNotificationType,
     UserRole,
 )
+from src.core.i18n.render_cache import RenderCache, RenderedMessage
 from src.core.i18n.translator import get_translated_kwargs
 from src.core.utils.formatters import i18n_postprocess_text
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import AnyKeyboard
 from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.database.models.dto.user import BaseUserDto
+from src.infrastructure.redis import MessageDeleter, TelegramRateLimiter
 from src.infrastructure.redis.repository import RedisRepository
 from src.services.settings import SettingsService
 
@@ -45,6 +49,10 @@ from .user import UserService
 class NotificationService(BaseService):
     user_service: UserService
     settings_service: SettingsService
+    rate_limiter: TelegramRateLimiter
+    message_deleter: MessageDeleter
+    render_cache: RenderCache
+    keyboard_registry: KeyboardRegistry
 
     def __init__(
         self,
@@ -56,16 +64,25 @@ class NotificationService(BaseService):
         #
         user_service: UserService,
         settings_service: SettingsService,
+        rate_limiter: TelegramRateLimiter,
+        message_deleter: MessageDeleter,
+        render_cache: RenderCache,
+        keyboard_registry: KeyboardRegistry,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.user_service = user_service
         self.settings_service = settings_service
+        self.rate_limiter = rate_limiter
+        self.message_deleter = message_deleter
+        self.render_cache = render_cache
+        self.keyboard_registry = keyboard_registry
 
     async def notify_user(
         self,
         user: Optional[BaseUserDto],
         payload: MessagePayload,
         ntf_type: Optional[UserNotificationType] = None,
+        rendered: Optional[RenderedMessage] = None,
     ) -> Optional[Message]:
         if not user:
             logger.warning("Skipping user notification: user object is empty")
@@ -82,7 +99,51 @@ class NotificationService(BaseService):
             f"Attempting to send user notification '{payload.i18n_key}' to '{user.telegram_id}'"
         )
 
-        return await self._send_message(user, payload)
+        return await self._send_message(user, payload, rendered)
+
+    def render(self, locale: Locale, payload: MessagePayload) -> RenderedMessage:
+        key = RenderCache.make_key(locale, payload)
+        rendered = self.render_cache.get(key)
+
+        if rendered is None:
+            rendered = RenderedMessage(
+                text=self._get_translated_text(locale, payload.i18n_key, payload.i18n_kwargs),
+                reply_markup=self._prepare_reply_markup(payload, locale),
+            )
+            self.render_cache.set(key, rendered)
+
+        return rendered
+
+    def prerender(
+        self,
+        payload: MessagePayload,
+        locales: Iterable[Locale],
+    ) -> dict[Locale, RenderedMessage]:
+        rendered = {locale: self.render(locale, payload) for locale in locales}
+        logger.debug(f"Pre-rendered '{payload.i18n_key}' for locales {list(rendered)}")
+        return rendered
+
+    async def edit_notification(
+        self,
+        user: BaseUserDto,
+        message_id: int,
+        payload: MessagePayload,
+    ) -> None:
+        text = self._get_translated_text(user.language, payload.i18n_key, payload.i18n_kwargs)
+
+        # Progress edits are cosmetic, a failed one must never abort the caller
+        try:
+            await self.rate_limiter.acquire(chat_id=user.telegram_id)
+            await self.bot.edit_message_text(
+                text=text,
+                chat_id=user.telegram_id,
+                message_id=message_id,
+            )
+        except TelegramRetryAfter as exception:
+            await self.rate_limiter.pause(exception.retry_after)
+            logger.debug(f"Skipped editing notification '{message_id}': {exception}")
+        except TelegramAPIError as exception:
+            logger.debug(f"Failed to edit notification '{message_id}': {exception}")
 
     async def system_notify(
         self,
@@ -127,7 +188,7 @@ class NotificationService(BaseService):
         payload = MessagePayload(
             i18n_key="ntf-remnashop-info",
             i18n_kwargs={"version": __version__, "repository": REPOSITORY},
-            reply_markup=get_remnashop_keyboard(),
+            keyboard=KeyboardName.REMNASHOP,
             auto_delete_after=None,
             add_close_button=True,
             message_effect=MessageEffect.LOVE,
@@ -151,32 +212,29 @@ class NotificationService(BaseService):
 
     #
 
-    async def _send_message(self, user: BaseUserDto, payload: MessagePayload) -> Optional[Message]:
-        reply_markup = self._prepare_reply_markup(
-            payload.reply_markup,
-            payload.add_close_button,
-            payload.auto_delete_after,
-            user.language,
-            user.telegram_id,
-        )
+    async def _send_message(
+        self,
+        user: BaseUserDto,
+        payload: MessagePayload,
+        rendered: Optional[RenderedMessage] = None,
+    ) -> Optional[Message]:
+        if rendered is None:
+            rendered = self.render(user.language, payload)
+
+        if (payload.media or payload.media_id) and not payload.media_type:
+            logger.warning(
+                f"Validation warning: Media provided without media_type "
+                f"for chat '{user.telegram_id}'. Sending as text message"
+            )
+
         try:
-            if (payload.media or payload.media_id) and payload.media_type:
-                sent_message = await self._send_media_message(user, payload, reply_markup)
-            else:
-                if (payload.media or payload.media_id) and not payload.media_type:
-                    logger.warning(
-                        f"Validation warning: Media provided without media_type "
-                        f"for chat '{user.telegram_id}'. Sending as text message"
-                    )
-                sent_message = await self._send_text_message(user, payload, reply_markup)
+            sent_message = await self._send_with_rate_limit(user, payload, rendered)
 
             if payload.auto_delete_after is not None and sent_message:
-                asyncio.create_task(
-                    self._schedule_message_deletion(
-                        chat_id=user.telegram_id,
-                        message_id=sent_message.message_id,
-                        delay=payload.auto_delete_after,
-                    )
+                await self.message_deleter.schedule(
+                    chat_id=user.telegram_id,
+                    message_id=sent_message.message_id,
+                    delay=payload.auto_delete_after,
                 )
 
             return sent_message
@@ -188,18 +246,40 @@ class NotificationService(BaseService):
             )
             return None
 
-    async def _send_media_message(
+    async def _send_with_rate_limit(
         self,
         user: BaseUserDto,
         payload: MessagePayload,
-        reply_markup: Optional[AnyKeyboard],
+        rendered: RenderedMessage,
     ) -> Message:
-        message_text = self._get_translated_text(
-            locale=user.language,
-            i18n_key=payload.i18n_key,
-            i18n_kwargs=payload.i18n_kwargs,
-        )
+        attempt = 0
+
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(chat_id=user.telegram_id)
+
+            try:
+                if (payload.media or payload.media_id) and payload.media_type:
+                    return await self._send_media_message(user, payload, rendered)
+                return await self._send_text_message(user, payload, rendered)
+
+            except TelegramRetryAfter as exception:
+                await self.rate_limiter.pause(exception.retry_after)
 
+                if attempt >= SEND_RETRY_ATTEMPTS:
+                    raise
+
+                logger.warning(
+                    f"Flood control for chat '{user.telegram_id}', retrying in "
+                    f"'{exception.retry_after}' seconds (attempt {attempt}/{SEND_RETRY_ATTEMPTS})"
+                )
+
+    async def _send_media_message(
+        self,
+        user: BaseUserDto,
+        payload: MessagePayload,
+        rendered: RenderedMessage,
+    ) -> Message:
         assert payload.media_type
         send_func = payload.media_type.get_function(self.bot)
         media_arg_name = payload.media_type.lower()
@@ -210,8 +290,8 @@ class NotificationService(BaseService):
 
         tg_payload = {
             "chat_id": user.telegram_id,
-            "caption": message_text,
-            "reply_markup": reply_markup,
+            "caption": rendered.text,
+            "reply_markup": rendered.reply_markup,
             "message_effect_id": payload.message_effect,
             media_arg_name: media_input,
         }
@@ -221,85 +301,50 @@ class NotificationService(BaseService):
         self,
         user: BaseUserDto,
         payload: MessagePayload,
-        reply_markup: Optional[AnyKeyboard],
+        rendered: RenderedMessage,
     ) -> Message:
-        message_text = self._get_translated_text(
-            locale=user.language,
-            i18n_key=payload.i18n_key,
-            i18n_kwargs=payload.i18n_kwargs,
-        )
-
         return await self.bot.send_message(
             chat_id=user.telegram_id,
-            text=message_text,
+            text=rendered.text,
             message_effect_id=payload.message_effect,
-            reply_markup=reply_markup,
+            reply_markup=rendered.reply_markup,
             disable_web_page_preview=True,
         )
 
     def _prepare_reply_markup(
         self,
-        reply_markup: Optional[AnyKeyboard],
-        add_close_button: bool,
-        auto_delete_after: Optional[int],
+        payload: MessagePayload,
         locale: Locale,
-        chat_id: int,
     ) -> Optional[AnyKeyboard]:
+        add_close_button = payload.add_close_button and payload.auto_delete_after is None
+
+        if payload.keyboard:
+            return self.keyboard_registry.get(payload.keyboard, locale, add_close_button)
+
+        reply_markup = payload.reply_markup
+
         if reply_markup is None:
-            if add_close_button and auto_delete_after is None:
-                close_button = self._get_close_notification_button(locale=locale)
-                return self._get_close_notification_keyboard(close_button)
+            if add_close_button:
+                return self.keyboard_registry.get(KeyboardName.CLOSE, locale)
             return None
 
-        if not add_close_button or auto_delete_after is not None:
-            return self._translate_keyboard_texts(reply_markup, locale)
-
-        close_button = self._get_close_notification_button(locale=locale)
+        translated_markup = self._translate_keyboard_texts(reply_markup, locale)
 
-        if isinstance(reply_markup, InlineKeyboardMarkup):
-            translated_markup = self._translate_keyboard_texts(reply_markup, locale)
-            translated_markup = cast(InlineKeyboardMarkup, translated_markup)
-            builder = InlineKeyboardBuilder.from_markup(translated_markup)
-            builder.row(close_button)
-            return builder.as_markup()
+        if not add_close_button or isinstance(reply_markup, ReplyKeyboardMarkup):
+            return translated_markup
 
-        if isinstance(reply_markup, ReplyKeyboardMarkup):
-            return self._translate_keyboard_texts(reply_markup, locale)
+        if isinstance(translated_markup, InlineKeyboardMarkup):
+            return with_close_button(
+                translated_markup,
+                self.keyboard_registry.close_button(locale),
+            )
 
         logger.warning(
             f"Unsupported reply_markup type '{type(reply_markup).__name__}' "
-            f"for chat '{chat_id}'. Close button will not be added"
+            f"for locale '{locale}'. Close button will not be added"
         )
         return reply_markup
 
-    def _get_close_notification_button(self, locale: Locale) -> InlineKeyboardButton:
-        i18n = self.translator_hub.get_translator_by_locale(locale=locale)
-        button_text = i18n.get("btn-notification-close")
-        return InlineKeyboardButton(text=button_text, callback_data=Notification.CLOSE.state)
-
-    def _get_close_notification_keyboard(
-        self,
-        button: InlineKeyboardButton,
-    ) -> InlineKeyboardMarkup:
-        builder = InlineKeyboardBuilder()
-        builder.row(button)
-        return builder.as_markup()
-
-    async def _schedule_message_deletion(self, chat_id: int, message_id: int, delay: int) -> None:
-        logger.debug(
-            f"Scheduling message '{message_id}' for auto-deletion in '{delay}' (chat '{chat_id}')"
-        )
-        try:
-            await asyncio.sleep(delay)
-            await self.bot.delete_message(chat_id=chat_id, message_id=message_id)
-            logger.debug(
-                f"Message '{message_id}' in chat '{chat_id}' deleted after '{delay}' seconds"
-            )
-        except Exception as exception:
-            logger.error(
-                f"Failed to delete message '{message_id}' in chat '{chat_id}': {exception}"
-            )
-
     def _get_translated_text(
         self,
         locale: Locale,
@@ -321,12 +366,9 @@ class NotificationService(BaseService):
                 new_row_inline = []
                 for button_inline in row_inline:
                     if button_inline.text:
-                        try:
-                            button_inline.text = self._get_translated_text(
-                                locale, button_inline.text
-                            )
-                        except Exception:
-                            button_inline.text = button_inline.text
+                        button_inline = button_inline.model_copy(
+                            update={"text": self._translate_button_text(locale, button_inline.text)}
+                        )
                     new_row_inline.append(button_inline)
                 new_inline_keyboard.append(new_row_inline)
 
@@ -339,10 +381,9 @@ class NotificationService(BaseService):
                 new_row = []
                 for button in row:
                     if button.text:
-                        try:
-                            button.text = self._get_translated_text(locale, button.text)
-                        except Exception:
-                            button.text = button.text
+                        button = button.model_copy(
+                            update={"text": self._translate_button_text(locale, button.text)}
+                        )
                     new_row.append(button)
                 new_keyboard.append(new_row)
 
@@ -352,6 +393,12 @@ class NotificationService(BaseService):
 
         return keyboard
 
+    def _translate_button_text(self, locale: Locale, text: str) -> str:
+        try:
+            return self._get_translated_text(locale, text)
+        except Exception:
+            return text
+
     def _get_temp_dev(self) -> UserDto:
         temp_dev = UserDto(
             telegram_id=self.config.bot.dev_id,
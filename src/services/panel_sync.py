@@ -0,0 +1,201 @@
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator, Final
+
+from aiogram import Bot
+from fluentogram import TranslatorHub
+from loguru import logger
+from redis.asyncio import Redis
+from remnapy import RemnawaveSDK
+from remnapy.models import UserResponseDto
+
+from src.core.config import AppConfig
+from src.core.constants import PANEL_SYNC_CONCURRENCY, PANEL_SYNC_PAGE_SIZE
+from src.core.enums import LoadProfile
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.database.models.dto import RemnaSubscriptionDto, UserDto
+from src.infrastructure.redis import RedisRepository, invalidate_cache
+from src.services.remnawave import RemnawaveService
+from src.services.subscription import SubscriptionService
+from src.services.user import UserService
+
+from .base import BaseService
+
+SYNC_COUNTERS: Final[tuple[str, ...]] = (
+    "added_users",
+    "added_subscription",
+    "updated",
+    "errors",
+    "missing_telegram",
+)
+USER_INSERT_EXCLUDE: Final[set[str]] = {"id", "current_subscription", "created_at", "updated_at"}
+SUBSCRIPTION_INSERT_EXCLUDE: Final[set[str]] = {"id", "user", "plan", "created_at", "updated_at"}
+
+
+class PanelSyncService(BaseService):
+    uow: UnitOfWork
+    remnawave: RemnawaveSDK
+    user_service: UserService
+    remnawave_service: RemnawaveService
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        uow: UnitOfWork,
+        remnawave: RemnawaveSDK,
+        user_service: UserService,
+        remnawave_service: RemnawaveService,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.uow = uow
+        self.remnawave = remnawave
+        self.user_service = user_service
+        self.remnawave_service = remnawave_service
+
+    async def get_panel_users_count(self) -> int:
+        stats = await self.remnawave.system.get_stats()
+        return stats.users.total_users
+
+    async def iter_panel_pages(self, total: int) -> AsyncIterator[list[UserResponseDto]]:
+        # Keeps a bounded window of requests in flight while the caller applies earlier pages
+        starts = iter(range(0, total, PANEL_SYNC_PAGE_SIZE))
+        pending: deque[asyncio.Task[list[UserResponseDto]]] = deque(
+            asyncio.create_task(self._fetch_page(start))
+            for start in islice(starts, PANEL_SYNC_CONCURRENCY)
+        )
+
+        try:
+            while pending:
+                page = await pending.popleft()
+                next_start = next(starts, None)
+
+                if next_start is not None:
+                    pending.append(asyncio.create_task(self._fetch_page(next_start)))
+
+                if page:
+                    yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def sync_page(self, remna_users: list[UserResponseDto]) -> dict[str, int]:
+        result = dict.fromkeys(SYNC_COUNTERS, 0)
+        panel_users: dict[int, UserResponseDto] = {}
+
+        for remna_user in remna_users:
+            if not remna_user.telegram_id:
+                result["missing_telegram"] += 1
+                continue
+
+            panel_users[remna_user.telegram_id] = remna_user
+
+        if not panel_users:
+            return result
+
+        try:
+            counters, tags, conflicted = await self._apply_page(panel_users)
+            await self.uow.commit()
+        except Exception as exception:
+            logger.exception(f"Bulk sync of '{len(panel_users)}' users failed: {exception}")
+            await self.uow.rollback()
+            counters, tags, conflicted = dict.fromkeys(SYNC_COUNTERS, 0), set(), set(panel_users)
+
+        for name, value in counters.items():
+            result[name] += value
+
+        if tags:
+            await invalidate_cache(self.redis_client, *tags)
+
+        for telegram_id in conflicted:
+            await self._sync_single(panel_users[telegram_id], result)
+
+        logger.debug(f"Synced page of '{len(remna_users)}' panel users: '{result}'")
+        return result
+
+    async def _fetch_page(self, start: int) -> list[UserResponseDto]:
+        response = await self.remnawave.users.get_all_users(start=start, size=PANEL_SYNC_PAGE_SIZE)
+        return list(response.users)
+
+    async def _apply_page(
+        self,
+        panel_users: dict[int, UserResponseDto],
+    ) -> tuple[dict[str, int], set[str], set[int]]:
+        counters = dict.fromkeys(SYNC_COUNTERS, 0)
+        tags: set[str] = set()
+
+        db_users = await self.uow.repository.users.get_by_ids(
+            list(panel_users),
+            profile=LoadProfile.WITH_CURRENT_SUBSCRIPTION,
+        )
+        bot_users = {user.telegram_id: user for user in UserDto.from_model_list(db_users)}
+
+        new_users = [
+            self.user_service.build_from_panel(remna_user).model_dump(exclude=USER_INSERT_EXCLUDE)
+            for telegram_id, remna_user in panel_users.items()
+            if telegram_id not in bot_users
+        ]
+        created_ids = set(await self.uow.repository.users.create_many_if_absent(new_users))
+        # Users registered through the bot while the page was being applied
+        conflicted = {user["telegram_id"] for user in new_users} - created_ids
+
+        if created_ids:
+            tags.add("users")
+
+        new_subscriptions: list[dict[str, Any]] = []
+        updated_subscriptions: list[dict[str, Any]] = []
+
+        for telegram_id, remna_user in panel_users.items():
+            if telegram_id in conflicted:
+                continue
+
+            remna_subscription = RemnaSubscriptionDto.from_remna_user(remna_user)
+            user = bot_users.get(telegram_id)
+            current = user.current_subscription if user else None
+            tags.add(f"user:{telegram_id}")
+
+            if not remna_subscription.url:
+                # Same fallback as sync_user, an empty url must never replace a stored one
+                remna_subscription.url = (  # type: ignore[assignment]
+                    current.url
+                    if current and current.url
+                    else await self.remnawave_service.get_subscription_url(remna_user.uuid)
+                )
+
+            if current is None:
+                subscription = SubscriptionService.build_from_panel(remna_user, remna_subscription)
+                data = subscription.model_dump(exclude=SUBSCRIPTION_INSERT_EXCLUDE)
+                data["plan"] = subscription.plan.model_dump(mode="json")
+                data["user_telegram_id"] = telegram_id
+                new_subscriptions.append(data)
+                counters["added_subscription" if user else "added_users"] += 1
+                continue
+
+            current = SubscriptionService.apply_sync(target=current, source=remna_subscription)
+
+            if current.changed_data:
+                updated_subscriptions.append({"id": current.id, **current.changed_data})
+                tags.add(f"subscription:{current.id}")
+                counters["updated"] += 1
+
+        subscription_ids = await self.uow.repository.subscriptions.create_many(new_subscriptions)
+        await self.uow.repository.users.set_current_subscriptions(subscription_ids)
+        await self.uow.repository.subscriptions.bulk_update(updated_subscriptions)
+
+        return counters, tags, conflicted
+
+    async def _sync_single(self, remna_user: UserResponseDto, result: dict[str, int]) -> None:
+        try:
+            created = await self.remnawave_service.sync_user(remna_user)
+            result["added_users" if created else "updated"] += 1
+        except Exception as exception:
+            logger.exception(
+                f"Error syncing RemnaUser '{remna_user.telegram_id}' exception: {exception}"
+            )
+            await self.uow.rollback()
+            result["errors"] += 1
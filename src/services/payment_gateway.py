@@ -295,7 +295,15 @@ class PaymentGatewayService(BaseService):
             logger.critical(f"Transaction or user not found for '{payment_id}'")
             return
 
-        if transaction.is_completed:
+        transitioned = await self.transaction_service.transition_status(
+            payment_id,
+            TransactionStatus.COMPLETED,
+            TransactionStatus.PENDING,
+            TransactionStatus.CANCELED,
+            TransactionStatus.FAILED,
+        )
+
+        if not transitioned:
             logger.warning(
                 f"Transaction '{payment_id}' for user "
                 f"'{transaction.user.telegram_id}' already completed"
@@ -303,7 +311,6 @@ class PaymentGatewayService(BaseService):
             return
 
         transaction.status = TransactionStatus.COMPLETED
-        await self.transaction_service.update(transaction)
 
         logger.info(f"Payment succeeded '{payment_id}' for user '{transaction.user.telegram_id}'")
 
@@ -384,8 +391,16 @@ class PaymentGatewayService(BaseService):
             logger.critical(f"Transaction or user not found for '{payment_id}'")
             return
 
-        transaction.status = TransactionStatus.CANCELED
-        await self.transaction_service.update(transaction)
+        transitioned = await self.transaction_service.transition_status(
+            payment_id,
+            TransactionStatus.CANCELED,
+            TransactionStatus.PENDING,
+        )
+
+        if not transitioned:
+            logger.warning(f"Transaction '{payment_id}' is no longer pending, skipping cancel")
+            return
+
         logger.info(f"Payment canceled '{payment_id}' for user '{transaction.user.telegram_id}'")
 
     #
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 from aiogram import Bot
 from fluentogram import TranslatorHub
@@ -10,13 +10,14 @@ from src.core.enums import PlanAvailability
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import PlanDto, UserDto
 from src.infrastructure.database.models.sql import Plan, PlanDuration, PlanPrice
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import PlanCatalogue, PlanCatalogueSnapshot, RedisRepository
 
 from .base import BaseService
 
 
 class PlanService(BaseService):
     uow: UnitOfWork
+    plan_catalogue: PlanCatalogue
 
     def __init__(
         self,
@@ -27,9 +28,11 @@ class PlanService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        plan_catalogue: PlanCatalogue,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.plan_catalogue = plan_catalogue
 
     async def create(self, plan: PlanDto) -> PlanDto:
         order_index = await self.uow.repository.plans.get_max_index()
@@ -38,39 +41,43 @@ class PlanService(BaseService):
 
         db_plan = self._dto_to_model(plan)
         db_created_plan = await self.uow.repository.plans.create(db_plan)
+        await self._publish_changes()
         logger.info(f"Created plan '{plan.name}' with ID '{db_created_plan.id}'")
         return PlanDto.from_model(db_created_plan)  # type: ignore[return-value]
 
     async def get(self, plan_id: int) -> Optional[PlanDto]:
-        db_plan = await self.uow.repository.plans.get(plan_id)
+        catalogue = await self._get_catalogue()
+        plan = catalogue.by_id.get(plan_id)
 
-        if db_plan:
+        if plan:
             logger.debug(f"Retrieved plan '{plan_id}'")
         else:
             logger.warning(f"Plan '{plan_id}' not found")
 
-        return PlanDto.from_model(db_plan)
+        return self._copy(plan)
 
     async def get_by_name(self, plan_name: str) -> Optional[PlanDto]:
-        db_plan = await self.uow.repository.plans.get_by_name(plan_name)
+        catalogue = await self._get_catalogue()
+        plan = next((p for p in catalogue.plans if p.name == plan_name), None)
 
-        if db_plan:
+        if plan:
             logger.debug(f"Retrieved plan by name '{plan_name}'")
         else:
             logger.warning(f"Plan with name '{plan_name}' not found")
 
-        return PlanDto.from_model(db_plan)
+        return self._copy(plan)
 
     async def get_all(self) -> list[PlanDto]:
-        db_plans = await self.uow.repository.plans.get_all()
-        logger.debug(f"Retrieved '{len(db_plans)}' plans")
-        return PlanDto.from_model_list(db_plans)
+        catalogue = await self._get_catalogue()
+        logger.debug(f"Retrieved '{len(catalogue.plans)}' plans")
+        return self._copy_list(catalogue.plans)
 
     async def update(self, plan: PlanDto) -> Optional[PlanDto]:
         db_plan = self._dto_to_model(plan)
         db_updated_plan = await self.uow.repository.plans.update(db_plan)
 
         if db_updated_plan:
+            await self._publish_changes()
             logger.info(f"Updated plan '{plan.name}' (ID: '{plan.id}') successfully")
         else:
             logger.warning(
@@ -84,6 +91,7 @@ class PlanService(BaseService):
         result = await self.uow.repository.plans.delete(plan_id)
 
         if result:
+            await self._publish_changes()
             logger.info(f"Plan '{plan_id}' deleted successfully")
         else:
             logger.warning(f"Failed to delete plan '{plan_id}'. Plan not found or deletion failed")
@@ -91,31 +99,31 @@ class PlanService(BaseService):
         return result
 
     async def count(self) -> int:
-        count = await self.uow.repository.plans.count()
+        catalogue = await self._get_catalogue()
+        count = len(catalogue.plans)
         logger.debug(f"Total plans count: '{count}'")
         return count
 
     #
 
     async def get_trial_plan(self) -> Optional[PlanDto]:
-        db_plans: list[Plan] = await self.uow.repository.plans.filter_by_availability(
-            availability=PlanAvailability.TRIAL
-        )
+        catalogue = await self._get_catalogue()
+        plans = catalogue.by_availability.get(PlanAvailability.TRIAL, ())
 
-        if db_plans:
-            if len(db_plans) > 1:
+        if plans:
+            if len(plans) > 1:
                 logger.warning(
-                    f"Multiple trial plans found ({len(db_plans)}). "
-                    f"Using the first one: '{db_plans[0].name}'"
+                    f"Multiple trial plans found ({len(plans)}). "
+                    f"Using the first one: '{plans[0].name}'"
                 )
 
-            db_plan = db_plans[0]
+            plan = plans[0]
 
-            if db_plan.is_active:
-                logger.debug(f"Available trial plan '{db_plans[0].name}'")
-                return PlanDto.from_model(db_plans[0])
+            if plan.is_active:
+                logger.debug(f"Available trial plan '{plan.name}'")
+                return self._copy(plan)
             else:
-                logger.warning(f"Trial plan '{db_plans[0].name}' found but is not active")
+                logger.warning(f"Trial plan '{plan.name}' found but is not active")
 
         logger.debug("No active trial plan found")
         return None
@@ -123,58 +131,60 @@ class PlanService(BaseService):
     async def get_available_plans(self, user: UserDto) -> list[PlanDto]:
         logger.debug(f"Fetching available plans for user '{user.telegram_id}'")
 
-        db_plans: list[Plan] = await self.uow.repository.plans.filter_active(is_active=True)
-        logger.debug(f"Total active plans retrieved: '{len(db_plans)}'")
-        db_filtered_plans = []
+        catalogue = await self._get_catalogue()
+        allowed_plan_ids = {p.id for p in catalogue.by_allowed_user.get(user.telegram_id, ())}
+        filtered_plans = []
 
-        for db_plan in db_plans:
-            match db_plan.availability:
+        for plan in catalogue.plans:
+            if not plan.is_active:
+                continue
+
+            match plan.availability:
                 case PlanAvailability.ALL:
-                    db_filtered_plans.append(db_plan)
+                    filtered_plans.append(plan)
                 case PlanAvailability.NEW if not user.has_any_subscription:
                     logger.debug(
                         f"User {user.telegram_id} has no subscription, "
-                        f"eligible for new user plan '{db_plan.name}'"
+                        f"eligible for new user plan '{plan.name}'"
                     )
-                    db_filtered_plans.append(db_plan)
+                    filtered_plans.append(plan)
 
                 case PlanAvailability.EXISTING if user.has_any_subscription:
                     logger.debug(
                         f"User {user.telegram_id} has an existing subscription, "
-                        f"eligible for existing user plan '{db_plan.name}'"
+                        f"eligible for existing user plan '{plan.name}'"
                     )
-                    db_filtered_plans.append(db_plan)
+                    filtered_plans.append(plan)
 
                 case PlanAvailability.INVITED if user.is_invited_user:
                     logger.debug(
                         f"User {user.telegram_id} was invited, "
-                        f"eligible for invited user plan '{db_plan.name}'"
+                        f"eligible for invited user plan '{plan.name}'"
                     )
-                    db_filtered_plans.append(db_plan)
+                    filtered_plans.append(plan)
 
-                case PlanAvailability.ALLOWED if user.telegram_id in db_plan.allowed_user_ids:
+                case PlanAvailability.ALLOWED if plan.id in allowed_plan_ids:
                     logger.debug(
-                        f"User {user.telegram_id} is explicitly allowed for plan '{db_plan.name}'"
+                        f"User {user.telegram_id} is explicitly allowed for plan '{plan.name}'"
                     )
-                    db_filtered_plans.append(db_plan)
+                    filtered_plans.append(plan)
         logger.info(
-            f"Available plans filtered: '{len(db_filtered_plans)}' for user '{user.telegram_id}'"
+            f"Available plans filtered: '{len(filtered_plans)}' for user '{user.telegram_id}'"
         )
-        return PlanDto.from_model_list(db_filtered_plans)
+        return self._copy_list(filtered_plans)
 
     async def get_allowed_plans(self) -> list[PlanDto]:
-        db_plans: list[Plan] = await self.uow.repository.plans.filter_by_availability(
-            availability=PlanAvailability.ALLOWED,
-        )
+        catalogue = await self._get_catalogue()
+        plans = catalogue.by_availability.get(PlanAvailability.ALLOWED, ())
 
-        if db_plans:
+        if plans:
             logger.debug(
-                f"Retrieved '{len(db_plans)}' plans with availability '{PlanAvailability.ALLOWED}'"
+                f"Retrieved '{len(plans)}' plans with availability '{PlanAvailability.ALLOWED}'"
             )
         else:
             logger.debug(f"No plans found with availability '{PlanAvailability.ALLOWED}'")
 
-        return PlanDto.from_model_list(db_plans)
+        return self._copy_list(plans)
 
     async def move_plan_up(self, plan_id: int) -> bool:
         db_plans = await self.uow.repository.plans.get_all()
@@ -196,11 +206,38 @@ class PlanService(BaseService):
         for i, plan in enumerate(db_plans, start=1):
             plan.order_index = i
 
+        await self._publish_changes()
         logger.info(f"Plan '{plan_id}' reorder successfully")
         return True
 
     #
 
+    async def _get_catalogue(self) -> PlanCatalogueSnapshot:
+        snapshot = self.plan_catalogue.snapshot
+        if snapshot is not None:
+            return snapshot
+
+        # Read the version first, a bump racing with the load then only costs a reload
+        version = await self.plan_catalogue.get_version()
+        db_plans = await self.uow.repository.plans.get_all()
+        snapshot = PlanCatalogueSnapshot.build(version, PlanDto.from_model_list(db_plans))
+        self.plan_catalogue.install(snapshot)
+        return snapshot
+
+    async def _publish_changes(self) -> None:
+        # Other processes reload as soon as they see the new version, so it must be committed
+        await self.uow.commit()
+        await self.plan_catalogue.bump()
+
+    @staticmethod
+    def _copy(plan: Optional[PlanDto]) -> Optional[PlanDto]:
+        # Snapshot entries are shared by every request, callers get their own copy to edit
+        return plan.model_copy(deep=True) if plan else None
+
+    @staticmethod
+    def _copy_list(plans: Iterable[PlanDto]) -> list[PlanDto]:
+        return [plan.model_copy(deep=True) for plan in plans]
+
     def _dto_to_model(self, plan_dto: PlanDto) -> Plan:
         db_plan = Plan(**plan_dto.model_dump(exclude={"durations"}))
 
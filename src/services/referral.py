@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 from decimal import Decimal
+from functools import lru_cache
 from io import BytesIO
 from typing import Any, List, Optional, cast
 
@@ -11,7 +14,13 @@ from qrcode import ERROR_CORRECT_H, QRCode  # type: ignore[attr-defined]
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.constants import ASSETS_DIR, REFERRAL_PREFIX, T_ME
+from src.core.constants import (
+    ASSETS_DIR,
+    REF_QR_CACHE_SIZE,
+    REF_QR_FILE_ID_TTL,
+    REFERRAL_PREFIX,
+    T_ME,
+)
 from src.core.enums import (
     MessageEffect,
     PurchaseType,
@@ -21,6 +30,7 @@ from src.core.enums import (
     ReferralRewardType,
     UserNotificationType,
 )
+from src.core.storage.keys import ReferralQrKey
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import (
@@ -266,42 +276,23 @@ class ReferralService(BaseService):
     async def get_ref_link(self, referral_code: str) -> str:
         return f"{await self._get_bot_redirect_url()}?start={REFERRAL_PREFIX}{referral_code}"
 
-    def get_ref_qr(self, url: str) -> BufferedInputFile:
-        qr: Any = QRCode(
-            version=1,
-            error_correction=ERROR_CORRECT_H,
-            box_size=10,
-            border=4,
-        )
-
-        qr.add_data(url)
-        qr.make(fit=True)
-
-        qr_img_raw = qr.make_image(fill_color="black", back_color="white")
-        qr_img: Image.Image
-        if hasattr(qr_img_raw, "get_image"):
-            qr_img = cast(Image.Image, qr_img_raw.get_image())
-        else:
-            qr_img = cast(Image.Image, qr_img_raw)
-
-        qr_img = qr_img.convert("RGB")
-
-        logo_path = ASSETS_DIR / "logo.png"
-        if logo_path.exists():
-            logo = Image.open(logo_path).convert("RGBA")
+    async def get_ref_qr(self, url: str) -> BufferedInputFile:
+        qr_png = await asyncio.to_thread(render_ref_qr, url)
+        return BufferedInputFile(file=qr_png, filename="ref_qr.png")
 
-            qr_width, qr_height = qr_img.size
-            logo_size = int(qr_width * 0.2)
-            logo = logo.resize((logo_size, logo_size), resample=Image.Resampling.LANCZOS)
+    async def get_ref_qr_file_id(self, url: str) -> Optional[str]:
+        return await self.redis_repository.get(self._get_ref_qr_key(url), str)
 
-            pos = ((qr_width - logo_size) // 2, (qr_height - logo_size) // 2)
-            qr_img.paste(logo, pos, mask=logo)
+    async def set_ref_qr_file_id(self, url: str, file_id: str) -> None:
+        await self.redis_repository.set(self._get_ref_qr_key(url), file_id, ex=REF_QR_FILE_ID_TTL)
+        logger.debug(f"Cached referral QR file_id for '{url}'")
 
-        buffer = BytesIO()
-        qr_img.save(buffer, format="PNG")
-        buffer.seek(0)
+    async def delete_ref_qr_file_id(self, url: str) -> None:
+        await self.redis_repository.delete(self._get_ref_qr_key(url))
+        logger.debug(f"Dropped cached referral QR file_id for '{url}'")
 
-        return BufferedInputFile(file=buffer.getvalue(), filename="ref_qr.png")
+    def _get_ref_qr_key(self, url: str) -> ReferralQrKey:
+        return ReferralQrKey(url_hash=hashlib.sha256(url.encode()).hexdigest()[:16])
 
     async def get_referrer_by_event(
         self,
@@ -426,3 +417,50 @@ class ReferralService(BaseService):
             return None
 
         return reward_amount
+
+
+@lru_cache(maxsize=8)
+def _load_logo(size: int) -> Optional[Image.Image]:
+    logo_path = ASSETS_DIR / "logo.png"
+    if not logo_path.exists():
+        return None
+
+    with Image.open(logo_path) as logo:
+        return cast(
+            Image.Image,
+            logo.convert("RGBA").resize((size, size), resample=Image.Resampling.LANCZOS),
+        )
+
+
+@lru_cache(maxsize=REF_QR_CACHE_SIZE)
+def render_ref_qr(url: str) -> bytes:
+    qr: Any = QRCode(
+        version=1,
+        error_correction=ERROR_CORRECT_H,
+        box_size=10,
+        border=4,
+    )
+
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    qr_img_raw = qr.make_image(fill_color="black", back_color="white")
+    qr_img: Image.Image
+    if hasattr(qr_img_raw, "get_image"):
+        qr_img = cast(Image.Image, qr_img_raw.get_image())
+    else:
+        qr_img = cast(Image.Image, qr_img_raw)
+
+    qr_img = qr_img.convert("RGB")
+
+    qr_width, qr_height = qr_img.size
+    logo_size = int(qr_width * 0.2)
+    logo = _load_logo(logo_size)
+
+    if logo is not None:
+        pos = ((qr_width - logo_size) // 2, (qr_height - logo_size) // 2)
+        qr_img.paste(logo, pos, mask=logo)
+
+    buffer = BytesIO()
+    qr_img.save(buffer, format="PNG")
+    return buffer.getvalue()
@@ -37,7 +37,6 @@ from src.core.utils.formatters import (
     format_days_to_datetime,
     format_device_count,
     format_gb_to_bytes,
-    format_limits_to_plan_type,
     i18n_format_bytes_to_unit,
     i18n_format_device_limit,
     i18n_format_expire_time,
@@ -301,14 +300,15 @@ class RemnawaveService(BaseService):
 
         return remna_user.subscription_url
 
-    async def sync_user(self, remna_user: RemnaUserDto, creating: bool = True) -> None:
+    async def sync_user(self, remna_user: RemnaUserDto, creating: bool = True) -> bool:
         if not remna_user.telegram_id:
             logger.warning(f"Skipping sync for '{remna_user.username}', missing 'telegram_id'")
-            return
+            return False
 
         user = await self.user_service.get(telegram_id=remna_user.telegram_id)
+        created = not user and creating
 
-        if not user and creating:
+        if created:
             logger.debug(f"User '{remna_user.telegram_id}' not found in bot, creating new user")
             user = await self.user_service.create_from_panel(remna_user)
 
@@ -322,39 +322,7 @@ class RemnawaveService(BaseService):
         if not subscription:
             logger.info(f"No subscription found for '{user.telegram_id}', creating")
 
-            temp_plan = PlanSnapshotDto(
-                id=-1,
-                name=IMPORTED_TAG,
-                tag=remna_subscription.tag,
-                type=format_limits_to_plan_type(
-                    remna_subscription.traffic_limit,
-                    remna_subscription.device_limit,
-                ),
-                traffic_limit=remna_subscription.traffic_limit,
-                device_limit=remna_subscription.device_limit,
-                duration=-1,
-                traffic_limit_strategy=remna_subscription.traffic_limit_strategy,
-                internal_squads=remna_subscription.internal_squads,
-                external_squad=remna_subscription.external_squad,
-            )
-
-            expired = remna_user.expire_at and remna_user.expire_at < datetime_now()
-            status = SubscriptionStatus.EXPIRED if expired else remna_user.status
-
-            subscription = SubscriptionDto(
-                user_remna_id=remna_user.uuid,
-                status=status,
-                traffic_limit=temp_plan.traffic_limit,
-                device_limit=temp_plan.device_limit,
-                traffic_limit_strategy=temp_plan.traffic_limit_strategy,
-                tag=temp_plan.tag,
-                internal_squads=remna_subscription.internal_squads,
-                external_squad=remna_subscription.external_squad,
-                expire_at=remna_user.expire_at,
-                url=remna_subscription.url,
-                plan=temp_plan,
-            )
-
+            subscription = SubscriptionService.build_from_panel(remna_user, remna_subscription)
             await self.subscription_service.create(user, subscription)
             logger.info(f"Subscription created for '{user.telegram_id}'")
 
@@ -368,6 +336,7 @@ class RemnawaveService(BaseService):
             logger.info(f"Subscription updated for '{user.telegram_id}'")
 
         logger.info(f"Sync completed for user '{remna_user.telegram_id}'")
+        return created
 
     #
 
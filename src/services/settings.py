@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Final, Optional, cast
 
 from aiogram import Bot
 from fluentogram import TranslatorHub
@@ -8,19 +8,21 @@ from redis.asyncio import Redis
 from src.core.config import AppConfig
 from src.core.constants import TIME_10M
 from src.core.enums import AccessMode, Currency, SystemNotificationType, UserNotificationType
-from src.core.storage.key_builder import build_key
 from src.core.utils.types import AnyNotification
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import ReferralSettingsDto, SettingsDto
 from src.infrastructure.database.models.sql import Settings
-from src.infrastructure.redis import RedisRepository
-from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis import LocalCache, RedisRepository
+from src.infrastructure.redis.cache import invalidate_cache, redis_cache
 
 from .base import BaseService
 
+SETTINGS_LOCAL_KEY: Final[str] = "settings"
+
 
 class SettingsService(BaseService):
     uow: UnitOfWork
+    local_cache: LocalCache
 
     def __init__(
         self,
@@ -31,9 +33,11 @@ class SettingsService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        local_cache: LocalCache,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.local_cache = local_cache
 
     async def create(self) -> SettingsDto:
         settings = SettingsDto()
@@ -44,8 +48,22 @@ class SettingsService(BaseService):
         logger.info("Default settings created in DB")
         return SettingsDto.from_model(db_settings)  # type: ignore[return-value]
 
-    @redis_cache(prefix="get_settings", ttl=TIME_10M)
     async def get(self) -> SettingsDto:
+        settings = await self._get_shared()
+        return settings.model_copy(deep=True)
+
+    async def _get_shared(self) -> SettingsDto:
+        settings = cast(Optional[SettingsDto], self.local_cache.get(SETTINGS_LOCAL_KEY))
+        if settings is not None:
+            return settings
+
+        generation = self.local_cache.generation
+        settings = await self._load()
+        self.local_cache.set(SETTINGS_LOCAL_KEY, settings, generation)
+        return settings
+
+    @redis_cache(prefix="get_settings", ttl=TIME_10M, tags=["settings"])
+    async def _load(self) -> SettingsDto:
         db_settings = await self.uow.repository.settings.get()
         if not db_settings:
             return await self.create()
@@ -78,17 +96,17 @@ class SettingsService(BaseService):
     #
 
     async def is_rules_required(self) -> bool:
-        settings = await self.get()
+        settings = await self._get_shared()
         return settings.rules_required
 
     async def is_channel_required(self) -> bool:
-        settings = await self.get()
+        settings = await self._get_shared()
         return settings.channel_required
 
     #
 
     async def get_access_mode(self) -> AccessMode:
-        settings = await self.get()
+        settings = await self._get_shared()
         mode = settings.access_mode
         logger.debug(f"Retrieved access mode '{mode}'")
         return mode
@@ -102,7 +120,7 @@ class SettingsService(BaseService):
     #
 
     async def get_default_currency(self) -> Currency:
-        settings = await self.get()
+        settings = await self._get_shared()
         currency = settings.default_currency
         logger.debug(f"Retrieved default currency '{currency}'")
         return currency
@@ -135,7 +153,7 @@ class SettingsService(BaseService):
         return new_value
 
     async def is_notification_enabled(self, ntf_type: AnyNotification) -> bool:
-        settings = await self.get()
+        settings = await self._get_shared()
 
         if isinstance(ntf_type, UserNotificationType):
             return settings.user_notifications.is_enabled(ntf_type)
@@ -146,7 +164,7 @@ class SettingsService(BaseService):
             return False
 
     async def list_user_notifications(self) -> list[dict[str, Any]]:
-        settings = await self.get()
+        settings = await self._get_shared()
         return [
             {
                 "type": field.upper(),
@@ -156,7 +174,7 @@ class SettingsService(BaseService):
         ]
 
     async def list_system_notifications(self) -> list[dict[str, Any]]:
-        settings = await self.get()
+        settings = await self._get_shared()
         return [
             {
                 "type": field.upper(),
@@ -172,12 +190,12 @@ class SettingsService(BaseService):
         return settings.referral
 
     async def is_referral_enable(self) -> bool:
-        settings = await self.get()
+        settings = await self._get_shared()
         return settings.referral.enable
 
     #
 
     async def _clear_cache(self) -> None:
-        settings_cache_key: str = build_key("cache", "get_settings")
-        logger.debug(f"Cache '{settings_cache_key}' cleared")
-        await self.redis_client.delete(settings_cache_key)
+        await invalidate_cache(self.redis_client, "settings")
+        await self.local_cache.invalidate(SETTINGS_LOCAL_KEY)
+        logger.debug("Settings cache cleared")
@@ -0,0 +1,70 @@
+from typing import Any
+
+from aiogram import Bot
+from fluentogram import TranslatorHub
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.constants import TIME_1D, TIME_1H
+from src.core.utils.time import datetime_now
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.redis import RedisRepository
+
+from .base import BaseService
+from .user import UserService
+
+
+class StatisticsService(BaseService):
+    uow: UnitOfWork
+    user_service: UserService
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        uow: UnitOfWork,
+        user_service: UserService,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.uow = uow
+        self.user_service = user_service
+
+    async def get_users_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_users_statistics(datetime_now())
+        statistics["paying_users"] = await self.uow.repository.statistics.count_paying_users()
+        statistics.update(await self.uow.repository.statistics.get_trial_conversion())
+        statistics["active_users_hourly"] = await self.user_service.count_recent_activity(TIME_1H)
+        statistics["active_users_daily"] = await self.user_service.count_recent_activity(TIME_1D)
+        logger.debug(f"Aggregated users statistics: {statistics}")
+        return statistics
+
+    async def get_transactions_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_transactions_statistics()
+        statistics["gateways"] = await self.uow.repository.statistics.get_gateways_statistics(
+            datetime_now()
+        )
+        logger.debug(
+            f"Aggregated transactions statistics for {len(statistics['gateways'])} gateways"
+        )
+        return statistics
+
+    async def get_subscriptions_statistics(self) -> dict[str, Any]:
+        statistics = await self.uow.repository.statistics.get_subscriptions_statistics(
+            datetime_now()
+        )
+        logger.debug(f"Aggregated subscriptions statistics: {statistics}")
+        return statistics
+
+    async def get_plans_subscriptions(self) -> list[dict[str, Any]]:
+        return await self.uow.repository.statistics.get_plans_subscriptions(datetime_now())
+
+    async def get_plans_income(self) -> list[dict[str, Any]]:
+        return await self.uow.repository.statistics.get_plans_income()
+
+    async def get_promocodes_activations(self) -> list[dict[str, Any]]:
+        return await self.uow.repository.statistics.get_promocodes_activations()
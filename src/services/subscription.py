@@ -9,10 +9,17 @@ from remnapy.enums.users import TrafficLimitStrategy
 from sqlalchemy import and_
 
 from src.core.config import AppConfig
-from src.core.constants import TIME_1M, TIME_5M, TIME_10M, TIMEZONE
+from src.core.constants import (
+    IMPORTED_TAG,
+    TIME_1M,
+    TIME_5M,
+    TIME_10M,
+    TIMEZONE,
+)
 from src.core.enums import SubscriptionStatus
-from src.core.storage.key_builder import build_key
+from src.core.utils.formatters import format_limits_to_plan_type
 from src.core.utils.time import datetime_now
+from src.core.utils.types import RemnaUserDto
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import (
     PlanDto,
@@ -21,14 +28,15 @@ from src.infrastructure.database.models.dto import (
     SubscriptionDto,
     UserDto,
 )
+from src.infrastructure.database.models.dto.subscription import BaseSubscriptionDto
 from src.infrastructure.database.models.sql import Subscription
 from src.infrastructure.redis import RedisRepository
-from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis.cache import invalidate_cache, redis_cache
 from src.services.user import UserService
 
 from .base import BaseService
 
-T = TypeVar("T", SubscriptionDto, RemnaSubscriptionDto)
+T = TypeVar("T", bound=Union[BaseSubscriptionDto, RemnaSubscriptionDto])
 
 
 class SubscriptionService(BaseService):
@@ -67,7 +75,7 @@ class SubscriptionService(BaseService):
         logger.info(f"Created subscription '{db_subscription.id}' for user '{user.telegram_id}'")
         return SubscriptionDto.from_model(db_created_subscription)  # type: ignore[return-value]
 
-    @redis_cache(prefix="get_subscription", ttl=TIME_5M)
+    @redis_cache(prefix="get_subscription", ttl=TIME_5M, tags=["subscription:{subscription_id}"])
     async def get(self, subscription_id: int) -> Optional[SubscriptionDto]:
         db_subscription = await self.uow.repository.subscriptions.get(subscription_id)
 
@@ -78,7 +86,7 @@ class SubscriptionService(BaseService):
 
         return SubscriptionDto.from_model(db_subscription)
 
-    @redis_cache(prefix="get_current_subscription", ttl=TIME_1M)
+    @redis_cache(prefix="get_current_subscription", ttl=TIME_1M, tags=["user:{telegram_id}"])
     async def get_current(self, telegram_id: int) -> Optional[SubscriptionDto]:
         db_user = await self.uow.repository.users.get(telegram_id)
 
@@ -142,7 +150,7 @@ class SubscriptionService(BaseService):
 
         return SubscriptionDto.from_model(db_updated_subscription)
 
-    @redis_cache(prefix="has_used_trial", ttl=TIME_10M)
+    @redis_cache(prefix="has_used_trial", ttl=TIME_10M, tags=["user:{user_telegram_id}"])
     async def has_used_trial(self, user_telegram_id: int) -> bool:
         conditions = and_(
             Subscription.user_telegram_id == user_telegram_id,
@@ -154,13 +162,11 @@ class SubscriptionService(BaseService):
         return count > 0
 
     async def clear_subscription_cache(self, subscription_id: int, user_telegram_id: int) -> None:
-        list_cache_keys_to_invalidate = [
-            build_key("cache", "get_subscription", subscription_id),
-            build_key("cache", "get_current_subscription", user_telegram_id),
-            build_key("cache", "has_used_trial", user_telegram_id),
-        ]
-
-        await self.redis_client.delete(*list_cache_keys_to_invalidate)
+        await invalidate_cache(
+            self.redis_client,
+            f"subscription:{subscription_id}",
+            f"user:{user_telegram_id}",
+        )
         logger.debug(f"Cache for subscription '{subscription_id}' invalidated")
 
     @staticmethod
@@ -209,6 +215,44 @@ class SubscriptionService(BaseService):
             (plan for plan in plans if SubscriptionService.plan_match(plan_snapshot, plan)), None
         )
 
+    @staticmethod
+    def build_from_panel(
+        remna_user: RemnaUserDto,
+        remna_subscription: RemnaSubscriptionDto,
+    ) -> SubscriptionDto:
+        temp_plan = PlanSnapshotDto(
+            id=-1,
+            name=IMPORTED_TAG,
+            tag=remna_subscription.tag,
+            type=format_limits_to_plan_type(
+                remna_subscription.traffic_limit,
+                remna_subscription.device_limit,
+            ),
+            traffic_limit=remna_subscription.traffic_limit,
+            device_limit=remna_subscription.device_limit,
+            duration=-1,
+            traffic_limit_strategy=remna_subscription.traffic_limit_strategy,
+            internal_squads=remna_subscription.internal_squads,
+            external_squad=remna_subscription.external_squad,
+        )
+
+        expired = remna_user.expire_at and remna_user.expire_at < datetime_now()
+        status = SubscriptionStatus.EXPIRED if expired else remna_user.status
+
+        return SubscriptionDto(
+            user_remna_id=remna_user.uuid,
+            status=status,
+            traffic_limit=temp_plan.traffic_limit,
+            device_limit=temp_plan.device_limit,
+            traffic_limit_strategy=temp_plan.traffic_limit_strategy,
+            tag=temp_plan.tag,
+            internal_squads=remna_subscription.internal_squads,
+            external_squad=remna_subscription.external_squad,
+            expire_at=remna_user.expire_at,
+            url=remna_subscription.url,
+            plan=temp_plan,
+        )
+
     @staticmethod
     def apply_sync(target: T, source: Union[SubscriptionDto, RemnaSubscriptionDto]) -> T:
         target_fields = set(type(target).model_fields)
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Optional
 from uuid import UUID
 
@@ -7,6 +8,7 @@ from loguru import logger
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
+from src.core.constants import PENDING_TRANSACTION_TIMEOUT
 from src.core.enums import TransactionStatus
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import TransactionDto, UserDto
@@ -83,6 +85,43 @@ class TransactionService(BaseService):
 
         return TransactionDto.from_model(db_updated_transaction)
 
+    async def transition_status(
+        self,
+        payment_id: UUID,
+        status: TransactionStatus,
+        *expected: TransactionStatus,
+    ) -> bool:
+        # Compare-and-set, committed right away so concurrent workers see the new status
+        transitioned = await self.uow.repository.transactions.transition_status(
+            payment_id,
+            status,
+            *expected,
+        )
+        await self.uow.commit()
+
+        if transitioned:
+            logger.info(f"Transaction '{payment_id}' moved to '{status}'")
+        else:
+            logger.debug(
+                f"Transaction '{payment_id}' was not moved to '{status}', "
+                f"status is not one of {[s.value for s in expected]}"
+            )
+
+        return transitioned
+
+    async def cancel_stale(self) -> list[int]:
+        transaction_ids = await self.uow.repository.transactions.cancel_stale(
+            timedelta(seconds=PENDING_TRANSACTION_TIMEOUT)
+        )
+        await self.uow.commit()
+
+        if transaction_ids:
+            logger.info(f"Canceled '{len(transaction_ids)}' stale transactions: {transaction_ids}")
+        else:
+            logger.debug("No stale pending transactions found")
+
+        return transaction_ids
+
     async def count(self) -> int:
         count = await self.uow.repository.transactions.count()
         logger.debug(f"Total transactions count: '{count}'")
@@ -1,4 +1,5 @@
 from typing import Optional, Union
+from uuid import UUID
 
 from aiogram import Bot
 from aiogram.types import Message
@@ -14,10 +15,9 @@ from src.core.constants import (
     REMNASHOP_PREFIX,
     TIME_5M,
     TIME_10M,
+    USER_SEARCH_LIMIT,
 )
 from src.core.enums import Locale, UserRole
-from src.core.storage.key_builder import StorageKey, build_key
-from src.core.storage.keys import RecentActivityUsersKey
 from src.core.utils.formatters import format_user_name
 from src.core.utils.generators import generate_referral_code
 from src.core.utils.types import RemnaUserDto
@@ -25,13 +25,19 @@ from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.database.models.dto.user import BaseUserDto
 from src.infrastructure.database.models.sql import User
-from src.infrastructure.redis import RedisRepository, redis_cache
+from src.infrastructure.redis import (
+    ActivityTracker,
+    RedisRepository,
+    invalidate_cache,
+    redis_cache,
+)
 
 from .base import BaseService
 
 
 class UserService(BaseService):
     uow: UnitOfWork
+    activity_tracker: ActivityTracker
 
     def __init__(
         self,
@@ -42,9 +48,11 @@ class UserService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        activity_tracker: ActivityTracker,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.activity_tracker = activity_tracker
 
     async def create(self, aiogram_user: AiogramUser) -> UserDto:
         user = UserDto(
@@ -71,7 +79,17 @@ class UserService(BaseService):
         return UserDto.from_model(db_created_user)  # type: ignore[return-value]
 
     async def create_from_panel(self, remna_user: RemnaUserDto) -> UserDto:
-        user = UserDto(
+        user = self.build_from_panel(remna_user)
+        db_user = User(**user.model_dump())
+        db_created_user = await self.uow.repository.users.create(db_user)
+        await self.uow.commit()
+
+        await self.clear_user_cache(user.telegram_id)
+        logger.info(f"Created new user '{user.telegram_id}' from panel")
+        return UserDto.from_model(db_created_user)  # type: ignore[return-value]
+
+    def build_from_panel(self, remna_user: RemnaUserDto) -> UserDto:
+        return UserDto(
             telegram_id=remna_user.telegram_id,
             referral_code=generate_referral_code(
                 remna_user.telegram_id,  # type: ignore[arg-type]
@@ -81,15 +99,8 @@ class UserService(BaseService):
             role=UserRole.USER,
             language=self.config.default_locale,
         )
-        db_user = User(**user.model_dump())
-        db_created_user = await self.uow.repository.users.create(db_user)
-        await self.uow.commit()
-
-        await self.clear_user_cache(user.telegram_id)
-        logger.info(f"Created new user '{user.telegram_id}' from panel")
-        return UserDto.from_model(db_created_user)  # type: ignore[return-value]
 
-    @redis_cache(prefix="get_user", ttl=TIME_5M)
+    @redis_cache(prefix="get_user", ttl=TIME_5M, tags=["user:{telegram_id}"])
     async def get(self, telegram_id: int) -> Optional[UserDto]:
         db_user = await self.uow.repository.users.get(telegram_id)
 
@@ -160,13 +171,28 @@ class UserService(BaseService):
 
         if result:
             await self.clear_user_cache(user.telegram_id)
-            await self._remove_from_recent_activity(user.telegram_id)
+            await self.activity_tracker.remove(user.telegram_id)
 
         logger.info(f"Deleted user '{user.telegram_id}': '{result}'")
         return result
 
-    async def get_by_partial_name(self, query: str) -> list[UserDto]:
-        db_users = await self.uow.repository.users.get_by_partial_name(query)
+    async def search(self, query: str, limit: int = USER_SEARCH_LIMIT) -> list[UserDto]:
+        users = self.uow.repository.users
+
+        if _is_ascii_number(query):
+            db_users = await users.search_by_telegram_id_prefix(query, limit)
+        elif query.startswith(REMNASHOP_PREFIX) and _is_ascii_number(
+            query.removeprefix(REMNASHOP_PREFIX)
+        ):
+            db_users = await users.search_by_telegram_id_prefix(
+                query.removeprefix(REMNASHOP_PREFIX),
+                limit,
+            )
+        elif (user_remna_id := _parse_uuid(query)) is not None:
+            db_users = await users.search_by_subscription_uuid(user_remna_id)
+        else:
+            db_users = await users.search_by_text(query, limit)
+
         logger.debug(f"Retrieved '{len(db_users)}' users for query '{query}'")
         return UserDto.from_model_list(db_users)
 
@@ -174,25 +200,25 @@ class UserService(BaseService):
         user = await self.uow.repository.users.get_by_referral_code(referral_code)
         return UserDto.from_model(user)
 
-    @redis_cache(prefix="users_count", ttl=TIME_10M)
+    @redis_cache(prefix="users_count", ttl=TIME_10M, tags=["users"])
     async def count(self) -> int:
         count = await self.uow.repository.users.count()
         logger.debug(f"Total users count: '{count}'")
         return count
 
-    @redis_cache(prefix="get_by_role", ttl=TIME_10M)
+    @redis_cache(prefix="get_by_role", ttl=TIME_10M, tags=["users"])
     async def get_by_role(self, role: UserRole) -> list[UserDto]:
         db_users = await self.uow.repository.users.filter_by_role(role)
         logger.debug(f"Retrieved '{len(db_users)}' users with role '{role}'")
         return UserDto.from_model_list(db_users)
 
-    @redis_cache(prefix="get_blocked_users", ttl=TIME_10M)
+    @redis_cache(prefix="get_blocked_users", ttl=TIME_10M, tags=["users"])
     async def get_blocked_users(self) -> list[UserDto]:
         db_users = await self.uow.repository.users.filter_by_blocked(blocked=True)
         logger.debug(f"Retrieved '{len(db_users)}' blocked users")
         return UserDto.from_model_list(list(reversed(db_users)))
 
-    @redis_cache(prefix="get_all", ttl=TIME_10M)
+    @redis_cache(prefix="get_all", ttl=TIME_10M, tags=["users"])
     async def get_all(self) -> list[UserDto]:
         db_users = await self.uow.repository.users.get_all()
         logger.debug(f"Retrieved '{len(db_users)}' users")
@@ -202,6 +228,7 @@ class UserService(BaseService):
         user.is_blocked = blocked
         await self.uow.repository.users.update(
             user.telegram_id,
+            load_result=False,
             **user.prepare_changed_data(),
         )
         await self.clear_user_cache(user.telegram_id)
@@ -211,6 +238,7 @@ class UserService(BaseService):
         user.is_bot_blocked = blocked
         await self.uow.repository.users.update(
             user.telegram_id,
+            load_result=False,
             **user.prepare_changed_data(),
         )
         await self.clear_user_cache(user.telegram_id)
@@ -220,6 +248,7 @@ class UserService(BaseService):
         user.role = role
         await self.uow.repository.users.update(
             user.telegram_id,
+            load_result=False,
             **user.prepare_changed_data(),
         )
         await self.clear_user_cache(user.telegram_id)
@@ -228,7 +257,7 @@ class UserService(BaseService):
     #
 
     async def update_recent_activity(self, telegram_id: int) -> None:
-        await self._add_to_recent_activity(RecentActivityUsersKey(), telegram_id)
+        await self.activity_tracker.touch(telegram_id)
 
     async def get_recent_registered_users(self) -> list[UserDto]:
         db_users = await self.uow.repository.users._get_many(
@@ -241,14 +270,18 @@ class UserService(BaseService):
         return UserDto.from_model_list(list(reversed(db_users)))
 
     async def get_recent_activity_users(self, excluded_ids: list[int] = []) -> list[UserDto]:
-        telegram_ids = await self._get_recent_activity()
+        telegram_ids = await self.activity_tracker.get_recent(
+            limit=RECENT_ACTIVITY_MAX_COUNT + len(excluded_ids)
+        )
+        telegram_ids = [tid for tid in telegram_ids if tid not in excluded_ids]
+        telegram_ids = telegram_ids[:RECENT_ACTIVITY_MAX_COUNT]
+
+        db_users = await self.uow.repository.users.get_by_ids(telegram_ids)
+        users_by_id = {user.telegram_id: user for user in UserDto.from_model_list(db_users)}
         users: list[UserDto] = []
 
         for telegram_id in telegram_ids:
-            if telegram_id in excluded_ids:
-                continue
-
-            user = await self.get(telegram_id)
+            user = users_by_id.get(telegram_id)
 
             if user:
                 users.append(user)
@@ -256,11 +289,16 @@ class UserService(BaseService):
                 logger.warning(
                     f"User '{telegram_id}' not found in DB, removing from recent activity cache"
                 )
-                await self._remove_from_recent_activity(telegram_id)
+                await self.activity_tracker.remove(telegram_id)
 
         logger.debug(f"Retrieved '{len(users)}' recent active users")
         return users
 
+    async def count_recent_activity(self, period: int) -> int:
+        count = await self.activity_tracker.count_active(period)
+        logger.debug(f"Counted '{count}' users active in the last '{period}' seconds")
+        return count
+
     async def search_users(self, message: Message) -> list[UserDto]:
         found_users = []
 
@@ -280,42 +318,15 @@ class UserService(BaseService):
             search_query = message.text.strip()
             logger.debug(f"Searching users by query '{search_query}'")
 
-            if search_query.isdigit():
-                target_telegram_id = int(search_query)
-                single_user = await self.get(telegram_id=target_telegram_id)
-
-                if single_user:
-                    found_users.append(single_user)
-                    logger.info(f"Searched by Telegram ID '{target_telegram_id}', user found")
-                else:
-                    logger.warning(
-                        f"Searched by Telegram ID '{target_telegram_id}', user not found"
-                    )
-
-            elif search_query.startswith(REMNASHOP_PREFIX):  # TODO: any username from panel
-                try:
-                    target_id = int(search_query.split("_", maxsplit=1)[1])
-                    single_user = await self.get(telegram_id=target_id)
-                    if single_user:
-                        found_users.append(single_user)
-                        logger.info(f"Searched by Remnashop ID '{target_id}', user found")
-                    else:
-                        logger.warning(f"Searched by Remnashop ID '{target_id}', user not found")
-                except (IndexError, ValueError):
-                    logger.warning(f"Failed to parse Remnashop ID from query '{search_query}'")
-
-            else:
-                found_users = await self.get_by_partial_name(query=search_query)
-                logger.info(
-                    f"Searched users by partial name '{search_query}', "
-                    f"found '{len(found_users)}' users"
-                )
+            found_users = await self.search(search_query)
+            logger.info(f"Searched users by '{search_query}', found '{len(found_users)}' users")
 
         return found_users
 
     async def set_current_subscription(self, telegram_id: int, subscription_id: int) -> None:
         await self.uow.repository.users.update(
             telegram_id=telegram_id,
+            load_result=False,
             current_subscription_id=subscription_id,
         )
         await self.clear_user_cache(telegram_id)
@@ -324,6 +335,7 @@ class UserService(BaseService):
     async def delete_current_subscription(self, telegram_id: int) -> None:
         await self.uow.repository.users.update(
             telegram_id=telegram_id,
+            load_result=False,
             current_subscription_id=None,
         )
         await self.clear_user_cache(telegram_id)
@@ -332,6 +344,7 @@ class UserService(BaseService):
     async def add_points(self, user: Union[BaseUserDto, UserDto], points: int) -> None:
         await self.uow.repository.users.update(
             telegram_id=user.telegram_id,
+            load_result=False,
             points=user.points + points,
         )
         await self.clear_user_cache(user.telegram_id)
@@ -340,44 +353,17 @@ class UserService(BaseService):
     #
 
     async def clear_user_cache(self, telegram_id: int) -> None:
-        user_cache_key: str = build_key("cache", "get_user", telegram_id)
-        await self.redis_client.delete(user_cache_key)
-        await self._clear_list_caches()
+        await invalidate_cache(self.redis_client, f"user:{telegram_id}", "users")
         logger.debug(f"User cache for '{telegram_id}' invalidated")
 
-    async def _clear_list_caches(self) -> None:
-        list_cache_keys_to_invalidate = [
-            build_key("cache", "get_blocked_users"),
-            build_key("cache", "count"),
-        ]
-
-        for role in UserRole:
-            key = build_key("cache", "get_by_role", role=role)
-            list_cache_keys_to_invalidate.append(key)
-
-        await self.redis_client.delete(*list_cache_keys_to_invalidate)
-        logger.debug("List caches invalidated")
-
-    async def _add_to_recent_activity(self, key: StorageKey, telegram_id: int) -> None:
-        await self.redis_repository.list_remove(key, value=telegram_id, count=0)
-        await self.redis_repository.list_push(key, telegram_id)
-        await self.redis_repository.list_trim(key, start=0, end=RECENT_ACTIVITY_MAX_COUNT - 1)
-        logger.debug(f"User '{telegram_id}' activity updated in recent cache")
-
-    async def _remove_from_recent_activity(self, telegram_id: int) -> None:
-        await self.redis_repository.list_remove(
-            key=RecentActivityUsersKey(),
-            value=telegram_id,
-            count=0,
-        )
-        logger.debug(f"User '{telegram_id}' removed from recent activity cache")
 
-    async def _get_recent_activity(self) -> list[int]:
-        telegram_ids_str = await self.redis_repository.list_range(
-            key=RecentActivityUsersKey(),
-            start=0,
-            end=RECENT_ACTIVITY_MAX_COUNT - 1,
-        )
-        ids = [int(uid) for uid in telegram_ids_str]
-        logger.debug(f"Retrieved '{len(ids)}' recent activity user IDs from cache")
-        return ids
+def _is_ascii_number(value: str) -> bool:
+    # str.isdigit() also accepts characters like '²' that int() rejects
+    return value.isascii() and value.isdecimal()
+
+
+def _parse_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(value)
+    except ValueError:
+        return None